@@ -0,0 +1,4 @@
+"""Performance benchmarks for Rock-Paper-Scissors-Lizard-Spock.
+
+Run them from the repository root with ``python -m benchmarks``.
+"""
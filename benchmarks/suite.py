@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/benchmarks/suite.py
+"""Benchmark suite for Rock-Paper-Scissors-Lizard-Spock.
+
+Measures round resolution, rendering, computer move generation, module
+import time and whole scripted sessions, and prints the results as JSON so
+that runs can be stored and compared over time:
+
+    python -m benchmarks                      # all benchmarks, JSON to stdout
+    python -m benchmarks -o bench.json        # ... or to a file
+    python -m benchmarks -k resolve --quick   # a subset, fewer repeats
+
+Every benchmark is a function taking a number of operations ``n`` and
+performing them; the harness picks ``n`` so that one run takes a fraction
+of a second, repeats the run and reports per-operation timings.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import events
+import evolution
+import rockPaperScissorsLizardSpock as game
+import ratings
+import rules
+import simulation
+import solver
+import strategies
+from timing import Clock
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+# Registered benchmarks by name, see benchmark().
+BENCHMARKS = {}
+
+_PAIRS = [(user, computer) for user in game.Action for computer in game.Action]
+_RPS101 = rules.load_ruleset("rps101")
+
+
+def benchmark(name):
+    """Decorator registering a benchmark function under ``name``."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+@benchmark("resolve.victories_scan")
+def bench_resolve_victories_scan(n):
+    """The original resolution: a dict lookup and a list scan per round."""
+    victories = game.victories
+    pairs = _PAIRS * (n // len(_PAIRS) + 1)
+    for user, computer in pairs[:n]:
+        if user == computer:
+            pass
+        elif computer in victories[user]:
+            pass
+
+
+@benchmark("resolve.table")
+def bench_resolve_table(n):
+    resolve = game.resolve
+    pairs = _PAIRS * (n // len(_PAIRS) + 1)
+    for user, computer in pairs[:n]:
+        resolve(user, computer)
+
+
+@benchmark("resolve.rules_rps101")
+def bench_resolve_rules_rps101(n):
+    """One round of the 101-move variant, to compare with resolve.table."""
+    resolve = _RPS101.resolve
+    pairs = [(user, (user * 37) % 101) for user in range(101)]
+    pairs = pairs * (n // len(pairs) + 1)
+    for user, computer in pairs[:n]:
+        resolve(user, computer)
+
+
+@benchmark("resolve.simulate_uniform")
+def bench_simulate_uniform(n):
+    simulation.simulate(n, strategies.UniformStrategy(), strategies.UniformStrategy(), seed=1)
+
+
+@benchmark("render.determine_winner")
+def bench_determine_winner(n):
+    """Full determineWinner() output for every pairing, stdout redirected."""
+    clock = Clock(speed=float("inf"))
+    pairs = _PAIRS * (n // len(_PAIRS) + 1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for user, computer in pairs[:n]:
+            game.determineWinner(user, computer, clock)
+
+
+@benchmark("rng.get_computer_selection")
+def bench_get_computer_selection(n):
+    selection = game.getComputerSelection
+    for _ in range(n):
+        selection()
+
+
+@benchmark("rng.move_generator")
+def bench_move_generator(n):
+    """The batched generator behind UniformStrategy, one move at a time."""
+    move = strategies.MoveGenerator(seed=1).move
+    for _ in range(n):
+        move()
+
+
+@benchmark("solve.nash_rps101")
+def bench_nash_rps101(n):
+    """Exact Nash equilibrium of RPS-101 by the simplex."""
+    matrix = solver.payoff_matrix(_RPS101)
+    for _ in range(n):
+        solver.nash_equilibrium(matrix)
+
+
+@benchmark("evolve.play_match")
+def bench_play_match(n):
+    """Matches of 1000 rounds between random memory-2 lookup-table genomes."""
+    population = evolution.random_population(2 * n, 2, random.Random(1))
+    size = evolution.table_size(2)
+    for start in range(0, len(population), 2 * size):
+        evolution.play_match(population[start:start + size], population[start + size:start + 2 * size], 1000)
+
+
+@benchmark("events.dashboard")
+def bench_dashboard(n):
+    """Every dashboard aggregate consuming ``n`` rounds in blocks of 64 Ki, as the simulator publishes them."""
+    rng = random.Random(1)
+    pairs = bytes(rng.randrange(events.PAIR_COUNT) for _ in range(min(n, 1 << 16)))
+    dashboard = events.Dashboard()
+    simulation.numpy_or_none()
+    start = time.perf_counter()
+    for offset in range(0, n, len(pairs)):
+        dashboard.consume(pairs[:n - offset])
+    return time.perf_counter() - start
+
+
+@benchmark("ratings.glicko2_batch")
+def bench_glicko2_batch(n):
+    """Glicko-2 recomputation of ``n`` games between 1000 players, in periods of 1000 games."""
+    rng = random.Random(1)
+    table = ratings.RatingTable()
+    rows = [table.row(player) for player in range(1000)]
+    firsts, seconds = zip(*(rng.sample(rows, 2) for _ in range(n)))
+    outcomes = [rng.randrange(3) for _ in range(n)]
+    simulation.numpy_or_none()
+    start = time.perf_counter()
+    table.recompute(firsts, seconds, outcomes)
+    return time.perf_counter() - start
+
+
+def _import_time(module, n):
+    """Imports ``module`` in ``n`` fresh interpreters, timing only the import."""
+    code = ("import time; start = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - start)")
+    total = 0.0
+    for _ in range(n):
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPOSITORY,
+                                capture_output=True, text=True, check=True)
+        total += float(result.stdout)
+    return total
+
+
+@benchmark("import.rockPaperScissorsLizardSpock")
+def bench_import_game(n):
+    return _import_time("rockPaperScissorsLizardSpock", n)
+
+
+@benchmark("import.ascii_images")
+def bench_import_ascii_images(n):
+    return _import_time("ascii_images", n)
+
+
+@benchmark("import.simulation")
+def bench_import_simulation(n):
+    return _import_time("simulation", n)
+
+
+@benchmark("session.scripted_rounds")
+def bench_scripted_session(n):
+    """main() playing ``n`` scripted rounds at full speed, stdout redirected."""
+    rng = random.Random(1)
+    answers = []
+    for _ in range(n):
+        answers += [str(rng.randrange(len(game.Action))), "y"]
+    answers[-1] = "n"
+    replies = iter(answers)
+    original = builtins.input
+    builtins.input = lambda _prompt="": next(replies)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.main(clock=Clock(speed=float("inf")))
+    finally:
+        builtins.input = original
+
+
+def measure(function, repeat=5, target=0.2, max_n=10_000_000):
+    """Times ``function`` and returns per-operation statistics.
+
+    The number of operations per run is doubled until a run takes at least
+    ``target`` seconds. A benchmark may return its own elapsed time, which
+    is used instead of the wall time of the call (see _import_time()).
+
+    Returns:
+        dict: Operations per run, best and median seconds per operation and
+            the best operations per second.
+    """
+    def timed(n):
+        start = time.perf_counter()
+        elapsed = function(n)
+        return elapsed if elapsed is not None else time.perf_counter() - start
+
+    n = 1
+    while timed(n) < target and n < max_n:
+        n *= 2
+    runs = [timed(n) / n for _ in range(repeat)]
+    best = min(runs)
+    return {
+        "ops_per_run": n,
+        "repeat": repeat,
+        "best_seconds_per_op": best,
+        "median_seconds_per_op": statistics.median(runs),
+        "ops_per_second": 1 / best if best > 0 else None,
+    }
+
+
+def run_suite(pattern="", repeat=5, target=0.2):
+    """Runs the benchmarks whose name contains ``pattern``.
+
+    Returns:
+        dict: Environment metadata and one result per benchmark.
+    """
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if pattern in name:
+            # Imports spawn interpreters, so they get far fewer runs.
+            limit = 20 if name.startswith("import.") else 10_000_000
+            results[name] = measure(function, repeat=repeat, target=target, max_n=limit)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    """Command-line entry point of ``python -m benchmarks``."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--quick", action="store_true", help="fewer and shorter runs")
+    parser.add_argument("--list", action="store_true", help="list the benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+    report = run_suite(args.filter, repeat=3 if args.quick else 5, target=0.05 if args.quick else 0.2)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        for name, result in report["results"].items():
+            print(f"{name:<40}{result['best_seconds_per_op'] * 1e6:>14.3f} us/op", file=sys.stderr)
+    else:
+        print(text)
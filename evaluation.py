@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/evaluation.py
+"""Sequential evaluation of one computer strategy against another.
+
+``rpsls evaluate -a markov -b uniform`` answers "does A beat B?" without a
+fixed billion-round simulation. The strategies play one long match in
+growing chunks, and after every chunk a sequential probability ratio test
+(SPRT) on the decisive rounds looks at the evidence so far:
+
+* H0: A wins half of the decisive rounds (``p = 0.5``), no edge;
+* H1: A wins ``p = 0.5 + delta`` of them.
+
+The test stops as soon as the log-likelihood ratio crosses a bound set by
+the error rates ``alpha`` (accepting H1 when H0 holds) and ``beta``
+(accepting H0 when H1 holds), which usually takes thousands rather than
+billions of rounds. A strategy that is worse than B accepts H0 as well.
+Whatever the decision, the report carries confidence intervals for the
+win rate (Wilson score) and for the net edge per round.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import math
+import random
+import time
+from collections import namedtuple
+from statistics import NormalDist
+
+from simulation import Tally, play
+from strategies import make_strategy
+
+# The first chunk; each later one is twice as large, up to MAX_CHUNK_SIZE.
+FIRST_CHUNK_SIZE = 1_000
+MAX_CHUNK_SIZE = 1 << 20
+
+Evaluation = namedtuple("Evaluation", ["decision", "rounds", "tally", "llr", "lower_bound", "upper_bound",
+                                       "win_rate", "win_rate_interval", "edge", "edge_interval"])
+Evaluation.__doc__ = """Outcome of evaluate().
+
+decision is "H1" (A beats B by at least delta), "H0" (it does not) or
+"inconclusive" when max_rounds ran out first. win_rate is A's share of
+the decisive rounds and edge its mean score per round (+1 win, -1 loss).
+"""
+
+
+def sprt_bounds(alpha=0.05, beta=0.05):
+    """Returns Wald's lower and upper bounds for the log-likelihood ratio."""
+    return math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+
+
+def log_likelihood_ratio(wins, losses, p0=0.5, p1=0.51):
+    """Log-likelihood ratio of H1 (``p1``) over H0 (``p0``) given decisive rounds."""
+    return wins * math.log(p1 / p0) + losses * math.log((1 - p1) / (1 - p0))
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """Wilson score interval of a binomial proportion.
+
+    Returns:
+        tuple: The lower and upper bounds; ``(0.0, 1.0)`` without trials.
+    """
+    if not trials:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    share = successes / trials
+    centre = (share + z * z / (2 * trials)) / (1 + z * z / trials)
+    spread = z / (1 + z * z / trials) * math.sqrt(share * (1 - share) / trials + z * z / (4 * trials * trials))
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+def edge_interval(tally, confidence=0.95):
+    """Normal confidence interval of the mean score per round.
+
+    Returns:
+        tuple: The mean edge and its ``(lower, upper)`` bounds.
+    """
+    rounds = sum(tally)
+    if not rounds:
+        return 0.0, (-1.0, 1.0)
+    mean = (tally.wins - tally.losses) / rounds
+    variance = (tally.wins + tally.losses) / rounds - mean * mean
+    margin = NormalDist().inv_cdf((1 + confidence) / 2) * math.sqrt(variance / rounds)
+    return mean, (mean - margin, mean + margin)
+
+
+def evaluate(strategy_a, strategy_b, delta=0.01, alpha=0.05, beta=0.05, max_rounds=100_000_000,
+             confidence=0.95, seed=None):
+    """Plays two strategies until the SPRT decides whether A beats B.
+
+    Args:
+        strategy_a (Strategy): The strategy under test.
+        strategy_b (Strategy): The baseline, typically uniform.
+        delta (float): Smallest edge in decisive win rate worth detecting.
+        alpha (float): Accepted risk of calling an edge that is not there.
+        beta (float): Accepted risk of missing an edge of ``delta``.
+        max_rounds (int): Rounds after which the test gives up.
+        confidence (float): Level of the reported confidence intervals.
+        seed (int): Seed for both strategies; ``None`` for a random seed.
+
+    Returns:
+        Evaluation: The decision, the evidence and confidence intervals.
+
+    Raises:
+        ValueError: On parameters outside their ranges.
+    """
+    if not 0 < delta < 0.5:
+        raise ValueError("delta must be between 0 and 0.5")
+    if not (0 < alpha < 1 and 0 < beta < 1):
+        raise ValueError("alpha and beta must be between 0 and 1")
+    rng = random.Random(seed)
+    strategy_a.reset(rng.getrandbits(64))
+    strategy_b.reset(rng.getrandbits(64))
+    p1 = 0.5 + delta
+    lower, upper = sprt_bounds(alpha, beta)
+
+    wins = losses = ties = 0
+    llr = 0.0
+    decision = "inconclusive"
+    chunk = FIRST_CHUNK_SIZE
+    while wins + losses + ties < max_rounds:
+        n = min(chunk, max_rounds - wins - losses - ties)
+        tally = play(n, strategy_a, strategy_b)
+        wins += tally.wins
+        losses += tally.losses
+        ties += tally.ties
+        llr = log_likelihood_ratio(wins, losses, 0.5, p1)
+        if llr >= upper:
+            decision = "H1"
+            break
+        if llr <= lower:
+            decision = "H0"
+            break
+        chunk = min(2 * chunk, MAX_CHUNK_SIZE)
+
+    tally = Tally(wins, losses, ties)
+    decisive = wins + losses
+    edge, interval = edge_interval(tally, confidence)
+    return Evaluation(decision, sum(tally), tally, llr, lower, upper,
+                      wins / decisive if decisive else 0.5, wilson_interval(wins, decisive, confidence),
+                      edge, interval)
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls evaluate`` options to an argument parser."""
+    parser.add_argument("-a", "--strategy-a", default="markov", help="strategy under test (default: markov)")
+    parser.add_argument("-b", "--strategy-b", default="uniform", help="baseline strategy (default: uniform)")
+    parser.add_argument("--delta", type=float, default=0.01,
+                        help="smallest edge in decisive win rate worth detecting (default: 0.01)")
+    parser.add_argument("--alpha", type=float, default=0.05, help="false positive rate (default: 0.05)")
+    parser.add_argument("--beta", type=float, default=0.05, help="false negative rate (default: 0.05)")
+    parser.add_argument("--max-rounds", type=int, default=100_000_000,
+                        help="give up after this many rounds (default: 100,000,000)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="level of the confidence intervals (default: 0.95)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible runs")
+
+
+def run(args):
+    """Runs ``rpsls evaluate`` and prints the verdict."""
+    strategy_a = make_strategy(args.strategy_a)
+    strategy_b = make_strategy(args.strategy_b)
+    start = time.perf_counter()
+    result = evaluate(strategy_a, strategy_b, args.delta, args.alpha, args.beta, args.max_rounds,
+                      args.confidence, args.seed)
+    elapsed = time.perf_counter() - start
+    verdicts = {
+        "H1": f"✅ {strategy_a.name} beats {strategy_b.name} by at least {args.delta:.1%}",
+        "H0": f"❌ {strategy_a.name} does not beat {strategy_b.name} by {args.delta:.1%}",
+        "inconclusive": f"🤷 No decision after {result.rounds:,} rounds",
+    }
+    low, high = result.win_rate_interval
+    print(f"\n{'═' * 70}")
+    print(f"🔬 {strategy_a.name} vs {strategy_b.name}: {result.rounds:,} rounds in {elapsed:.3f}s")
+    print(f"{'═' * 70}")
+    print(verdicts[result.decision])
+    print(f"📊 SCORE: Wins: {result.tally.wins} | Losses: {result.tally.losses} | Ties: {result.tally.ties}")
+    print(f"🎯 Win rate of decisive rounds: {result.win_rate:.2%} "
+          f"({args.confidence:.0%} CI {low:.2%} to {high:.2%})")
+    print(f"⚖️  Edge per round: {result.edge:+.4f} "
+          f"({args.confidence:.0%} CI {result.edge_interval[0]:+.4f} to {result.edge_interval[1]:+.4f})")
+    print(f"📈 LLR {result.llr:.2f} (bounds {result.lower_bound:.2f}, {result.upper_bound:.2f})")
+    print(f"{'─' * 70}\n")
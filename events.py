@@ -0,0 +1,594 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/events.py
+"""Round events and streaming aggregators for live dashboards.
+
+An EventBus hands every resolved round to its subscribers. A round travels
+as one byte, its pair code ``user * 5 + computer``, from which the outcome
+and the explanation follow through the game's rules tables (see
+RoundEvent and decode()). Rounds are delivered in blocks: the batch
+simulator publishes whole blocks of pair codes, and rounds published one
+at a time are buffered until ``batch_size`` of them have piled up, so a
+subscriber's cost per call is shared by many rounds and can be paid in C
+or NumPy.
+
+The aggregators keep bounded memory however many rounds go by:
+
+* SlidingWindow: moves, outcomes and win rate per Action over the last
+  ``size`` rounds, kept as counts of the 25 pair codes plus a ring of the
+  codes in the window.
+* Streaks: the current run of equal outcomes and the longest ones.
+* LatencySketch: approximate latency quantiles with a fixed relative
+  error, in logarithmic buckets (as in DDSketch).
+* TopSequences: the most common move sequences of the user, counted in a
+  count-min sketch, with a short list of heavy-hitter candidates.
+
+``rpsls simulate --dashboard`` subscribes a Dashboard of all four to the
+simulator and prints it after the run.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import heapq
+import math
+import random
+from array import array
+from collections import Counter, namedtuple
+
+from rockPaperScissorsLizardSpock import ACTION_COUNT, EXPLANATION_TABLE, OUTCOME_TABLE, Action, Outcome
+from simulation import OUTCOME_TRANSLATION, numpy_or_none
+
+PAIR_COUNT = ACTION_COUNT * ACTION_COUNT
+
+RoundEvent = namedtuple("RoundEvent", ["user", "computer", "outcome", "explanation"])
+RoundEvent.__doc__ = "One resolved round: both Actions, the Outcome for the user and its explanation."
+
+# Translation table from a pair code to the user's move; simulation's
+# OUTCOME_TRANSLATION maps a pair code to its outcome.
+_USER_BY_PAIR = bytes(code // ACTION_COUNT if code < PAIR_COUNT else 0 for code in range(256))
+_PAIR_BYTES = tuple(bytes([code]) for code in range(PAIR_COUNT))
+_OUTCOME_BYTES = tuple(bytes([outcome]) for outcome in Outcome)
+
+# Multiply-shift hashing of the count-min sketch works modulo 2**64.
+_MASK64 = (1 << 64) - 1
+
+# Sequences of a block ranked for the top k when they are too many to count exactly.
+_SAMPLE_SIZE = 1 << 14
+
+
+def decode(pairs):
+    """Yields a RoundEvent per pair code, for subscribers that want rounds one by one."""
+    for code in pairs:
+        user, computer = divmod(code, ACTION_COUNT)
+        yield RoundEvent(Action(user), Action(computer), Outcome(OUTCOME_TABLE[code]), EXPLANATION_TABLE[code])
+
+
+def count_pairs(pairs):
+    """Counts every pair code in a block.
+
+    Returns:
+        list[int]: PAIR_COUNT counts, indexed by pair code.
+    """
+    numpy = numpy_or_none()
+    if numpy is not None and len(pairs) > 1024:
+        return numpy.bincount(numpy.frombuffer(pairs, dtype=numpy.uint8), minlength=PAIR_COUNT).tolist()
+    return [pairs.count(code) for code in _PAIR_BYTES]
+
+
+class EventBus:
+    """Publishes resolved rounds to subscribers, block by block.
+
+    A subscriber is any object with a ``consume(pairs, latencies)`` method,
+    called with the pair codes of a block as bytes and the latencies, in
+    seconds, of those rounds that came with one (an ``array("d")``, or
+    None).
+
+    Args:
+        batch_size (int): Rounds buffered by publish() before they are
+            delivered.
+    """
+
+    def __init__(self, batch_size=8192):
+        self.batch_size = batch_size
+        self.subscribers = []
+        self.published = 0
+        self._pairs = bytearray()
+        self._latencies = array("d")
+
+    def subscribe(self, subscriber):
+        """Adds a subscriber and returns it."""
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Removes a subscriber, after handing it the buffered rounds."""
+        self.flush()
+        self.subscribers.remove(subscriber)
+
+    def publish(self, user, computer, latency=None):
+        """Publishes one round.
+
+        Args:
+            user (int): The user's Action.
+            computer (int): The computer's Action.
+            latency (float): Optional time the round took, in seconds.
+        """
+        self._pairs.append(user * ACTION_COUNT + computer)
+        if latency is not None:
+            self._latencies.append(latency)
+        if len(self._pairs) >= self.batch_size:
+            self.flush()
+
+    def publish_block(self, pairs, latencies=None):
+        """Publishes a block of pair codes right away, after any buffered rounds."""
+        self.flush()
+        self._deliver(bytes(pairs), latencies)
+
+    def flush(self):
+        """Delivers the buffered rounds."""
+        if self._pairs:
+            pairs, latencies = bytes(self._pairs), self._latencies
+            self._pairs.clear()
+            self._latencies = array("d")
+            self._deliver(pairs, latencies or None)
+
+    def _deliver(self, pairs, latencies):
+        self.published += len(pairs)
+        for subscriber in self.subscribers:
+            subscriber.consume(pairs, latencies)
+
+
+class SlidingWindow:
+    """Counts of the last ``size`` rounds.
+
+    Args:
+        size (int): Rounds in the window.
+    """
+
+    def __init__(self, size=10_000):
+        if size < 1:
+            raise ValueError("the window holds at least one round")
+        self.size = size
+        self.counts = [0] * PAIR_COUNT
+        self._ring = bytearray(size)
+        self._end = 0  # Where the next round goes in the ring.
+        self._filled = 0
+
+    def __len__(self):
+        return self._filled
+
+    def consume(self, pairs, latencies=None):
+        if len(pairs) >= self.size:
+            pairs = pairs[-self.size:]
+            self.counts = count_pairs(pairs)
+            self._ring[:] = pairs
+            self._end = 0
+            self._filled = self.size
+            return
+        stop = self._end + len(pairs)
+        if self._filled < self.size:  # Still filling up from the start: only a wrap evicts.
+            evicted = bytes(self._ring[:max(0, stop - self.size)])
+        elif stop <= self.size:
+            evicted = bytes(self._ring[self._end:stop])
+        else:
+            evicted = bytes(self._ring[self._end:]) + bytes(self._ring[:stop - self.size])
+        if evicted:
+            self.counts = [count - gone for count, gone in zip(self.counts, count_pairs(evicted))]
+        self.counts = [count + new for count, new in zip(self.counts, count_pairs(pairs))]
+        if stop <= self.size:
+            self._ring[self._end:stop] = pairs
+        else:
+            split = self.size - self._end
+            self._ring[self._end:] = pairs[:split]
+            self._ring[:stop - self.size] = pairs[split:]
+        self._end = stop % self.size
+        self._filled = min(self.size, self._filled + len(pairs))
+
+    def move_counts(self, side=0):
+        """Returns how often each Action was played in the window.
+
+        Args:
+            side (int): 0 for the user's moves, 1 for the computer's.
+        """
+        moves = [0] * ACTION_COUNT
+        for code, count in enumerate(self.counts):
+            moves[divmod(code, ACTION_COUNT)[side]] += count
+        return moves
+
+    def outcome_counts(self):
+        """Returns the count of every Outcome in the window, for the user."""
+        outcomes = [0] * len(Outcome)
+        for code, count in enumerate(self.counts):
+            outcomes[OUTCOME_TABLE[code]] += count
+        return outcomes
+
+    def win_rates(self):
+        """Returns the user's win rate with each Action; None for unplayed ones."""
+        wins = [0] * ACTION_COUNT
+        for code, count in enumerate(self.counts):
+            if OUTCOME_TABLE[code] == Outcome.Win:
+                wins[code // ACTION_COUNT] += count
+        return [won / played if played else None for won, played in zip(wins, self.move_counts())]
+
+    def snapshot(self):
+        """Returns the window as plain JSON-ready data."""
+        return {
+            "rounds": self._filled,
+            "user_moves": dict(zip((action.name for action in Action), self.move_counts(0))),
+            "computer_moves": dict(zip((action.name for action in Action), self.move_counts(1))),
+            "outcomes": dict(zip((outcome.name for outcome in Outcome), self.outcome_counts())),
+            "win_rates": dict(zip((action.name for action in Action), self.win_rates())),
+        }
+
+
+def _longest_run(data, byte, at_least):
+    """Length of the longest run of ``byte`` in ``data`` if longer than ``at_least``, else ``at_least``.
+
+    Substring searches run in C, and doubling then bisecting needs only a
+    logarithmic number of them.
+    """
+    if byte * (at_least + 1) not in data:
+        return at_least
+    low, high = at_least + 1, 2 * (at_least + 1)
+    while high <= len(data) and byte * high in data:
+        low, high = high, 2 * high
+    high = min(high, len(data) + 1)
+    while high - low > 1:  # low is a run that exists, high one that does not.
+        middle = (low + high) // 2
+        if byte * middle in data:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+class Streaks:
+    """The current run of equal outcomes and the longest run of each Outcome."""
+
+    def __init__(self):
+        self.current = None  # Outcome of the current run.
+        self.length = 0
+        self.longest = [0] * len(Outcome)
+
+    def consume(self, pairs, latencies=None):
+        if not pairs:
+            return
+        outcomes = pairs.translate(OUTCOME_TRANSLATION)
+        first = outcomes[0]
+        if first == self.current:  # The block continues the current run.
+            head = len(outcomes) - len(outcomes.lstrip(_OUTCOME_BYTES[first]))
+            self.longest[first] = max(self.longest[first], self.length + head)
+        for outcome, byte in enumerate(_OUTCOME_BYTES):
+            self.longest[outcome] = _longest_run(outcomes, byte, self.longest[outcome])
+        last = outcomes[-1]
+        tail = len(outcomes) - len(outcomes.rstrip(_OUTCOME_BYTES[last]))
+        self.length = self.length + tail if tail == len(outcomes) and last == self.current else tail
+        self.current = Outcome(last)
+        self.longest[last] = max(self.longest[last], self.length)
+
+    def snapshot(self):
+        """Returns the streaks as plain JSON-ready data."""
+        return {
+            "current": None if self.current is None else self.current.name,
+            "length": self.length,
+            "longest": dict(zip((outcome.name for outcome in Outcome), self.longest)),
+        }
+
+
+class LatencySketch:
+    """Approximate quantiles of latencies, with a bounded number of buckets.
+
+    A latency ``x`` goes into bucket ``ceil(log(x) / log(gamma))`` with
+    ``gamma = (1 + a) / (1 - a)``, so every quantile comes back within a
+    relative error ``a`` of a latency that was recorded. When there would
+    be more than ``max_buckets`` buckets, the lowest ones are merged, which
+    only costs accuracy at the fast end.
+
+    Args:
+        relative_accuracy (float): The relative error ``a``.
+        max_buckets (int): Upper bound of the memory used.
+        minimum (float): Latencies up to this many seconds count as zero.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048, minimum=1e-9):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.minimum = minimum
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def consume(self, pairs, latencies=None):
+        if latencies:
+            self.add(latencies)
+
+    def add(self, latencies):
+        """Records a sequence of latencies, in seconds."""
+        numpy = numpy_or_none()
+        buckets = self.buckets
+        if numpy is not None and len(latencies) > 64:
+            values = numpy.asarray(latencies, dtype=float)
+            self.count += len(values)
+            self.total += float(values.sum())
+            self.maximum = max(self.maximum, float(values.max()))
+            positive = values[values > self.minimum]
+            self.zeros += len(values) - len(positive)
+            if len(positive):
+                keys = numpy.ceil(numpy.log(positive) / self._log_gamma).astype(numpy.int64)
+                low = int(keys.min())
+                counts = numpy.bincount(keys - low)
+                for offset in numpy.flatnonzero(counts).tolist():
+                    buckets[low + offset] = buckets.get(low + offset, 0) + int(counts[offset])
+        else:
+            log, log_gamma, minimum = math.log, self._log_gamma, self.minimum
+            for value in latencies:
+                self.count += 1
+                self.total += value
+                if value > self.maximum:
+                    self.maximum = value
+                if value <= minimum:
+                    self.zeros += 1
+                else:
+                    key = math.ceil(log(value) / log_gamma)
+                    buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            keys = sorted(buckets)
+            merged = sum(buckets.pop(key) for key in keys[:len(keys) - self.max_buckets + 1])
+            lowest = keys[len(keys) - self.max_buckets]
+            buckets[lowest] = buckets.get(lowest, 0) + merged
+
+    def quantile(self, fraction):
+        """Estimates a quantile.
+
+        Args:
+            fraction (float): The quantile, 0.5 for the median.
+
+        Returns:
+            float: Seconds, 0.0 when nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return min(2 * self.gamma ** key / (self.gamma + 1), self.maximum)
+        return self.maximum
+
+    def snapshot(self):
+        """Returns the sketch as plain JSON-ready data."""
+        return {
+            "count": self.count,
+            "mean_seconds": self.total / self.count if self.count else 0.0,
+            "max_seconds": self.maximum,
+            "p50_seconds": self.quantile(0.5),
+            "p90_seconds": self.quantile(0.9),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": len(self.buckets),
+        }
+
+
+class CountMinSketch:
+    """Approximate counts of integer keys in ``depth`` rows of ``width`` counters.
+
+    Estimates never fall below the true count, and exceed it by at most
+    ``e / width`` of the total with probability ``1 - exp(-depth)``.
+
+    Args:
+        width (int): Counters per row, a power of two.
+        depth (int): Rows, each with its own hash function.
+        seed (int): Seed of the hash functions.
+    """
+
+    def __init__(self, width=1 << 14, depth=4, seed=0):
+        if width < 2 or width & (width - 1):
+            raise ValueError("the width of a count-min sketch must be a power of two")
+        rng = random.Random(seed)
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._shift = 64 - width.bit_length() + 1
+        self._salts = [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(depth)]
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def _columns(self, key):
+        shift = self._shift
+        return [(((a * key + b) & _MASK64) >> shift) for a, b in self._salts]
+
+    def add(self, key, count=1):
+        """Counts ``key`` ``count`` more times."""
+        self.total += count
+        for row, column in zip(self.rows, self._columns(key)):
+            row[column] += count
+
+    def estimate(self, key):
+        """Returns the estimated count of ``key``."""
+        return min(row[column] for row, column in zip(self.rows, self._columns(key)))
+
+    def add_many(self, keys, counts=None):
+        """Counts many keys at once; NumPy arrays with NumPy, else any sequences.
+
+        Args:
+            keys (sequence): The keys.
+            counts (sequence): How often each key was seen; once if None.
+        """
+        numpy = numpy_or_none()
+        if numpy is None or not isinstance(keys, numpy.ndarray):
+            for key, count in zip(keys, counts if counts is not None else [1] * len(keys)):
+                self.add(int(key), int(count))
+            return
+        self.total += len(keys) if counts is None else int(counts.sum())
+        for row, column in zip(self.rows, self._columns_numpy(numpy, keys.astype(numpy.uint64))):
+            numpy.frombuffer(row, dtype=numpy.uint64)[:] += numpy.bincount(
+                column, counts, self.width).astype(numpy.uint64)
+
+    def estimate_many(self, keys):
+        """Returns the estimated counts of many keys as a list."""
+        numpy = numpy_or_none()
+        if numpy is None or not isinstance(keys, numpy.ndarray):
+            return [self.estimate(int(key)) for key in keys]
+        columns = self._columns_numpy(numpy, keys.astype(numpy.uint64))
+        return numpy.min([numpy.frombuffer(row, dtype=numpy.uint64)[column]
+                          for row, column in zip(self.rows, columns)], axis=0).tolist()
+
+    def _columns_numpy(self, numpy, keys):
+        shift = numpy.uint64(self._shift)
+        with numpy.errstate(over="ignore"):
+            return [((keys * numpy.uint64(a) + numpy.uint64(b)) >> shift).astype(numpy.intp) for a, b in self._salts]
+
+
+class TopSequences:
+    """The ``k`` most common sequences of ``length`` consecutive user moves.
+
+    Sequences are counted in a CountMinSketch. After every block, the
+    sequences most common in the block are candidates; they and the
+    current top ``k`` are ranked by their estimated counts.
+
+    Args:
+        length (int): Moves per sequence, at most 27.
+        k (int): Sequences to keep.
+        width (int): Counters per row of the sketch, a power of two.
+        depth (int): Rows of the sketch.
+    """
+
+    def __init__(self, length=4, k=10, width=1 << 14, depth=4):
+        if not 1 <= length <= 27:
+            raise ValueError("sequences hold 1 to 27 moves")
+        self.length = length
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self.top_counts = {}  # Sequence code -> estimated count, at most k of them.
+        self._space = ACTION_COUNT ** length
+        self._tail = b""  # The last length - 1 moves, which start the next block's sequences.
+
+    def consume(self, pairs, latencies=None):
+        moves = self._tail + pairs.translate(_USER_BY_PAIR)
+        self._tail = moves[-(self.length - 1):] if self.length > 1 else b""
+        if len(moves) < self.length:
+            return
+        numpy = numpy_or_none()
+        if numpy is not None and len(moves) > 1024:
+            keys, counts = self._count_numpy(numpy, moves)
+            self.sketch.add_many(keys, counts)
+            if counts is None:  # Too many possible sequences to count them all: rank a sample.
+                keys, counts = numpy.unique(keys[::max(1, len(keys) // _SAMPLE_SIZE)], return_counts=True)
+            candidates = keys[numpy.argsort(counts)[::-1][:4 * self.k]].tolist()
+        else:
+            counted = Counter(self._codes(moves))
+            self.sketch.add_many(list(counted), list(counted.values()))
+            candidates = [key for key, _ in counted.most_common(4 * self.k)]
+        candidates = list(set(candidates) | set(self.top_counts))
+        estimates = self.sketch.estimate_many(candidates)
+        best = heapq.nlargest(self.k, zip(estimates, candidates))
+        self.top_counts = {key: estimate for estimate, key in best}
+
+    def _codes(self, moves):
+        """Yields the base-5 code of every sequence of ``length`` moves."""
+        code, space = 0, self._space
+        for index, move in enumerate(moves):
+            code = (code * ACTION_COUNT + move) % space
+            if index + 1 >= self.length:
+                yield code
+
+    def _count_numpy(self, numpy, moves):
+        """Distinct sequence codes of a block and their counts, or every code and None for long sequences."""
+        values = numpy.frombuffer(moves, dtype=numpy.uint8)
+        size = len(values) - self.length + 1
+        # The narrowest type that holds every code keeps the arithmetic cheap.
+        dtype = next(dtype for dtype in (numpy.uint16, numpy.uint32, numpy.uint64)
+                     if self._space <= numpy.iinfo(dtype).max + 1)
+        codes = values[:size].astype(dtype)
+        for offset in range(1, self.length):
+            codes *= ACTION_COUNT
+            codes += values[offset:offset + size]
+        if self._space <= 1 << 16:
+            counts = numpy.bincount(codes, minlength=self._space)
+            keys = numpy.flatnonzero(counts)
+            return keys, counts[keys]
+        return codes, None
+
+    def sequence(self, code):
+        """Returns the Actions of a sequence code, oldest first."""
+        moves = []
+        for _ in range(self.length):
+            code, move = divmod(code, ACTION_COUNT)
+            moves.append(Action(move))
+        return tuple(reversed(moves))
+
+    def top(self):
+        """Returns the most common sequences.
+
+        Returns:
+            list[tuple]: ``(Actions, estimated count)`` pairs, most common first.
+        """
+        return [(self.sequence(key), count)
+                for key, count in sorted(self.top_counts.items(), key=lambda item: (-item[1], item[0]))]
+
+    def snapshot(self):
+        """Returns the top sequences as plain JSON-ready data."""
+        return [{"moves": [action.name for action in moves], "count": count} for moves, count in self.top()]
+
+
+class Dashboard:
+    """A SlidingWindow, Streaks, a LatencySketch and TopSequences side by side.
+
+    Args:
+        window (int): Rounds in the sliding window.
+        sequence_length (int): Moves per counted sequence.
+        k (int): Most common sequences shown.
+    """
+
+    def __init__(self, window=10_000, sequence_length=4, k=5):
+        self.window = SlidingWindow(window)
+        self.streaks = Streaks()
+        self.latency = LatencySketch()
+        self.sequences = TopSequences(sequence_length, k)
+        self.rounds = 0
+
+    def consume(self, pairs, latencies=None):
+        self.rounds += len(pairs)
+        for aggregator in (self.window, self.streaks, self.latency, self.sequences):
+            aggregator.consume(pairs, latencies)
+
+    def snapshot(self):
+        """Returns every aggregate as plain JSON-ready data."""
+        return {
+            "rounds": self.rounds,
+            "window": self.window.snapshot(),
+            "streaks": self.streaks.snapshot(),
+            "latency": self.latency.snapshot(),
+            "sequences": self.sequences.snapshot(),
+        }
+
+    def render(self):
+        """Renders the dashboard as text, one line per aggregate."""
+        window = len(self.window)
+
+        def shares(counts):
+            return " | ".join(f"{action.name} {count / max(1, window):.1%}" for action, count in zip(Action, counts))
+
+        rates = " | ".join(f"{action.name} {'-' if rate is None else f'{rate:.1%}'}"
+                           for action, rate in zip(Action, self.window.win_rates()))
+        streaks = self.streaks
+        lines = [
+            f"📡 {self.rounds:,} rounds, the last {window:,} in the window",
+            f"🎯 Your moves: {shares(self.window.move_counts(0))}",
+            f"🤖 Computer moves: {shares(self.window.move_counts(1))}",
+            f"🏆 Win rate by move: {rates}",
+            f"🔥 Streak: {streaks.length} x {streaks.current.name if streaks.current is not None else '-'} | "
+            f"longest win {streaks.longest[Outcome.Win]} | longest loss {streaks.longest[Outcome.Loss]}",
+        ]
+        if self.latency.count:
+            latency = self.latency
+            lines.append(f"⏱️  Latency p50: {latency.quantile(0.5) * 1000:.2f} ms | "
+                         f"p90: {latency.quantile(0.9) * 1000:.2f} ms | p99: {latency.quantile(0.99) * 1000:.2f} ms")
+        for place, (moves, count) in enumerate(self.sequences.top(), start=1):
+            lines.append(f"🔁 {place}. {' '.join(action.name for action in moves)}: ~{count:,}")
+        return "\n".join(lines)
@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/evolution.py
+"""Evolutionary search for Rock-Paper-Scissors-Lizard-Spock strategies.
+
+``rpsls evolve`` breeds strategies instead of writing them. A strategy is a
+lookup table, its genome: the last ``memory`` rounds, each a pair code
+``own * 5 + opponent`` as in the simulator, select one byte holding the
+move to play next. With the default memory of 2 a genome is 625 bytes.
+
+Every generation, each individual plays matches against a few randomly
+drawn members of the population and scores like in the tournament standings
+(a tie is half a win). The fittest survive unchanged, the rest of the next
+generation is bred by tournament selection, two-point crossover and
+mutation.
+
+Matches are resolved with the game's own outcome table, the one behind
+resolve(), and since two lookup tables playing each other are
+deterministic, a match is played until its history repeats and the cycle
+is then counted instead of played, so a match costs at most one round per
+table entry whatever its length.
+
+Generations are evaluated by worker processes. The population lives in one
+block of shared memory that the workers attach to once, so a generation
+hands them nothing but index pairs, and every generation is checkpointed
+to disk so that ``--resume`` picks up where a run stopped. Results depend
+only on the seed, not on the number of workers.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import math
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from rockPaperScissorsLizardSpock import ACTION_COUNT, Outcome
+from simulation import OUTCOME_BY_PAIR, Tally, simulate
+from strategies import Strategy, make_strategy
+
+PAIR_COUNT = ACTION_COUNT * ACTION_COUNT
+
+# Checkpoint header: magic, format version, memory, population size,
+# generation and seed, followed by the genomes and their fitness.
+MAGIC = b"RPSLSEVO"
+VERSION = 1
+HEADER = struct.Struct("<8sHBxIIq")
+
+BENCHMARK_STRATEGIES = ("uniform", "rock", "cycle", "frequency", "markov")
+
+Generation = namedtuple("Generation", ["generation", "population", "fitness", "seed"])
+Generation.__doc__ = """One generation: its number, the genomes as one block of
+bytes, the fitness of every genome and the seed of the run."""
+
+
+class CheckpointError(Exception):
+    """Raised for files that are not evolution checkpoints."""
+
+
+def table_size(memory):
+    """Returns the number of entries of a genome remembering ``memory`` rounds."""
+    if memory < 1:
+        raise ValueError("memory must be at least 1 round")
+    return PAIR_COUNT ** memory
+
+
+def random_population(size, memory, rng):
+    """Returns ``size`` random genomes as one ``bytearray``."""
+    table = bytes(value % ACTION_COUNT for value in range(256))
+    rejected = bytes(range(256 - 256 % ACTION_COUNT, 256))
+    genomes = bytearray()
+    needed = size * table_size(memory)
+    while len(genomes) < needed:
+        genomes += rng.randbytes(needed - len(genomes) + 64).translate(table, rejected)
+    del genomes[needed:]
+    return genomes
+
+
+def play_match(genome_a, genome_b, rounds):
+    """Plays two lookup-table strategies against each other.
+
+    Both start as if the previous rounds were Rock against Rock. Once the
+    shared history repeats, the rest of the match repeats the cycle since,
+    and is counted rather than played.
+
+    Args:
+        genome_a (bytes): Moves of the first strategy, by history.
+        genome_b (bytes): Moves of the second strategy, same memory.
+        rounds (int): Length of the match.
+
+    Returns:
+        Tally: The result from the point of view of ``genome_a``.
+    """
+    states = len(genome_a)
+    outcome_by_pair = OUTCOME_BY_PAIR
+    seen = {}
+    outcomes = bytearray()
+    state_a = state_b = 0
+    for played in range(rounds):
+        start = seen.get(state_a)
+        if start is not None:
+            # B's history mirrors A's, so A's state alone fixes the future.
+            cycle = outcomes[start:]
+            repeats, rest = divmod(rounds - played, len(cycle))
+            outcomes += cycle[:rest]
+            break
+        seen[state_a] = played
+        move_a = genome_a[state_a]
+        move_b = genome_b[state_b]
+        pair = move_a * ACTION_COUNT + move_b
+        outcomes.append(outcome_by_pair[pair])
+        state_a = (state_a * PAIR_COUNT + pair) % states
+        state_b = (state_b * PAIR_COUNT + move_b * ACTION_COUNT + move_a) % states
+    else:
+        cycle = b""
+        repeats = 0
+    wins = outcomes.count(Outcome.Win) + repeats * cycle.count(Outcome.Win)
+    losses = outcomes.count(Outcome.Loss) + repeats * cycle.count(Outcome.Loss)
+    return Tally(wins, losses, rounds - wins - losses)
+
+
+# The population a worker process reads genomes from, see _attach().
+_population = None
+_shared = None
+
+
+def _attach(name, genome_size):
+    """Worker initializer: attaches to the population's shared memory."""
+    global _population, _shared
+    _shared = shared_memory.SharedMemory(name=name)
+    _population = (_shared.buf, genome_size)
+
+
+def _play_pairs(pairs, rounds):
+    """Plays the matches of ``pairs`` from the attached population.
+
+    Args:
+        pairs (bytes): ``array("I")`` bytes of alternating genome indices.
+        rounds (int): Rounds per match.
+
+    Returns:
+        bytes: ``array("I")`` bytes of each match's wins and losses.
+    """
+    buffer, size = _population
+    indices = array("I", pairs)
+    results = array("I")
+    for position in range(0, len(indices), 2):
+        a, b = indices[position] * size, indices[position + 1] * size
+        tally = play_match(buffer[a:a + size], buffer[b:b + size], rounds)
+        results.append(tally.wins)
+        results.append(tally.losses)
+    return results.tobytes()
+
+
+def draw_pairings(size, opponents, rng):
+    """Draws ``opponents`` distinct opponents for every individual.
+
+    Returns:
+        array: Alternating ``(individual, opponent)`` indices as ``array("I")``.
+    """
+    if not 0 < opponents < size:
+        raise ValueError("every individual needs between 1 and population size - 1 opponents")
+    pairs = array("I")
+    for individual in range(size):
+        for opponent in rng.sample(range(size - 1), opponents):
+            pairs.append(individual)
+            pairs.append(opponent + (opponent >= individual))  # Never itself.
+    return pairs
+
+
+def fitness_of(size, pairs, results, rounds):
+    """Turns match results into each individual's share of points, ties half."""
+    points = [0.0] * size
+    played = [0] * size
+    for position in range(0, len(pairs), 2):
+        a, b = pairs[position], pairs[position + 1]
+        wins, losses = results[position], results[position + 1]
+        ties = rounds - wins - losses
+        points[a] += wins + ties / 2
+        points[b] += losses + ties / 2
+        played[a] += rounds
+        played[b] += rounds
+    return array("d", (score / games if games else 0.0 for score, games in zip(points, played)))
+
+
+def _select(fitness, rng, tournament_size):
+    """Tournament selection: the fittest of a few random individuals."""
+    return max(rng.sample(range(len(fitness)), tournament_size), key=fitness.__getitem__)
+
+
+def _mutate(genome, rate, rng):
+    """Replaces each entry with a random move with probability ``rate``."""
+    if rate <= 0:
+        return
+    skip = math.log(1 - rate) if rate < 1 else -math.inf
+    position = -1
+    while True:
+        # Geometric jumps to the next mutated entry instead of a draw per entry.
+        position += 1 + (int(math.log(1 - rng.random()) / skip) if skip else 0)
+        if position >= len(genome):
+            return
+        genome[position] = rng.randrange(ACTION_COUNT)
+
+
+def next_generation(population, fitness, genome_size, rng, elite=0.02, mutation_rate=0.01, tournament_size=3):
+    """Breeds the next generation.
+
+    Args:
+        population (bytes): The genomes of this generation.
+        fitness (array): Their fitness, see fitness_of().
+        genome_size (int): Bytes per genome.
+        rng (random.Random): Source of randomness.
+        elite (float): Share of the fittest carried over unchanged.
+        mutation_rate (float): Chance of each entry of a child to mutate.
+        tournament_size (int): Individuals competing in every selection.
+
+    Returns:
+        bytearray: The genomes of the next generation.
+    """
+    size = len(fitness)
+    ranked = sorted(range(size), key=lambda individual: (-fitness[individual], individual))
+    children = bytearray()
+    for individual in ranked[:int(size * elite)]:
+        children += population[individual * genome_size:(individual + 1) * genome_size]
+    while len(children) < size * genome_size:
+        mother = _select(fitness, rng, tournament_size) * genome_size
+        father = _select(fitness, rng, tournament_size) * genome_size
+        low, high = sorted(rng.sample(range(genome_size + 1), 2))
+        child = bytearray(population[mother:mother + genome_size])
+        child[low:high] = population[father + low:father + high]
+        _mutate(child, mutation_rate, rng)
+        children += child
+    return children
+
+
+def save_checkpoint(path, generation, memory):
+    """Writes a generation to ``path``, atomically replacing the previous one."""
+    size = len(generation.fitness)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, memory, size, generation.generation, generation.seed))
+        stream.write(generation.population)
+        stream.write(array("d", generation.fitness).tobytes())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    """Reads a checkpoint.
+
+    Returns:
+        tuple: The memory of its genomes and the Generation.
+
+    Raises:
+        CheckpointError: If the file is not a complete checkpoint.
+    """
+    with open(path, "rb") as stream:
+        data = stream.read()
+    if len(data) < HEADER.size:
+        raise CheckpointError(f"{path} is too short to be a checkpoint")
+    magic, version, memory, size, number, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise CheckpointError(f"{path} is not a version {VERSION} evolution checkpoint")
+    genomes = size * table_size(memory)
+    if len(data) != HEADER.size + genomes + 8 * size:
+        raise CheckpointError(f"{path} is truncated")
+    population = data[HEADER.size:HEADER.size + genomes]
+    if population.translate(None, bytes(range(ACTION_COUNT))):
+        raise CheckpointError(f"{path} holds genomes with moves that do not exist")
+    fitness = array("d", data[HEADER.size + genomes:])
+    return memory, Generation(number, population, fitness, seed)
+
+
+def evolve(population_size=1000, generations=50, memory=2, opponents=8, rounds=100, mutation_rate=0.01,
+           elite=0.02, seed=0, workers=None, checkpoint=None, resume=False, progress=None):
+    """Runs the evolutionary search.
+
+    Args:
+        population_size (int): Genomes per generation.
+        generations (int): Generation to stop after, counting from 1.
+        memory (int): Rounds of history a genome looks at.
+        opponents (int): Matches every individual starts per generation;
+            it also plays those other individuals start against it.
+        rounds (int): Rounds per match.
+        mutation_rate (float): Chance of each entry of a child to mutate.
+        elite (float): Share of the fittest carried over unchanged.
+        seed (int): Seed of the run; the results depend on nothing else.
+        workers (int): Worker processes; ``None`` uses every core and ``1``
+            evaluates in the current process.
+        checkpoint (str): File every generation is saved to.
+        resume (bool): Continue from ``checkpoint`` if it exists; its
+            memory, population size and seed replace the arguments.
+        progress (callable): Called with every evaluated Generation.
+
+    Returns:
+        Generation: The last evaluated generation.
+
+    Raises:
+        ValueError: On parameters outside their ranges.
+        CheckpointError: If the checkpoint to resume from is not one.
+    """
+    if resume and checkpoint and os.path.exists(checkpoint):
+        memory, last = load_checkpoint(checkpoint)
+        population_size, seed, first = len(last.fitness), last.seed, last.generation + 1
+        genome_size = table_size(memory)
+        population = next_generation(last.population, last.fitness, genome_size,
+                                     random.Random(f"{seed}/breed/{last.generation}"), elite, mutation_rate)
+    else:
+        last, first = None, 1
+        genome_size = table_size(memory)
+        population = random_population(population_size, memory, random.Random(f"{seed}/population"))
+    if rounds < 1 or generations < first:
+        raise ValueError("need at least one round per match and one generation to run")
+    draw_pairings(population_size, opponents, random.Random())  # Validates opponents early.
+
+    global _population
+    shared = shared_memory.SharedMemory(create=True, size=population_size * genome_size)
+    executor = None
+    try:
+        if workers != 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                           initargs=(shared.name, genome_size))
+            chunks = 4 * (workers or os.cpu_count() or 1)
+        else:
+            _population = (shared.buf, genome_size)
+        for number in range(first, generations + 1):
+            shared.buf[:len(population)] = population
+            pairs = draw_pairings(population_size, opponents, random.Random(f"{seed}/pairings/{number}"))
+            if executor is None:
+                results = array("I", _play_pairs(pairs.tobytes(), rounds))
+            else:
+                step = -(-len(pairs) // (2 * chunks)) * 2
+                blocks = [pairs[start:start + step].tobytes() for start in range(0, len(pairs), step)]
+                results = array("I")
+                for block in executor.map(_play_pairs, blocks, [rounds] * len(blocks)):
+                    results.frombytes(block)
+            last = Generation(number, bytes(population), fitness_of(population_size, pairs, results, rounds), seed)
+            if checkpoint:
+                save_checkpoint(checkpoint, last, memory)
+            if progress is not None:
+                progress(last)
+            if number < generations:
+                population = next_generation(population, last.fitness, genome_size,
+                                             random.Random(f"{seed}/breed/{number}"), elite, mutation_rate)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _population = None
+        shared.close()
+        shared.unlink()
+    return last
+
+
+def champion(generation):
+    """Returns the genome of the fittest individual of a generation."""
+    size = len(generation.population) // len(generation.fitness)
+    best = max(range(len(generation.fitness)), key=generation.fitness.__getitem__)
+    return generation.population[best * size:(best + 1) * size]
+
+
+def distinct_genomes(generation):
+    """Returns how many different genomes a generation holds, a measure of diversity."""
+    population = generation.population
+    size = len(population) // len(generation.fitness)
+    return len({population[start:start + size] for start in range(0, len(population), size)})
+
+
+class EvolvedStrategy(Strategy):
+    """Plays an evolved genome, see the module docstring.
+
+    Args:
+        genome (bytes): The lookup table, its length a power of 25.
+    """
+
+    name = "evolved"
+    adaptive = True
+
+    def __init__(self, genome):
+        super().__init__()
+        self.genome = bytes(genome)
+        self.state = 0
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.state = 0
+
+    def move(self):
+        return self.genome[self.state]
+
+    def observe(self, own, opponent):
+        self.state = (self.state * PAIR_COUNT + own * ACTION_COUNT + opponent) % len(self.genome)
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls evolve`` options to an argument parser."""
+    parser.add_argument("-p", "--population", type=int, default=1000, help="genomes per generation (default: 1000)")
+    parser.add_argument("-g", "--generations", type=int, default=50, help="generations to run (default: 50)")
+    parser.add_argument("--memory", type=int, default=2, help="rounds of history a genome sees (default: 2)")
+    parser.add_argument("--opponents", type=int, default=8,
+                        help="matches each individual starts per generation (default: 8)")
+    parser.add_argument("-n", "--rounds", type=int, default=100, help="rounds per match (default: 100)")
+    parser.add_argument("--mutation-rate", type=float, default=0.01,
+                        help="chance of each table entry to mutate (default: 0.01)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the run (default: 0)")
+    parser.add_argument("-j", "--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--checkpoint", metavar="PATH", help="save every generation to this file")
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint if it exists")
+
+
+def run(args):
+    """Runs ``rpsls evolve`` and pits the champion against the built-in strategies."""
+    start = time.perf_counter()
+
+    def report(generation):
+        print(f"🧬 Generation {generation.generation:>4}: best {max(generation.fitness):.4f}, "
+              f"{distinct_genomes(generation):,} distinct genomes ({time.perf_counter() - start:.2f}s)")
+
+    print(f"\n{'═' * 70}")
+    print(f"🧬 EVOLUTION ({args.population:,} genomes, memory {args.memory}, {args.rounds} rounds per match)")
+    print(f"{'═' * 70}")
+    try:
+        last = evolve(args.population, args.generations, args.memory, args.opponents, args.rounds,
+                      args.mutation_rate, seed=args.seed, workers=args.workers, checkpoint=args.checkpoint,
+                      resume=args.resume, progress=report)
+    except (OSError, CheckpointError, ValueError) as error:
+        sys.exit(f"❌ {error}")
+    best = champion(last)
+    print(f"{'─' * 70}")
+    print(f"🏆 Champion of generation {last.generation} against the built-in strategies:")
+    for name in BENCHMARK_STRATEGIES:
+        tally = simulate(10_000, EvolvedStrategy(best), make_strategy(name), seed=args.seed)
+        print(f"  vs {name:<12} Wins: {tally.wins:>6} | Losses: {tally.losses:>6} | Ties: {tally.ties:>6}")
+    print(f"{'─' * 70}\n")
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/history.py
+"""Persistent game history for Rock-Paper-Scissors-Lizard-Spock.
+
+Every round is appended to a history file as a fixed-width 16-byte record:
+
+    offset  size  field
+    0       8     timestamp, seconds since the epoch (float64)
+    8       4     player id (uint32)
+    12      1     user Action
+    13      1     computer Action
+    14      1     Outcome for the user
+    15      1     padding
+
+after a 16-byte header holding a magic number, the format version and the
+record size. Files are read back through ``mmap``, and statistics are
+computed on whole columns at once (with NumPy if it is installed), so
+hundreds of millions of rounds never turn into Python objects.
+
+The active file can be rotated to numbered segments (``history.bin.1``,
+``history.bin.2``, ...), and compaction folds rotated segments into a small
+JSON summary of per-player totals before deleting them.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from rockPaperScissorsLizardSpock import ACTION_COUNT, OUTCOME_TABLE, Outcome
+from simulation import Tally, numpy_or_none
+
+MAGIC = b"RPSLSHST"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<dIBBBx")
+OUTCOME_OFFSET = 14
+
+# Records unpacked per step when NumPy is not available.
+_SCAN_CHUNK = 1 << 16
+
+# Fields of RECORD as a NumPy structured dtype, see _MappedSegment.records().
+_RECORD_FIELDS = [("timestamp", "<f8"), ("player", "<u4"), ("user", "u1"),
+                  ("computer", "u1"), ("outcome", "u1"), ("padding", "u1")]
+
+
+class HistoryError(Exception):
+    """Raised for files that are not game histories."""
+
+
+def _check_header(header, path):
+    """Validates the header bytes of a history file."""
+    if len(header) < HEADER.size:
+        raise HistoryError(f"{path} is too short to be a game history")
+    magic, version, record_size = HEADER.unpack(header[:HEADER.size])
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise HistoryError(f"{path} is not a version {VERSION} game history")
+
+
+class _MappedSegment:
+    """A read-only memory map of one history file.
+
+    Attributes:
+        count (int): Number of complete records; a partially written
+            record at the end of the file is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as stream:
+            self.map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(self.map[:HEADER.size], path)
+        self.count = (len(self.map) - HEADER.size) // RECORD.size
+        self.end = HEADER.size + self.count * RECORD.size
+
+    def column(self, offset):
+        """Returns the one-byte field at ``offset`` of every record as bytes."""
+        return self.map[HEADER.size + offset:self.end:RECORD.size]
+
+    def records(self, numpy):
+        """Returns the records as a NumPy structured array (no copy)."""
+        return numpy.frombuffer(self.map, dtype=numpy.dtype(_RECORD_FIELDS), count=self.count,
+                                offset=HEADER.size)
+
+    def close(self):
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _segment_player_counts(segment):
+    """Counts rounds per (player, outcome) in one segment.
+
+    Returns:
+        dict: Maps ``(player, outcome)`` to a number of rounds.
+    """
+    if segment.count == 0:
+        return {}
+    numpy = numpy_or_none()
+    if numpy is not None:
+        records = segment.records(numpy)
+        players, inverse = numpy.unique(records["player"], return_inverse=True)
+        counts = numpy.bincount(inverse * len(Outcome) + records["outcome"],
+                                minlength=len(players) * len(Outcome))
+        return {(int(players[index // len(Outcome)]), index % len(Outcome)): int(count)
+                for index, count in enumerate(counts) if count}
+    counts = Counter()
+    for start in range(HEADER.size, segment.end, _SCAN_CHUNK * RECORD.size):
+        stop = min(segment.end, start + _SCAN_CHUNK * RECORD.size)
+        counts.update((player, outcome) for _, player, _, _, outcome in RECORD.iter_unpack(segment.map[start:stop]))
+    return dict(counts)
+
+
+class HistoryStore:
+    """Append-only history of played rounds.
+
+    Args:
+        path (str): The active history file; created if missing.
+        buffer_size (int): Records buffered before they are written out.
+    """
+
+    def __init__(self, path, buffer_size=4096):
+        self.path = Path(path)
+        self.summary_path = self.path.with_name(self.path.name + ".summary.json")
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._totals = None
+        self._stream = self._open_active()
+
+    def _open_active(self):
+        """Opens the active file for appending, writing or checking its header."""
+        stream = open(self.path, "a+b")
+        try:
+            stream.seek(0)
+            header = stream.read(HEADER.size)
+            if not header:
+                stream.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+                stream.flush()
+            else:
+                _check_header(header, self.path)
+                size = stream.seek(0, os.SEEK_END)
+                partial = (size - HEADER.size) % RECORD.size
+                if partial:  # A crash in the middle of a write: drop the torn record.
+                    stream.truncate(size - partial)
+        except BaseException:
+            stream.close()
+            raise
+        return stream
+
+    def append(self, user, computer, player=0, timestamp=None):
+        """Records one round.
+
+        Args:
+            user (int): The user's Action.
+            computer (int): The computer's Action.
+            player (int): Id of the player, 0 by default.
+            timestamp (float): Time of the round, ``time.time()`` by default.
+
+        Raises:
+            ValueError: If a move is not an Action value.
+        """
+        if not (0 <= user < ACTION_COUNT and 0 <= computer < ACTION_COUNT):
+            raise ValueError(f"Moves must be in range [0, {ACTION_COUNT - 1}]")
+        outcome = OUTCOME_TABLE[user * ACTION_COUNT + computer]
+        self._buffer += RECORD.pack(time.time() if timestamp is None else timestamp, player, user, computer, outcome)
+        self._buffered += 1
+        if self._totals is not None:
+            key = (player, int(outcome))
+            self._totals[key] = self._totals.get(key, 0) + 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Writes buffered records to the active file."""
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._stream.flush()
+            self._buffer.clear()
+            self._buffered = 0
+
+    def close(self):
+        """Flushes and closes the active file."""
+        if not self._stream.closed:
+            self.flush()
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def segments(self):
+        """Lists the rotated segments, oldest first, then the active file.
+
+        Returns:
+            list[Path]: Paths of every file holding records.
+        """
+        rotated = []
+        for candidate in self.path.parent.glob(self.path.name + ".*"):
+            suffix = candidate.name[len(self.path.name) + 1:]
+            if suffix.isdigit():
+                rotated.append((int(suffix), candidate))
+        return [path for _, path in sorted(rotated)] + [self.path]
+
+    def _load_summary(self):
+        """Reads the per-player totals of compacted segments."""
+        if not self.summary_path.exists():
+            return {}
+        data = json.loads(self.summary_path.read_text(encoding="utf-8"))
+        return {(int(player), int(outcome)): count
+                for player, row in data["players"].items()
+                for outcome, count in enumerate(row) if count}
+
+    def _counts(self):
+        """Rounds per (player, outcome), scanned once and then kept current."""
+        if self._totals is None:
+            self.flush()
+            totals = Counter(self._load_summary())
+            for path in self.segments():
+                with _MappedSegment(path) as segment:
+                    totals.update(_segment_player_counts(segment))
+            self._totals = dict(totals)
+        return self._totals
+
+    def player_totals(self):
+        """Returns the score of every player, including compacted rounds.
+
+        Returns:
+            dict: Maps player id to a Tally.
+        """
+        rows = {}
+        for (player, outcome), count in self._counts().items():
+            rows.setdefault(player, [0, 0, 0])[outcome] += count
+        return {player: Tally(row[Outcome.Win], row[Outcome.Loss], row[Outcome.Tie])
+                for player, row in sorted(rows.items())}
+
+    def totals(self, player=None):
+        """Returns the score of one player, or of everybody.
+
+        Args:
+            player (int): Player id, or None for all players together.
+
+        Returns:
+            Tally: Wins, losses and ties.
+        """
+        row = [0, 0, 0]
+        for (owner, outcome), count in self._counts().items():
+            if player is None or owner == player:
+                row[outcome] += count
+        return Tally(row[Outcome.Win], row[Outcome.Loss], row[Outcome.Tie])
+
+    def outcome_counts(self):
+        """Counts outcomes in the uncompacted files straight from the mapped bytes.
+
+        This is the fastest full scan: the outcome column of each file is
+        sliced out of the memory map and counted in C.
+
+        Returns:
+            Tally: Wins, losses and ties over every uncompacted round.
+        """
+        self.flush()
+        wins = losses = ties = 0
+        for path in self.segments():
+            with _MappedSegment(path) as segment:
+                column = segment.column(OUTCOME_OFFSET)
+                wins += column.count(Outcome.Win)
+                losses += column.count(Outcome.Loss)
+                ties += column.count(Outcome.Tie)
+        return Tally(wins, losses, ties)
+
+    def player_outcomes(self):
+        """Yields the player and outcome columns of every uncompacted file, oldest first.
+
+        Yields:
+            tuple: NumPy arrays of player ids and Outcomes, or an
+                ``array("I")`` and bytes without NumPy.
+        """
+        self.flush()
+        numpy = numpy_or_none()
+        for path in self.segments():
+            with _MappedSegment(path) as segment:
+                if numpy is not None:
+                    records = segment.records(numpy)
+                    yield records["player"].copy(), records["outcome"].copy()
+                    del records  # The map cannot close while an array still points into it.
+                else:
+                    players = array("I", (player for _, player, _, _, _ in
+                                          RECORD.iter_unpack(segment.map[HEADER.size:segment.end])))
+                    yield players, segment.column(OUTCOME_OFFSET)
+
+    def rotate(self):
+        """Moves the active file to the next numbered segment and starts afresh.
+
+        Returns:
+            Path: The new segment.
+        """
+        self.flush()
+        self._stream.close()
+        numbers = [int(path.name.rsplit(".", 1)[1]) for path in self.segments()[:-1]]
+        target = self.path.with_name(f"{self.path.name}.{max(numbers, default=0) + 1}")
+        os.replace(self.path, target)
+        self._stream = self._open_active()
+        return target
+
+    def compact(self):
+        """Folds every rotated segment into the summary and deletes it.
+
+        Per-player totals are kept; the individual rounds of the folded
+        segments are not.
+
+        Returns:
+            int: Number of segments folded.
+        """
+        rotated = self.segments()[:-1]
+        if not rotated:
+            return 0
+        totals = Counter(self._load_summary())
+        for path in rotated:
+            with _MappedSegment(path) as segment:
+                totals.update(_segment_player_counts(segment))
+        players = {}
+        for (player, outcome), count in totals.items():
+            players.setdefault(str(player), [0, 0, 0])[outcome] += count
+        temporary = self.summary_path.with_name(self.summary_path.name + ".tmp")
+        temporary.write_text(json.dumps({"version": VERSION, "players": players}, indent=1), encoding="utf-8")
+        os.replace(temporary, self.summary_path)
+        for path in rotated:
+            path.unlink()
+        return len(rotated)
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls history`` options to an argument parser."""
+    parser.add_argument("path", help="history file, as given to rpsls --history")
+    parser.add_argument("--rotate", action="store_true", help="start a new segment first")
+    parser.add_argument("--compact", action="store_true", help="fold rotated segments into the summary")
+
+
+def run(args):
+    """Runs ``rpsls history``: optional maintenance, then per-player totals."""
+    with HistoryStore(args.path) as store:
+        if args.rotate:
+            print(f"🔄 Rotated to {store.rotate()}")
+        if args.compact:
+            print(f"🗜️  Compacted {store.compact()} segment(s)")
+        for player, tally in store.player_totals().items():
+            print(f"📊 Player {player}: Wins: {tally.wins} | Losses: {tally.losses} | Ties: {tally.ties}")
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/leaderboard.py
+"""SQLite-backed leaderboard for Rock-Paper-Scissors-Lizard-Spock.
+
+Rounds are recorded per named player in a local SQLite file. Writes are
+batched: rounds wait in memory until ``batch_size`` of them have piled up
+or ``flush_interval`` seconds have passed, and are then inserted in one
+transaction together with the matching update of the per-player standings.
+The standings table is what the top-K query reads, so ranking players
+never scans the rounds, and its result is cached until the next flush.
+
+Every round also updates the Elo or Glicko-2 rating of the player and of
+the bot they played (see ratings.RatingTable) in memory; the ratings that
+changed are written with the batch, and top_rated() ranks by them.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import sqlite3
+import time
+from collections import namedtuple
+
+import profiling
+from ratings import Rating, RatingTable
+from rockPaperScissorsLizardSpock import ACTION_COUNT, OUTCOME_TABLE, Outcome
+
+LeaderboardEntry = namedtuple("LeaderboardEntry", ["name", "wins", "losses", "ties"])
+LeaderboardEntry.__doc__ = "One player's standing on the leaderboard."
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players (id),
+    played_at REAL NOT NULL,
+    user_action INTEGER NOT NULL,
+    computer_action INTEGER NOT NULL,
+    outcome INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_by_player ON rounds (player_id, played_at);
+CREATE INDEX IF NOT EXISTS rounds_by_time ON rounds (played_at);
+CREATE TABLE IF NOT EXISTS standings (
+    player_id INTEGER PRIMARY KEY REFERENCES players (id),
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    ties INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS standings_by_rank ON standings (wins DESC, losses ASC);
+CREATE TABLE IF NOT EXISTS ratings (
+    player_id INTEGER PRIMARY KEY REFERENCES players (id),
+    rating REAL NOT NULL,
+    deviation REAL NOT NULL,
+    volatility REAL NOT NULL,
+    games INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ratings_by_rank ON ratings (rating DESC);
+"""
+
+
+class Leaderboard:
+    """Records rounds and ranks players.
+
+    Args:
+        path (str): The SQLite database file, or ":memory:".
+        batch_size (int): Pending rounds that trigger a flush.
+        flush_interval (float): Seconds after which pending rounds are
+            flushed by the next record() call, however few there are.
+        system (str): Rating system, "glicko2" or "elo".
+    """
+
+    def __init__(self, path, batch_size=1000, flush_interval=0.25, system="glicko2"):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._players = dict(self.connection.execute("SELECT name, id FROM players"))
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._top_cache = {}
+        self.ratings = RatingTable(system)
+        for row in self.connection.execute(
+                "SELECT players.name, rating, deviation, volatility, games FROM ratings "
+                "JOIN players ON players.id = ratings.player_id"):
+            self.ratings.set(*row)
+        self._rated = set()
+
+    def player_id(self, name):
+        """Returns the id of a player, registering the name on first use."""
+        player = self._players.get(name)
+        if player is None:
+            with self.connection:
+                self.connection.execute("INSERT OR IGNORE INTO players (name) VALUES (?)", (name,))
+            (player,) = self.connection.execute("SELECT id FROM players WHERE name = ?", (name,)).fetchone()
+            self._players[name] = player
+        return player
+
+    def record(self, name, user, computer, timestamp=None, opponent="computer"):
+        """Queues one round for the next batched write and updates both ratings.
+
+        Args:
+            name (str): The player's name.
+            user (int): The player's Action.
+            computer (int): The computer's Action.
+            timestamp (float): Time of the round, ``time.time()`` by default.
+            opponent (str): Name the computer is rated under.
+        """
+        outcome = OUTCOME_TABLE[user * ACTION_COUNT + computer]
+        self.ratings.record(name, opponent, outcome)
+        self._rated.update((name, opponent))
+        self._pending.append((self.player_id(name), time.time() if timestamp is None else timestamp,
+                              int(user), int(computer), int(outcome)))
+        if (len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Writes every pending round and its standings in one transaction.
+
+        Returns:
+            int: Number of rounds written.
+        """
+        self._last_flush = time.monotonic()
+        pending = self._pending
+        if not pending:
+            return 0
+        self._pending = []
+        changes = {}
+        for player, _, _, _, outcome in pending:
+            row = changes.setdefault(player, [0, 0, 0])
+            row[outcome] += 1
+        rated = [(self.player_id(name), *self.ratings.entry(name)) for name in self._rated]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO rounds (player_id, played_at, user_action, computer_action, outcome) "
+                "VALUES (?, ?, ?, ?, ?)", pending)
+            self.connection.executemany(
+                "INSERT INTO standings (player_id, wins, losses, ties) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (player_id) DO UPDATE SET wins = wins + excluded.wins, "
+                "losses = losses + excluded.losses, ties = ties + excluded.ties",
+                [(player, row[Outcome.Win], row[Outcome.Loss], row[Outcome.Tie])
+                 for player, row in changes.items()])
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO ratings (player_id, rating, deviation, volatility, games) "
+                "VALUES (?, ?, ?, ?, ?)", rated)
+        self._rated.clear()
+        self._top_cache.clear()
+        return len(pending)
+
+    def top(self, k=10):
+        """Returns the best ``k`` players: most wins, then fewest losses.
+
+        Pending rounds are not flushed, so a cached answer stays valid until
+        the next flush.
+
+        Returns:
+            list[LeaderboardEntry]: Best player first.
+        """
+        entries = self._top_cache.get(k)
+        if entries is None:
+            rows = self.connection.execute(
+                "SELECT players.name, wins, losses, ties FROM standings "
+                "JOIN players ON players.id = standings.player_id "
+                "ORDER BY wins DESC, losses ASC, players.name LIMIT ?", (k,))
+            entries = self._top_cache[k] = [LeaderboardEntry(*row) for row in rows]
+        return entries
+
+    def top_rated(self, k=10):
+        """Returns the ``k`` best rated players and bots, cached like top().
+
+        Returns:
+            list[tuple]: ``(name, Rating)`` pairs, best first.
+        """
+        entries = self._top_cache.get(("rating", k))
+        if entries is None:
+            rows = self.connection.execute(
+                "SELECT players.name, rating, deviation, volatility, games FROM ratings "
+                "JOIN players ON players.id = ratings.player_id "
+                "ORDER BY rating DESC, players.name LIMIT ?", (k,))
+            entries = self._top_cache[("rating", k)] = [(name, Rating(*rating)) for name, *rating in rows]
+        return entries
+
+    def rounds_played(self, name, since=0.0):
+        """Counts the recorded rounds of one player since a point in time."""
+        player = self._players.get(name)
+        if player is None:
+            return 0
+        (count,) = self.connection.execute(
+            "SELECT COUNT(*) FROM rounds WHERE player_id = ? AND played_at >= ?", (player, since)).fetchone()
+        return count
+
+    def close(self):
+        """Flushes pending rounds and closes the database."""
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls leaderboard`` options to an argument parser."""
+    parser.add_argument("path", help="leaderboard database, as given to rpsls serve --leaderboard")
+    parser.add_argument("-k", "--top", type=int, default=10, help="number of players to show (default: 10)")
+    parser.add_argument("--by", choices=("wins", "rating"), default="wins",
+                        help="rank by wins or by rating, bots included (default: wins)")
+
+
+def run(args):
+    """Runs ``rpsls leaderboard`` and prints the best players."""
+    with Leaderboard(args.path) as board:
+        entries = board.top(args.top) if args.by == "wins" else board.top_rated(args.top)
+    print(f"\n{'═' * 70}")
+    print(f"🏆 LEADERBOARD (top {args.top} by {args.by})")
+    print(f"{'═' * 70}")
+    if args.by == "wins":
+        print(f"{'#':>3}  {'Player':<30}{'Wins':>12}{'Losses':>12}{'Ties':>12}")
+    else:
+        print(f"{'#':>3}  {'Player':<30}{'Rating':>12}{'Deviation':>12}{'Games':>12}")
+    print(f"{'─' * 70}")
+    for place, entry in enumerate(entries, start=1):
+        if args.by == "wins":
+            print(f"{place:>3}  {entry.name:<30}{entry.wins:>12}{entry.losses:>12}{entry.ties:>12}")
+        else:
+            name, rating = entry
+            print(f"{place:>3}  {name:<30}{rating.rating:>12.0f}{rating.deviation:>12.0f}{rating.games:>12}")
+    print(f"{'─' * 70}\n")
+
+
+# rpsls serve imports the leaderboard only once profiling may be on.
+profiling.instrument(__name__)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/loadtest.py
+"""Load generator for the ``rpsls serve`` game server.
+
+Opens many simultaneous connections, has every one of them play a number of
+rounds with random moves, and reports throughput and round latency.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import asyncio
+import random
+import time
+from collections import namedtuple
+
+from rockPaperScissorsLizardSpock import Action
+from server import DEFAULT_PORT
+
+LoadReport = namedtuple("LoadReport", ["rounds", "errors", "elapsed", "p50", "p99", "max"])
+LoadReport.__doc__ = "Result of a load test; latencies are in seconds."
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value below which ``fraction`` of the sorted values lie."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def _play(host, port, rounds, rng, latencies):
+    """Plays ``rounds`` rounds over one connection; returns the error count."""
+    reader, writer = await asyncio.open_connection(host, port)
+    errors = 0
+    try:
+        await reader.readline()  # HELLO
+        for _ in range(rounds):
+            start = time.perf_counter()
+            writer.write(f"{rng.randrange(len(Action))}\n".encode())
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if not reply.startswith(b"RESULT"):
+                errors += 1
+        writer.write(b"QUIT\n")
+        await reader.readline()  # BYE
+    finally:
+        writer.close()
+    return errors
+
+
+async def load_test(host="127.0.0.1", port=DEFAULT_PORT, clients=100, rounds=100, seed=None):
+    """Plays ``rounds`` rounds on each of ``clients`` concurrent connections.
+
+    Args:
+        host (str): Server address.
+        port (int): Server port.
+        clients (int): Number of simultaneous connections.
+        rounds (int): Rounds played per connection.
+        seed (int): Seed for the clients' moves.
+
+    Returns:
+        LoadReport: Completed rounds, failed rounds, wall time and latencies.
+    """
+    rng = random.Random(seed)
+    latencies = []
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_play(host, port, rounds, random.Random(rng.getrandbits(64)), latencies) for _ in range(clients)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    errors = sum(result if isinstance(result, int) else rounds for result in results)
+    latencies.sort()
+    return LoadReport(len(latencies), errors, elapsed, percentile(latencies, 0.50),
+                      percentile(latencies, 0.99), latencies[-1] if latencies else 0.0)
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls loadtest`` options to an argument parser."""
+    parser.add_argument("--host", default="127.0.0.1", help="server address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"server port (default: {DEFAULT_PORT})")
+    parser.add_argument("-c", "--clients", type=int, default=1000, help="concurrent connections (default: 1000)")
+    parser.add_argument("-n", "--rounds", type=int, default=100, help="rounds per connection (default: 100)")
+    parser.add_argument("--seed", type=int, help="seed for the clients' moves")
+
+
+def run(args):
+    """Runs ``rpsls loadtest`` and prints the report."""
+    report = asyncio.run(load_test(args.host, args.port, args.clients, args.rounds, args.seed))
+    rate = report.rounds / report.elapsed if report.elapsed > 0 else float("inf")
+    print(f"📡 {args.clients} clients x {args.rounds} rounds against {args.host}:{args.port}")
+    print(f"📊 {report.rounds:,} rounds in {report.elapsed:.2f}s ({rate:,.0f} rounds/s), {report.errors} errors")
+    print(f"⏱️  latency p50: {report.p50 * 1000:.2f} ms | p99: {report.p99 * 1000:.2f} ms | "
+          f"max: {report.max * 1000:.2f} ms")
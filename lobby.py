@@ -0,0 +1,566 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/lobby.py
+"""Player-vs-player lobby with rating-based matchmaking.
+
+``rpsls lobby`` pairs human players with each other instead of with the
+computer. Players wait in a MatchQueue: one heap per rating bucket, oldest
+player first, so joining, leaving and finding an opponent cost O(log n)
+however many players wait. A newcomer is paired with the oldest player of
+the nearest bucket within reach; the reach starts at ``base_gap`` rating
+points and widens with every second spent waiting, so nobody waits forever
+for a perfect match. A periodic sweep pairs players whose reach has grown
+since they joined. Ratings come from a RatingTable that every resolved
+round updates, so they follow the players' results.
+
+Once paired, both players have ``move_timeout`` seconds to send a move. The
+round is resolved with the game's own resolve(); a player who does not
+move in time forfeits, and a round nobody moved in is abandoned. Everything
+runs on one asyncio event loop, with timers instead of sleeping tasks.
+
+The line protocol, like ``rpsls serve``::
+
+    server: HELLO <taunt>
+    client: NAME <player>         server: OK <player> <rating>
+    client: QUEUE                 server: QUEUED <players waiting>
+                                  server: MATCHED <opponent> <rating>
+    client: <move>                server: RESULT <WIN|LOSS|TIE> <you> <opponent> <explanation>
+                                          (``-`` for a move that never came)
+                                  server: TIMEOUT <queue|move>
+    client: QUIT                  server: BYE <wins> <losses> <ties>
+
+``rpsls lobby --simulate 20000`` runs a load test instead: that many
+simulated players queue, get matched and play in-process, without sockets.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections import namedtuple
+
+from loadtest import percentile
+from ratings import DEFAULT_RATING, SYSTEMS, RatingTable
+from rockPaperScissorsLizardSpock import Action, Outcome, computer_taunts, parseAction, resolve
+
+DEFAULT_PORT = 5152
+
+LobbyReport = namedtuple("LobbyReport", ["players", "matches", "timeouts", "forfeits", "elapsed", "peak_queued",
+                                         "wait_p50", "wait_p99", "gap_p50", "gap_p99", "queue_ops", "queue_seconds"])
+LobbyReport.__doc__ = """Result of simulate(): players, rounds resolved, queue timeouts and forfeits,
+wall time, the most players queued at once, queue waits in seconds,
+rating gaps of the matches, and the count and total time of the
+MatchQueue operations."""
+
+
+class Ticket:
+    """A player waiting in a MatchQueue.
+
+    Args:
+        name (str): The player's name.
+        rating (float): The player's rating.
+        joined (float): When the player joined, in the queue's time.
+        payload: Anything the owner of the queue wants back with a match.
+    """
+
+    __slots__ = ("name", "rating", "joined", "payload", "bucket", "waiting")
+
+    def __init__(self, name, rating, joined, payload=None):
+        self.name = name
+        self.rating = rating
+        self.joined = joined
+        self.payload = payload
+        self.bucket = None
+        self.waiting = False
+
+    def __repr__(self):
+        return f"Ticket({self.name!r}, {self.rating:.0f})"
+
+
+class MatchQueue:
+    """Waiting players in rating buckets, each a heap ordered by arrival.
+
+    Leaving the queue only marks the ticket; heaps drop marked tickets when
+    they reach the top. Ratings are compared at bucket granularity.
+
+    Args:
+        bucket_width (float): Rating points per bucket.
+        base_gap (float): How far apart two fresh players' ratings may be.
+        widen_rate (float): Rating points the reach grows per second waited.
+    """
+
+    def __init__(self, bucket_width=50.0, base_gap=100.0, widen_rate=50.0):
+        self.bucket_width = bucket_width
+        self.base_gap = base_gap
+        self.widen_rate = widen_rate
+        self._buckets = {}
+        self._waiting = 0
+        self._order = itertools.count()
+        self.operations = 0
+        self.seconds = 0.0
+
+    def __len__(self):
+        return self._waiting
+
+    def reach(self, ticket, now):
+        """Returns how many buckets away a ticket's opponent may be."""
+        gap = self.base_gap + self.widen_rate * max(0.0, now - ticket.joined)
+        return int(gap // self.bucket_width)
+
+    def _head(self, bucket):
+        """Returns the oldest waiting ticket of a bucket, dropping stale ones."""
+        heap = self._buckets.get(bucket)
+        while heap and not heap[0][2].waiting:
+            heapq.heappop(heap)
+        if not heap:
+            self._buckets.pop(bucket, None)
+            return None
+        return heap[0][2]
+
+    def _take(self, ticket):
+        ticket.waiting = False
+        self._waiting -= 1
+        self._head(ticket.bucket)
+
+    def _put(self, ticket):
+        ticket.waiting = True
+        self._waiting += 1
+        heapq.heappush(self._buckets.setdefault(ticket.bucket, []), (ticket.joined, next(self._order), ticket))
+
+    def push(self, ticket):
+        """Puts a ticket in the queue."""
+        start = time.perf_counter()
+        ticket.bucket = int(ticket.rating // self.bucket_width)
+        self._put(ticket)
+        self.operations += 1
+        self.seconds += time.perf_counter() - start
+
+    def remove(self, ticket):
+        """Takes a ticket out of the queue, if it is still waiting."""
+        if ticket.waiting:
+            self._take(ticket)
+
+    def _nearest(self, ticket, reach):
+        """Returns the oldest head of the nearest non-empty bucket in reach."""
+        center = ticket.bucket if ticket.bucket is not None else int(ticket.rating // self.bucket_width)
+        # Only buckets with somebody in them count, and there are few of them.
+        reach = min(reach, max((abs(bucket - center) for bucket in self._buckets), default=0))
+        for distance in range(reach + 1):
+            heads = [head for head in {self._head(center - distance), self._head(center + distance)}
+                     if head is not None and head is not ticket]
+            if heads:
+                return min(heads, key=lambda head: head.joined)
+        return None
+
+    def match(self, ticket, now):
+        """Finds an opponent for a ticket that is not in the queue yet.
+
+        Returns:
+            Ticket: The opponent, taken out of the queue, or None; the
+                caller then usually push()es the ticket.
+        """
+        start = time.perf_counter()
+        opponent = self._nearest(ticket, self.reach(ticket, now))
+        if opponent is not None:
+            self._take(opponent)
+        self.operations += 1
+        self.seconds += time.perf_counter() - start
+        return opponent
+
+    def sweep(self, now):
+        """Pairs waiting players whose reach has grown since they joined.
+
+        Returns:
+            list[tuple]: The pairs, oldest player first, out of the queue.
+        """
+        pairs = []
+        for bucket in sorted(self._buckets):
+            while True:
+                head = self._head(bucket)
+                if head is None:
+                    break
+                self._take(head)
+                opponent = self.match(head, now)
+                if opponent is None:
+                    self._put(head)  # Back where it was: the heap orders by arrival.
+                    break
+                pairs.append((head, opponent) if head.joined <= opponent.joined else (opponent, head))
+        return pairs
+
+
+class Seat:
+    """One player's side of a Match.
+
+    Attributes:
+        match (Match): The match.
+        index (int): 0 or 1.
+        opponent (Ticket): The other player.
+    """
+
+    __slots__ = ("match", "index", "opponent")
+
+    def __init__(self, match, index):
+        self.match = match
+        self.index = index
+        self.opponent = match.tickets[1 - index]
+
+    def submit(self, action):
+        """Sends this player's move; the first one counts.
+
+        Returns:
+            bool: Whether the move was taken.
+        """
+        return self.match.submit(self.index, action)
+
+    def forfeit(self):
+        """Gives up, e.g. because the player disconnected."""
+        self.match.submit(self.index, None)
+
+    async def result(self):
+        """Waits for the round to be resolved.
+
+        Returns:
+            tuple: The Outcome, this player's Action and the opponent's
+                (None for a move that never came) and the explanation; None
+                when the round was abandoned.
+        """
+        await asyncio.shield(self.match.done)
+        return self.match.results[self.index]
+
+
+class Match:
+    """A round between two matched players, resolved when both moved.
+
+    Args:
+        tickets (tuple): The two players.
+        timeout (float): Seconds the players have to move.
+        loop (asyncio.AbstractEventLoop): The loop running the lobby.
+        on_done (callable): Called with the match once it is resolved.
+    """
+
+    def __init__(self, tickets, timeout, loop, on_done=None):
+        self.tickets = tickets
+        self.moves = [None, None]
+        self.moved = [False, False]
+        self.results = (None, None)
+        self.forfeits = 0
+        self.done = loop.create_future()
+        self.on_done = on_done
+        self._timer = loop.call_later(timeout, self._resolve)
+
+    def submit(self, index, action):
+        if self.done.done() or self.moved[index]:
+            return False
+        self.moves[index] = None if action is None else Action(action)
+        self.moved[index] = True
+        if all(self.moved):
+            self._resolve()
+        return True
+
+    def _resolve(self):
+        if self.done.done():
+            return
+        self._timer.cancel()
+        first, second = self.moves
+        if first is not None and second is not None:
+            outcome, explanation = resolve(first, second)
+            mirrored, _ = resolve(second, first)
+            self.results = ((outcome, first, second, explanation), (mirrored, second, first, explanation))
+        elif first is not None or second is not None:
+            self.forfeits = 1
+            present = 0 if first is not None else 1
+            results = [None, None]
+            results[present] = (Outcome.Win, self.moves[present], None, "Opponent forfeits")
+            results[1 - present] = (Outcome.Loss, None, self.moves[present], "You forfeit")
+            self.results = tuple(results)
+        self.done.set_result(self.results)
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+class Lobby:
+    """Matchmaking and rounds between players, on the running event loop.
+
+    Args:
+        move_timeout (float): Seconds matched players have to move.
+        queue_timeout (float): Seconds a player waits for an opponent.
+        ratings (Mapping): Player ratings by name, DEFAULT_RATING for others.
+            A RatingTable, the default, is updated after every round.
+        sweep_interval (float): Seconds between sweeps of the queue.
+        queue (MatchQueue): The queue, a default one if not given.
+    """
+
+    def __init__(self, move_timeout=10.0, queue_timeout=60.0, ratings=None, sweep_interval=0.25, queue=None):
+        self.move_timeout = move_timeout
+        self.queue_timeout = queue_timeout
+        self.ratings = ratings if ratings is not None else RatingTable()
+        self.sweep_interval = sweep_interval
+        self.queue = queue if queue is not None else MatchQueue()
+        self.matches = 0
+        self.forfeits = 0
+        self.timeouts = 0
+        self.waits = []
+        self.gaps = []
+        self.peak_queued = 0
+        self._sweeper = None
+
+    def rating(self, name):
+        """Returns a player's rating."""
+        return self.ratings.get(name, DEFAULT_RATING)
+
+    async def join(self, name, rating=None):
+        """Queues a player until an opponent is found.
+
+        Args:
+            name (str): The player's name.
+            rating (float): The rating to match by, rating() by default.
+
+        Returns:
+            Seat: The player's side of the match.
+
+        Raises:
+            TimeoutError: If no opponent was found within queue_timeout.
+        """
+        loop = asyncio.get_running_loop()
+        ticket = Ticket(name, self.rating(name) if rating is None else rating, loop.time(), loop.create_future())
+        opponent = self.queue.match(ticket, ticket.joined)
+        if opponent is not None:
+            return self._start(opponent, ticket, loop)[1]
+        self.queue.push(ticket)
+        self.peak_queued = max(self.peak_queued, len(self.queue))
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = loop.create_task(self._sweep())
+        timer = loop.call_later(self.queue_timeout, self._expire, ticket)
+        try:
+            return await ticket.payload
+        finally:
+            timer.cancel()
+            self.queue.remove(ticket)  # Cancelled or timed out: nobody may pick it any more.
+
+    def _expire(self, ticket):
+        if ticket.waiting:
+            self.queue.remove(ticket)
+            self.timeouts += 1
+            ticket.payload.set_exception(TimeoutError(f"no opponent for {ticket.name} within {self.queue_timeout}s"))
+
+    def _start(self, waiting, newcomer, loop):
+        """Starts a match; returns both seats after handing the waiting one over."""
+        now = loop.time()
+        match = Match((waiting, newcomer), self.move_timeout, loop, self._finished)
+        seats = Seat(match, 0), Seat(match, 1)
+        self.matches += 1
+        self.gaps.append(abs(waiting.rating - newcomer.rating))
+        for ticket, seat in zip((waiting, newcomer), seats):
+            self.waits.append(now - ticket.joined)
+            if not ticket.payload.done():
+                ticket.payload.set_result(seat)
+        return seats
+
+    def _finished(self, match):
+        self.forfeits += match.forfeits
+        if match.results[0] is not None and isinstance(self.ratings, RatingTable):
+            self.ratings.record(match.tickets[0].name, match.tickets[1].name, match.results[0][0])
+
+    async def _sweep(self):
+        """Pairs waiting players now and then while anybody waits."""
+        loop = asyncio.get_running_loop()
+        while len(self.queue):
+            await asyncio.sleep(self.sweep_interval)
+            for waiting, newcomer in self.queue.sweep(loop.time()):
+                self._start(waiting, newcomer, loop)
+
+    def close(self):
+        """Stops the sweeper."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+
+
+class LobbyServer:
+    """Serves the lobby's line protocol over TCP, see the module docstring.
+
+    Args:
+        lobby (Lobby): The lobby players are matched in.
+    """
+
+    def __init__(self, lobby):
+        self.lobby = lobby
+        self.connections = 0
+
+    async def _queue(self, player, writer):
+        """Waits for a match, then for its result, writing both to the client."""
+        lobby = self.lobby
+        try:
+            seat = await lobby.join(player["name"])
+        except TimeoutError:
+            writer.write(b"TIMEOUT queue\n")
+            return
+        player["seat"] = seat
+        writer.write(f"MATCHED {seat.opponent.name} {seat.opponent.rating:.0f}\n".encode())
+        result = await seat.result()
+        player["seat"] = None
+        if result is None:
+            writer.write(b"TIMEOUT move\n")
+            return
+        outcome, own, other, explanation = result
+        player[outcome] += 1
+        writer.write(f"RESULT {outcome.name.upper()} {own.name if own is not None else '-'} "
+                     f"{other.name if other is not None else '-'} {explanation}\n".encode())
+
+    async def handle(self, reader, writer):
+        """Serves one connected player."""
+        player = {"name": f"player{id(writer)}", "seat": None, Outcome.Win: 0, Outcome.Loss: 0, Outcome.Tie: 0}
+        task = None
+        self.connections += 1
+        try:
+            writer.write(f"HELLO {random.choice(computer_taunts)}\n".encode())
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = line.decode(errors="replace").strip()
+                command = request.upper()
+                if command == "QUIT":
+                    writer.write(f"BYE {player[Outcome.Win]} {player[Outcome.Loss]} {player[Outcome.Tie]}\n".encode())
+                    break
+                if command.startswith("NAME "):
+                    player["name"] = request[5:].strip()[:64] or player["name"]
+                    writer.write(f"OK {player['name']} {self.lobby.rating(player['name']):.0f}\n".encode())
+                elif command == "QUEUE":
+                    if task is not None and not task.done():
+                        writer.write(b"ERROR Already queued or playing\n")
+                    else:
+                        writer.write(f"QUEUED {len(self.lobby.queue)}\n".encode())
+                        task = asyncio.create_task(self._queue(player, writer))
+                elif player["seat"] is None:
+                    writer.write(b"ERROR Not in a match, send QUEUE first\n")
+                else:
+                    try:
+                        action = parseAction(request)
+                    except ValueError:
+                        writer.write(f"ERROR Invalid selection! Enter a value in range [0, {len(Action) - 1}]\n"
+                                     .encode())
+                    else:
+                        if not player["seat"].submit(action):
+                            writer.write(b"ERROR Move already sent\n")
+                await writer.drain()
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            if player["seat"] is not None:
+                player["seat"].forfeit()
+            if task is not None:
+                task.cancel()
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Starts listening; port 0 picks a free port."""
+        return await asyncio.start_server(self.handle, host, port, backlog=4096)
+
+
+async def _simulated_player(lobby, name, rating, rounds, rng, think):
+    for _ in range(rounds):
+        try:
+            seat = await lobby.join(name, rating)
+        except TimeoutError:
+            continue
+        await asyncio.sleep(rng.uniform(0, think))
+        seat.submit(rng.randrange(len(Action)))
+        await seat.result()
+
+
+async def simulate(players=10_000, rounds=3, seed=None, ramp=2.0, think=1.0, move_timeout=10.0,
+                   queue_timeout=60.0):
+    """Load-tests matchmaking with simulated players in this process.
+
+    Every player arrives within ``ramp`` seconds with a rating drawn around
+    DEFAULT_RATING, waits for a match, thinks for up to ``think`` seconds,
+    moves, and queues again until it played ``rounds`` rounds. Once all
+    players still playing are waiting with nobody in reach, they are sent
+    home rather than left waiting for their reach to grow.
+
+    Returns:
+        LobbyReport: Throughput, waits and the cost of matchmaking.
+    """
+    rng = random.Random(seed)
+    lobby = Lobby(move_timeout, queue_timeout)
+
+    async def arrive(index, player_rng):
+        await asyncio.sleep(player_rng.uniform(0, ramp))
+        await _simulated_player(lobby, f"sim{index}", player_rng.gauss(DEFAULT_RATING, 300), rounds, player_rng,
+                                think)
+
+    start = time.perf_counter()
+    active = {asyncio.create_task(arrive(index, random.Random(rng.getrandbits(64)))) for index in range(players)}
+    for task in active:
+        task.add_done_callback(active.discard)
+    try:
+        while active:
+            await asyncio.sleep(lobby.sweep_interval)
+            if len(active) == len(lobby.queue):
+                for task in active:
+                    task.cancel()
+                await asyncio.gather(*active, return_exceptions=True)
+    finally:
+        lobby.close()
+    elapsed = time.perf_counter() - start
+    waits = sorted(lobby.waits)
+    gaps = sorted(lobby.gaps)
+    return LobbyReport(players, lobby.matches, lobby.timeouts, lobby.forfeits, elapsed, lobby.peak_queued,
+                       percentile(waits, 0.5), percentile(waits, 0.99), percentile(gaps, 0.5), percentile(gaps, 0.99),
+                       lobby.queue.operations, lobby.queue.seconds)
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, move_timeout=10.0, queue_timeout=60.0, system="glicko2"):
+    """Runs a lobby server rating players with ``system`` until it is cancelled."""
+    lobby = Lobby(move_timeout, queue_timeout, RatingTable(system))
+    server = await LobbyServer(lobby).start(host, port)
+    address = ", ".join(str(sock.getsockname()[:2]) for sock in server.sockets)
+    print(f"🖖 Lobby for Rock-Paper-Scissors-Lizard-Spock on {address}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        lobby.close()
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls lobby`` options to an argument parser."""
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument("--move-timeout", type=float, default=10.0,
+                        help="seconds matched players have to move (default: 10)")
+    parser.add_argument("--queue-timeout", type=float, default=60.0,
+                        help="seconds a player waits for an opponent (default: 60)")
+    parser.add_argument("--rating-system", choices=SYSTEMS, default="glicko2",
+                        help="how players are rated (default: glicko2)")
+    parser.add_argument("--simulate", type=int, metavar="PLAYERS",
+                        help="instead of serving, load-test matchmaking with this many simulated players")
+    parser.add_argument("-n", "--rounds", type=int, default=3, help="rounds per simulated player (default: 3)")
+    parser.add_argument("--seed", type=int, help="seed for the simulated players")
+
+
+def run(args):
+    """Runs ``rpsls lobby``: a lobby server, or a load test with --simulate."""
+    if args.simulate is None:
+        try:
+            asyncio.run(serve(args.host, args.port, args.move_timeout, args.queue_timeout, args.rating_system))
+        except KeyboardInterrupt:
+            print("\n🖖 Live long and prosper!")
+        return
+    report = asyncio.run(simulate(args.simulate, args.rounds, args.seed, move_timeout=args.move_timeout,
+                                  queue_timeout=args.queue_timeout))
+    print(f"🎮 {report.players:,} simulated players x {args.rounds} rounds")
+    print(f"📊 {report.matches:,} matches in {report.elapsed:.2f}s "
+          f"({report.matches / report.elapsed:,.0f} matches/s), "
+          f"{report.timeouts} queue timeouts, {report.forfeits} forfeits")
+    print(f"👥 up to {report.peak_queued:,} players queued at once")
+    print(f"⏳ queue wait p50: {report.wait_p50 * 1000:.1f} ms | p99: {report.wait_p99 * 1000:.1f} ms")
+    print(f"⚖️  rating gap p50: {report.gap_p50:.0f} | p99: {report.gap_p99:.0f}")
+    each = report.queue_seconds / max(1, report.queue_ops)
+    print(f"🧮 {report.queue_ops:,} queue operations, {each * 1e6:.1f} µs each")
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/profiling.py
+"""Opt-in per-stage latency histograms for Rock-Paper-Scissors-Lizard-Spock.
+
+``rpsls --profile`` tells where the time of a game goes: reading input,
+picking the computer's move, looking up the rules, rendering, counting
+down, or sleeping. enable() wraps the functions of every stage in STAGES
+with a timer and disable() puts the originals back, so when profiling is
+off the game runs the very same functions as before and pays nothing.
+Only modules already imported are wrapped, so profiling a game does not
+load the server; a module imported later, such as ``tui`` or
+``leaderboard``, calls instrument() once its functions are defined.
+
+Times are exclusive: the sleeps inside determineWinner() count towards
+``sleep``, not ``render``. Each stage keeps a histogram with power-of-two
+buckets from 1 µs up, which is enough for percentiles and cheap to record.
+Results come as a text summary, a JSON dump and, for ``rpsls serve``, the
+Prometheus text format.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import json
+import sys
+import time
+from array import array
+from functools import wraps
+
+# Functions timed per stage: (stage, module, attribute), where the
+# attribute may name a method as ``Class.method``.
+STAGES = [
+    ("input", "rockPaperScissorsLizardSpock", "getUserSelection"),
+    ("rng", "rockPaperScissorsLizardSpock", "getComputerSelection"),
+    ("rules", "rockPaperScissorsLizardSpock", "resolve"),
+    ("render", "rockPaperScissorsLizardSpock", "determineWinner"),
+    ("render", "rockPaperScissorsLizardSpock", "showBattleScene"),
+    ("countdown", "rockPaperScissorsLizardSpock", "countDown"),
+    ("input", "tui", "decode_keys"),
+    ("session", "tui", "GameUI.start_round"),
+    ("render", "tui", "GameUI.frame"),
+    ("render", "tui", "Renderer.draw"),
+    ("sleep", "timing", "Clock.pause"),
+    ("input", "server", "parseAction"),
+    ("rules", "server", "resolve"),
+    ("session", "server", "GameSession.play"),
+    ("leaderboard", "leaderboard", "Leaderboard.record"),
+    ("leaderboard", "leaderboard", "Leaderboard.flush"),
+]
+
+# Bucket ``k`` counts durations up to 2**k microseconds; the last one is open.
+BUCKET_COUNT = 32
+BUCKET_BOUNDS = tuple(2 ** k / 1e6 for k in range(BUCKET_COUNT - 1)) + (float("inf"),)
+
+
+class Histogram:
+    """Latency histogram of one stage with power-of-two buckets."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.buckets = array("Q", bytes(8 * BUCKET_COUNT))
+
+    def record(self, seconds):
+        """Adds one duration, in seconds."""
+        self.count += 1
+        self.total += seconds
+        if seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self.buckets[min(int(seconds * 1e6).bit_length(), BUCKET_COUNT - 1)] += 1
+
+    def quantile(self, fraction):
+        """Estimates a quantile as the upper bound of its bucket.
+
+        Args:
+            fraction (float): The quantile, 0.5 for the median.
+
+        Returns:
+            float: Seconds, never above the largest recorded duration.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def to_dict(self):
+        """Returns the histogram as plain JSON-ready data."""
+        return {
+            "count": self.count,
+            "sum_seconds": self.total,
+            "min_seconds": self.minimum if self.count else 0.0,
+            "max_seconds": self.maximum,
+            "p50_seconds": self.quantile(0.5),
+            "p90_seconds": self.quantile(0.9),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": list(self.buckets),
+        }
+
+
+class Profiler:
+    """Collects one Histogram per stage and times wrapped functions."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.started = time.perf_counter()
+        # Time spent in timed calls nested inside the innermost running one.
+        self._nested = 0.0
+
+    def histogram(self, stage):
+        """Returns the histogram of a stage, creating it on first use."""
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = Histogram()
+        return histogram
+
+    def record(self, stage, seconds):
+        """Records one duration of a stage that is not a wrapped function."""
+        self.histogram(stage).record(seconds)
+
+    def timed(self, stage, function):
+        """Wraps ``function`` so that its exclusive time counts towards ``stage``."""
+        record = self.histogram(stage).record
+        clock = time.perf_counter
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            outer = self._nested
+            self._nested = 0.0
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                record(elapsed - self._nested)
+                self._nested = outer + elapsed
+
+        return wrapper
+
+    def to_dict(self):
+        """Returns every histogram as plain JSON-ready data."""
+        return {
+            "elapsed_seconds": time.perf_counter() - self.started,
+            "bucket_bounds_seconds": [bound if bound != float("inf") else "+Inf" for bound in BUCKET_BOUNDS],
+            "stages": {stage: histogram.to_dict() for stage, histogram in sorted(self.histograms.items())},
+        }
+
+    def dump(self, path):
+        """Writes to_dict() as JSON to ``path``."""
+        with open(path, "w", encoding="utf-8") as stream:
+            json.dump(self.to_dict(), stream, indent=2)
+            stream.write("\n")
+
+    def summary(self):
+        """Returns a table of every stage that ran, busiest first."""
+        stages = sorted(((stage, histogram) for stage, histogram in self.histograms.items() if histogram.count),
+                        key=lambda item: item[1].total, reverse=True)
+        total = sum(histogram.total for _, histogram in stages) or 1.0
+        lines = [
+            f"\n{'═' * 70}",
+            "⏱️  PROFILE (exclusive time per stage)",
+            f"{'═' * 70}",
+            f"{'Stage':<12}{'Calls':>8}{'Total ms':>11}{'Share':>7}{'p50 µs':>10}{'p99 µs':>11}{'Max µs':>11}",
+            f"{'─' * 70}",
+        ]
+        for stage, histogram in stages:
+            lines.append(f"{stage:<12}{histogram.count:>8}{histogram.total * 1e3:>11.2f}"
+                         f"{histogram.total / total:>7.0%}{histogram.quantile(0.5) * 1e6:>10.0f}"
+                         f"{histogram.quantile(0.99) * 1e6:>11.0f}{histogram.maximum * 1e6:>11.0f}")
+        lines.append(f"{'─' * 70}")
+        return "\n".join(lines) + "\n"
+
+    def prometheus(self, gauges=None):
+        """Renders the histograms in the Prometheus text exposition format.
+
+        Args:
+            gauges (dict): Extra ``rpsls_<name>`` gauges, name to value.
+
+        Returns:
+            str: One metric family ``rpsls_stage_seconds`` labelled by stage,
+                then the gauges.
+        """
+        lines = ["# HELP rpsls_stage_seconds Exclusive time spent per game stage.",
+                 "# TYPE rpsls_stage_seconds histogram"]
+        for stage, histogram in sorted(self.histograms.items()):
+            cumulative = 0
+            for bound, count in zip(BUCKET_BOUNDS, histogram.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'rpsls_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'rpsls_stage_seconds_sum{{stage="{stage}"}} {histogram.total!r}')
+            lines.append(f'rpsls_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE rpsls_{name} gauge")
+            lines.append(f"rpsls_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# The active profiler while enable() is in effect, otherwise None.
+PROFILER = None
+
+# (owner, attribute, original) of every function enable() replaced.
+_replaced = []
+
+# The stages given to enable(), for modules that call instrument() later.
+_stages = []
+
+
+def _resolve_target(module, attribute):
+    """Returns the object owning ``attribute`` and the attribute's own name."""
+    owner = module
+    *path, name = attribute.split(".")
+    for part in path:
+        owner = getattr(owner, part)
+    return owner, name
+
+
+def _wrap(stage, module, attribute):
+    """Replaces one function of a stage with its timed wrapper, once."""
+    owner, name = _resolve_target(module, attribute)
+    if any(wrapped is owner and wrapped_name == name for wrapped, wrapped_name, _ in _replaced):
+        return
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    setattr(owner, name, PROFILER.timed(stage, original))
+    _replaced.append((owner, name, original))
+
+
+def enable(stages=None):
+    """Starts profiling by wrapping the functions of every stage.
+
+    Args:
+        stages (list): ``(stage, module, attribute)`` triples, STAGES by
+            default.
+
+    Returns:
+        Profiler: The active profiler; the same one if already enabled.
+    """
+    global PROFILER
+    if PROFILER is not None:
+        return PROFILER
+    PROFILER = Profiler()
+    _stages[:] = STAGES if stages is None else stages
+    for stage, module_name, attribute in _stages:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            _wrap(stage, module, attribute)
+    return PROFILER
+
+
+def instrument(module_name):
+    """Wraps the stages of a module imported after enable(); does nothing when profiling is off.
+
+    Args:
+        module_name (str): The module, which calls this at its end with ``__name__``.
+    """
+    if PROFILER is None:
+        return
+    module = sys.modules[module_name]
+    for stage, stage_module, attribute in _stages:
+        if stage_module == module_name:
+            _wrap(stage, module, attribute)
+
+
+def disable():
+    """Stops profiling and puts every original function back.
+
+    Returns:
+        Profiler: The profiler that was active, with its results, or None.
+    """
+    global PROFILER
+    while _replaced:
+        owner, name, original = _replaced.pop()
+        setattr(owner, name, original)
+    _stages.clear()
+    profiler, PROFILER = PROFILER, None
+    return profiler
+
+
+def report(profiler, output=None):
+    """Prints the summary to stderr and optionally dumps the JSON results."""
+    sys.stderr.write(profiler.summary())
+    if output:
+        profiler.dump(output)
+        sys.stderr.write(f"💾 Profile written to {output}\n")
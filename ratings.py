@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/ratings.py
+"""Elo and Glicko-2 ratings for players and bots.
+
+A RatingTable keeps one row per player in flat arrays (rating, deviation,
+volatility and games played) plus a dict from name to row, so looking a
+player up is O(1) and the table can be handed to a Lobby as its ratings or
+ranked for a leaderboard. record() updates both players of one game as
+soon as it is resolved. update() and recompute() replay a whole batch of
+games, e.g. every round of a history file, in rating periods of ``period``
+games: within a period every game is scored against the ratings at its
+start, which is how Glicko-2 is defined and what lets a period be updated
+as a few whole-array operations (with NumPy if it is installed). A period
+of one game gives exactly the ratings record() would have given.
+
+Only players who played in a period are updated, so an update costs the
+same however many players the table holds; the deviation of absent
+players is not inflated.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import heapq
+import math
+import time
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+
+from simulation import numpy_or_none
+
+DEFAULT_RATING = 1500.0
+DEFAULT_DEVIATION = 350.0
+DEFAULT_VOLATILITY = 0.06
+SYSTEMS = ("glicko2", "elo")
+
+# Glicko-2 works on ratings divided by this, centred on DEFAULT_RATING.
+GLICKO2_SCALE = 400 / math.log(10)
+
+# Score of the first player by Outcome (Tie, Win, Loss).
+SCORES = (0.5, 1.0, 0.0)
+
+# Tolerance and step limit of the volatility iteration.
+_CONVERGENCE = 1e-6
+_MAX_STEPS = 100
+
+Rating = namedtuple("Rating", ["rating", "deviation", "volatility", "games"])
+Rating.__doc__ = "A player's rating, its deviation and volatility (Glicko-2 only), and games played."
+
+DEFAULT = Rating(DEFAULT_RATING, DEFAULT_DEVIATION, DEFAULT_VOLATILITY, 0)
+
+
+def _g(phi):
+    return 1 / math.sqrt(1 + 3 * phi * phi / (math.pi * math.pi))
+
+
+def _volatility(phi, sigma, delta, v, tau):
+    """New volatility by the Illinois algorithm (step 5 of Glickman's Glicko-2 paper)."""
+    a = math.log(sigma * sigma)
+
+    def f(x):
+        ex = math.exp(x)
+        return ex * (delta * delta - phi * phi - v - ex) / (2 * (phi * phi + v + ex) ** 2) - (x - a) / (tau * tau)
+
+    low = a
+    if delta * delta > phi * phi + v:
+        high = math.log(delta * delta - phi * phi - v)
+    else:
+        k = 1
+        while f(a - k * tau) < 0:
+            k += 1
+        high = a - k * tau
+    f_low, f_high = f(low), f(high)
+    for _ in range(_MAX_STEPS):
+        if abs(high - low) <= _CONVERGENCE:
+            break
+        step = low + (low - high) * f_low / (f_high - f_low)
+        f_step = f(step)
+        if f_step * f_high <= 0:
+            low, f_low = high, f_high
+        else:
+            f_low /= 2
+        high, f_high = step, f_step
+    return math.exp(low / 2)
+
+
+def _glicko2_player(mu, phi, sigma, games, tau):
+    """One player's rating period on the Glicko-2 scale.
+
+    Args:
+        mu, phi, sigma (float): The player's rating, deviation and volatility.
+        games (iterable): ``(mu, phi, score)`` of the opponent of every game.
+        tau (float): The system constant.
+
+    Returns:
+        tuple: The new mu, phi and sigma.
+    """
+    inverse_v = total = 0.0
+    for opponent_mu, opponent_phi, score in games:
+        g = _g(opponent_phi)
+        expected = 1 / (1 + math.exp(-g * (mu - opponent_mu)))
+        inverse_v += g * g * expected * (1 - expected)
+        total += g * (score - expected)
+    v = 1 / inverse_v
+    sigma = _volatility(phi, sigma, v * total, v, tau)
+    phi = 1 / math.sqrt(1 / (phi * phi + sigma * sigma) + inverse_v)
+    return mu + phi * phi * total, phi, sigma
+
+
+def _elo_expected(rating, opponent):
+    return 1 / (1 + 10 ** ((opponent - rating) / 400))
+
+
+def _elo_period(columns, firsts, seconds, scores, k):
+    """Elo update of one period, game by game in pure Python."""
+    rating = columns[0]
+    changes = {}
+    for first, second, score in zip(firsts, seconds, scores):
+        change = k * (score - _elo_expected(rating[first], rating[second]))
+        changes[first] = changes.get(first, 0.0) + change
+        changes[second] = changes.get(second, 0.0) - change
+    for row, change in changes.items():
+        rating[row] += change
+
+
+def _glicko2_period(columns, firsts, seconds, scores, tau):
+    """Glicko-2 update of one period, player by player in pure Python."""
+    rating, deviation, volatility = columns
+    games = {}
+    for first, second, score in zip(firsts, seconds, scores):
+        games.setdefault(first, []).append((second, score))
+        games.setdefault(second, []).append((first, 1 - score))
+    scaled = {row: ((rating[row] - DEFAULT_RATING) / GLICKO2_SCALE, deviation[row] / GLICKO2_SCALE)
+              for row in games}
+    for row, played in games.items():
+        mu, phi = scaled[row]
+        mu, phi, volatility[row] = _glicko2_player(mu, phi, volatility[row],
+                                                   [(*scaled[opponent], score) for opponent, score in played], tau)
+        rating[row] = mu * GLICKO2_SCALE + DEFAULT_RATING
+        deviation[row] = phi * GLICKO2_SCALE
+
+
+def _elo_period_numpy(np, columns, firsts, seconds, scores, k):
+    """Elo update of one period on whole NumPy columns."""
+    rating = columns[0]
+    change = k * (scores - 1 / (1 + 10 ** ((rating[seconds] - rating[firsts]) / 400)))
+    rows, inverse = np.unique(np.concatenate((firsts, seconds)), return_inverse=True)
+    rating[rows] += np.bincount(inverse, np.concatenate((change, -change)), len(rows))
+
+
+def _volatility_numpy(np, phi, sigma, delta, v, tau):
+    """_volatility() for many players at once."""
+    a = np.log(sigma * sigma)
+
+    def f(x):
+        ex = np.exp(x)
+        return ex * (delta * delta - phi * phi - v - ex) / (2 * (phi * phi + v + ex) ** 2) - (x - a) / (tau * tau)
+
+    excess = delta * delta - phi * phi - v
+    k = np.ones_like(a)
+    searching = excess <= 0
+    while True:
+        short = searching & (f(a - k * tau) < 0)
+        if not short.any():
+            break
+        k += short
+    low = a
+    high = np.where(searching, a - k * tau, np.log(np.where(searching, 1.0, excess)))
+    f_low, f_high = f(low), f(high)
+    for _ in range(_MAX_STEPS):
+        active = np.abs(high - low) > _CONVERGENCE
+        if not active.any():
+            break
+        with np.errstate(invalid="ignore", divide="ignore"):
+            step = np.where(active, low + (low - high) * f_low / (f_high - f_low), high)
+        f_step = f(step)
+        swap = active & (f_step * f_high <= 0)
+        low, f_low = np.where(swap, high, low), np.where(swap, f_high, np.where(active, f_low / 2, f_low))
+        high, f_high = np.where(active, step, high), np.where(active, f_step, f_high)
+    return np.exp(low / 2)
+
+
+def _glicko2_period_numpy(np, columns, firsts, seconds, scores, tau):
+    """Glicko-2 update of one period on whole NumPy columns."""
+    rating, deviation, volatility = columns
+    rows, inverse = np.unique(np.concatenate((firsts, seconds)), return_inverse=True)
+    mu = (rating[rows] - DEFAULT_RATING) / GLICKO2_SCALE
+    phi = deviation[rows] / GLICKO2_SCALE
+    sigma = volatility[rows]
+    # Every game seen from both sides: the player, the opponent and the player's score.
+    half = len(firsts)
+    players = inverse
+    opponents = np.concatenate((inverse[half:], inverse[:half]))
+    score = np.concatenate((scores, 1 - scores))
+    g = 1 / np.sqrt(1 + 3 * phi[opponents] ** 2 / math.pi ** 2)
+    expected = 1 / (1 + np.exp(-g * (mu[players] - mu[opponents])))
+    inverse_v = np.bincount(players, g * g * expected * (1 - expected), len(rows))
+    total = np.bincount(players, g * (score - expected), len(rows))
+    v = 1 / inverse_v
+    sigma = _volatility_numpy(np, phi, sigma, v * total, v, tau)
+    phi = 1 / np.sqrt(1 / (phi * phi + sigma * sigma) + inverse_v)
+    rating[rows] = (mu + phi * phi * total) * GLICKO2_SCALE + DEFAULT_RATING
+    deviation[rows] = phi * GLICKO2_SCALE
+    volatility[rows] = sigma
+
+
+class RatingTable(Mapping):
+    """Ratings of named players, a read-only mapping from name to rating.
+
+    Args:
+        system (str): "glicko2" or "elo".
+        k (float): The Elo K-factor, the most one game can move a rating.
+        tau (float): The Glicko-2 system constant; smaller values keep
+            volatilities from changing much.
+
+    Raises:
+        ValueError: For an unknown rating system.
+    """
+
+    def __init__(self, system="glicko2", k=32.0, tau=0.5):
+        if system not in SYSTEMS:
+            raise ValueError(f"unknown rating system {system!r}, expected one of {', '.join(SYSTEMS)}")
+        self.system = system
+        self.k = k
+        self.tau = tau
+        self._rows = {}
+        self._names = []
+        self._rating = array("d")
+        self._deviation = array("d")
+        self._volatility = array("d")
+        self._games = array("q")
+
+    def __getitem__(self, name):
+        return self._rating[self._rows[name]]
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def row(self, name):
+        """Returns the row of a player, adding them at the default rating on first use."""
+        row = self._rows.get(name)
+        if row is None:
+            row = self._rows[name] = len(self._names)
+            self._names.append(name)
+            self._rating.append(DEFAULT_RATING)
+            self._deviation.append(DEFAULT_DEVIATION)
+            self._volatility.append(DEFAULT_VOLATILITY)
+            self._games.append(0)
+        return row
+
+    def entry(self, name):
+        """Returns the full Rating of a player; DEFAULT for unknown players."""
+        row = self._rows.get(name)
+        if row is None:
+            return DEFAULT
+        return Rating(self._rating[row], self._deviation[row], self._volatility[row], self._games[row])
+
+    def set(self, name, rating, deviation=DEFAULT_DEVIATION, volatility=DEFAULT_VOLATILITY, games=0):
+        """Sets a player's rating, e.g. one loaded from storage."""
+        row = self.row(name)
+        self._rating[row] = rating
+        self._deviation[row] = deviation
+        self._volatility[row] = volatility
+        self._games[row] = games
+
+    def record(self, first, second, outcome):
+        """Updates both players right after one game.
+
+        Args:
+            first (str): One player.
+            second (str): The other player.
+            outcome (Outcome): The result for the first player.
+        """
+        a, b = self.row(first), self.row(second)
+        score = SCORES[outcome]
+        rating = self._rating
+        if self.system == "elo":
+            change = self.k * (score - _elo_expected(rating[a], rating[b]))
+            rating[a] += change
+            rating[b] -= change
+        else:
+            deviation, volatility = self._deviation, self._volatility
+            mu_a, phi_a = (rating[a] - DEFAULT_RATING) / GLICKO2_SCALE, deviation[a] / GLICKO2_SCALE
+            mu_b, phi_b = (rating[b] - DEFAULT_RATING) / GLICKO2_SCALE, deviation[b] / GLICKO2_SCALE
+            new_a = _glicko2_player(mu_a, phi_a, volatility[a], [(mu_b, phi_b, score)], self.tau)
+            new_b = _glicko2_player(mu_b, phi_b, volatility[b], [(mu_a, phi_a, 1 - score)], self.tau)
+            for row, (mu, phi, sigma) in ((a, new_a), (b, new_b)):
+                rating[row] = mu * GLICKO2_SCALE + DEFAULT_RATING
+                deviation[row] = phi * GLICKO2_SCALE
+                volatility[row] = sigma
+        self._games[a] += 1
+        self._games[b] += 1
+
+    def update(self, firsts, seconds, outcomes, period=1000):
+        """Applies a batch of games in rating periods, see the module docstring.
+
+        Args:
+            firsts (sequence): Row (see row()) of the first player of every game.
+            seconds (sequence): Row of the second player of every game.
+            outcomes (sequence): Outcome of every game for its first player.
+            period (int): Games per rating period.
+
+        Raises:
+            ValueError: For sequences of different lengths or a period below one.
+        """
+        count = len(firsts)
+        if len(seconds) != count or len(outcomes) != count:
+            raise ValueError("firsts, seconds and outcomes must be equally long")
+        if period < 1:
+            raise ValueError("a rating period holds at least one game")
+        np = numpy_or_none()
+        if np is None:
+            kernel, parameter = (_elo_period, self.k) if self.system == "elo" else (_glicko2_period, self.tau)
+            columns = self._rating, self._deviation, self._volatility
+            scores = [SCORES[outcome] for outcome in outcomes]
+            for start in range(0, count, period):
+                kernel(columns, firsts[start:start + period], seconds[start:start + period],
+                       scores[start:start + period], parameter)
+            for row in list(firsts) + list(seconds):
+                self._games[row] += 1
+            return
+        kernel, parameter = ((_elo_period_numpy, self.k) if self.system == "elo"
+                             else (_glicko2_period_numpy, self.tau))
+        columns = [np.array(column, dtype=float) for column in (self._rating, self._deviation, self._volatility)]
+        firsts = np.asarray(firsts, dtype=np.intp)
+        seconds = np.asarray(seconds, dtype=np.intp)
+        scores = np.array(SCORES)[np.asarray(outcomes, dtype=np.intp)]
+        for start in range(0, count, period):
+            stop = start + period
+            kernel(np, columns, firsts[start:stop], seconds[start:stop], scores[start:stop], parameter)
+        for target, column in zip((self._rating, self._deviation, self._volatility), columns):
+            target[:] = array("d", column.tobytes())
+        games = np.array(self._games, dtype=np.int64)
+        games += np.bincount(np.concatenate((firsts, seconds)), minlength=len(games))
+        self._games[:] = array("q", games.tobytes())
+
+    def reset(self):
+        """Puts every known player back to the default rating."""
+        size = len(self._names)
+        self._rating[:] = array("d", [DEFAULT_RATING]) * size
+        self._deviation[:] = array("d", [DEFAULT_DEVIATION]) * size
+        self._volatility[:] = array("d", [DEFAULT_VOLATILITY]) * size
+        self._games[:] = array("q", [0]) * size
+
+    def recompute(self, firsts, seconds, outcomes, period=1000):
+        """Rates every player from scratch on a batch of games, see update()."""
+        self.reset()
+        self.update(firsts, seconds, outcomes, period)
+
+    def top(self, k=10):
+        """Returns the ``k`` best rated players.
+
+        Returns:
+            list[tuple]: ``(name, Rating)`` pairs, best player first.
+        """
+        rows = heapq.nlargest(k, range(len(self._names)), key=self._rating.__getitem__)
+        return [(self._names[row], self.entry(self._names[row])) for row in rows]
+
+
+def from_history(store, system="glicko2", period=1000, opponent="computer", **options):
+    """Rates the players of a HistoryStore from its uncompacted rounds.
+
+    Every round is a game between the player (named by their id) and the
+    computer, which is rated as one more player.
+
+    Args:
+        store (HistoryStore): The history to replay.
+        system (str): "glicko2" or "elo".
+        period (int): Games per rating period.
+        opponent (str): Name the computer is rated under.
+        **options: ``k`` or ``tau``, see RatingTable.
+
+    Returns:
+        RatingTable: The ratings after the last round.
+    """
+    table = RatingTable(system, **options)
+    computer = table.row(opponent)
+    np = numpy_or_none()
+    columns = list(store.player_outcomes())
+    if np is not None:
+        players = np.concatenate([players for players, _ in columns]) if columns else np.zeros(0, np.uint32)
+        outcomes = np.concatenate([outcomes for _, outcomes in columns]) if columns else np.zeros(0, np.uint8)
+        ids, inverse = np.unique(players, return_inverse=True)
+        rows = np.array([table.row(int(player)) for player in ids], dtype=np.intp)
+        table.update(rows[inverse], np.full(len(players), computer, dtype=np.intp), outcomes, period)
+    else:
+        firsts, outcomes = array("q"), bytearray()
+        for players, segment_outcomes in columns:
+            firsts.extend(table.row(player) for player in players)
+            outcomes += segment_outcomes
+        table.update(firsts, array("q", [computer]) * len(firsts), outcomes, period)
+    return table
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls ratings`` options to an argument parser."""
+    parser.add_argument("path", help="history file, as given to rpsls --history")
+    parser.add_argument("--system", choices=SYSTEMS, default="glicko2", help="rating system (default: glicko2)")
+    parser.add_argument("--period", type=int, default=1000, help="games per rating period (default: 1000)")
+    parser.add_argument("--k-factor", type=float, default=32.0, help="Elo K-factor (default: 32)")
+    parser.add_argument("--tau", type=float, default=0.5, help="Glicko-2 system constant (default: 0.5)")
+    parser.add_argument("-k", "--top", type=int, default=10, help="number of players to show (default: 10)")
+
+
+def run(args):
+    """Runs ``rpsls ratings``: recomputes the ratings of a history and prints the best players."""
+    from history import HistoryStore
+
+    with HistoryStore(args.path) as store:
+        start = time.perf_counter()
+        table = from_history(store, args.system, args.period, k=args.k_factor, tau=args.tau)
+        elapsed = time.perf_counter() - start
+    games = table.entry("computer").games
+    print(f"\n{'═' * 70}")
+    print(f"📈 RATINGS ({args.system}, {games:,} games in {elapsed:.2f}s)")
+    print(f"{'═' * 70}")
+    print(f"{'#':>3}  {'Player':<30}{'Rating':>12}{'Deviation':>12}{'Games':>12}")
+    print(f"{'─' * 70}")
+    for place, (name, rating) in enumerate(table.top(args.top), start=1):
+        deviation = f"{rating.deviation:.0f}" if args.system == "glicko2" else "-"
+        print(f"{place:>3}  {str(name):<30}{rating.rating:>12.0f}{deviation:>12}{rating.games:>12}")
+    print(f"{'─' * 70}\n")
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/replay.py
+"""Recording and replay of interactive sessions.
+
+``rpsls --record session.rec`` writes down everything needed to play a
+session again: the seed, which fixes the computer's moves and the taunts
+and quotes, and one byte per event:
+
+    0-24    a round, ``user * 5 + computer`` as in ``rpsls stream --packed``
+    254     the player quit (the goodbye screen was shown)
+    255     an invalid selection
+
+after a 24-byte header holding a magic number, the format version, whether
+the countdown was shown, and the seed. A million rounds take a megabyte.
+
+``rpsls replay session.rec`` runs the recording through main() again, with
+the recorded answers and moves, and so prints exactly what the game
+printed (as with piped input: prompts without the typed answers).
+``--summary`` skips the rendering and only counts outcomes straight from
+the bytes, which takes milliseconds for a million rounds.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import builtins
+import math
+import random
+import struct
+import sys
+from collections import namedtuple
+
+import rockPaperScissorsLizardSpock as game
+from simulation import OUTCOME_TRANSLATION, Tally
+from strategies import Strategy
+from timing import Clock
+
+MAGIC = b"RPSLSREC"
+VERSION = 1
+HEADER = struct.Struct("<8sHBxqxxxx")
+FINISHED = 254
+INVALID = 255
+
+# Header flags.
+COUNTDOWN = 1
+
+# The header stores the seed as a signed 64-bit integer.
+SEED_RANGE = range(-1 << 63, 1 << 63)
+
+Recording = namedtuple("Recording", ["seed", "countdown", "events"])
+Recording.__doc__ = "A recorded session: its seed, whether the countdown was shown, and the event bytes."
+
+Summary = namedtuple("Summary", ["rounds", "tally", "invalid", "finished"])
+Summary.__doc__ = "Counts of a recording, see summarize()."
+
+
+class RecordingError(Exception):
+    """Raised for files that are not session recordings."""
+
+
+class SessionRecorder:
+    """Writes a session recording, see the module docstring for the format.
+
+    Args:
+        path (str): The recording to create; an existing file is replaced.
+        seed (int): The session seed, as given to the opponent and flavor RNG.
+        countdown (bool): Whether the game shows the countdown, i.e. its
+            clock is not fast.
+        buffer_size (int): Events buffered before they are written out.
+
+    Raises:
+        ValueError: If the seed does not fit in the header.
+    """
+
+    def __init__(self, path, seed, countdown=True, buffer_size=4096):
+        if seed not in SEED_RANGE:
+            raise ValueError(f"a recorded seed must be in range [{SEED_RANGE.start}, {SEED_RANGE.stop - 1}]")
+        self._stream = open(path, "wb")
+        self._stream.write(HEADER.pack(MAGIC, VERSION, COUNTDOWN if countdown else 0, seed))
+        self._events = bytearray()
+        self.buffer_size = buffer_size
+
+    def append(self, user, computer):
+        """Records one round."""
+        self._events.append(user * game.ACTION_COUNT + computer)
+        if len(self._events) >= self.buffer_size:
+            self.flush()
+
+    def invalid(self):
+        """Records an invalid selection."""
+        self._events.append(INVALID)
+
+    def finish(self):
+        """Records that the player quit."""
+        self._events.append(FINISHED)
+
+    def flush(self):
+        """Writes the recorded events out."""
+        self._stream.write(self._events)
+        self._stream.flush()
+        self._events.clear()
+
+    def close(self):
+        if not self._stream.closed:
+            self.flush()
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_recording(path):
+    """Reads a recording.
+
+    Returns:
+        Recording: The seed, the countdown flag and the event bytes.
+
+    Raises:
+        RecordingError: If the file is not a session recording.
+    """
+    with open(path, "rb") as stream:
+        data = stream.read()
+    if len(data) < HEADER.size:
+        raise RecordingError(f"{path} is too short to be a session recording")
+    magic, version, flags, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise RecordingError(f"{path} is not a version {VERSION} session recording")
+    events = data[HEADER.size:]
+    pairs = game.ACTION_COUNT * game.ACTION_COUNT
+    if events.translate(None, bytes(range(pairs)) + bytes([FINISHED, INVALID])):
+        raise RecordingError(f"{path} holds events that are not rounds")
+    return Recording(seed, bool(flags & COUNTDOWN), events)
+
+
+def summarize(recording):
+    """Counts rounds and outcomes without replaying anything.
+
+    Returns:
+        Summary: Rounds, the player's Tally, invalid selections and whether
+            the player quit properly.
+    """
+    events = recording.events
+    rounds = events.translate(None, bytes([FINISHED, INVALID]))
+    outcomes = rounds.translate(OUTCOME_TRANSLATION)
+    wins = outcomes.count(game.Outcome.Win)
+    losses = outcomes.count(game.Outcome.Loss)
+    return Summary(len(rounds), Tally(wins, losses, len(rounds) - wins - losses),
+                   events.count(INVALID), FINISHED in events)
+
+
+class _RecordedMoves(Strategy):
+    """Plays the computer's recorded moves back."""
+
+    name = "recorded"
+
+    def __init__(self, moves):
+        super().__init__()
+        self.move = iter(moves).__next__
+
+
+def _answers(events):
+    """Turns events into the answers the player typed, in order."""
+    answers = []
+    for event in events:
+        if event == INVALID:
+            answers.append("?")
+        elif event == FINISHED:
+            answers[-1] = "n"
+        else:
+            answers += [str(event // game.ACTION_COUNT), "y"]
+    return answers
+
+
+def replay_session(recording, speed=math.inf):
+    """Plays a recording through main() again, printing what it printed.
+
+    Args:
+        recording (Recording): The session, see read_recording().
+        speed (float): Pace of the replay; by default it does not wait,
+            but still shows the countdown if the session did.
+    """
+    answers = iter(_answers(recording.events))
+    moves = [event % game.ACTION_COUNT for event in recording.events if event < FINISHED]
+
+    def answer(prompt=""):
+        # Like input() reading from a pipe: the prompt is written, the answer is not.
+        sys.stdout.write(prompt)
+        try:
+            return next(answers)
+        except StopIteration:
+            raise EOFError from None
+
+    if not recording.countdown:
+        clock = Clock(math.inf)
+    elif speed == math.inf:
+        clock = Clock(sleep=lambda _seconds: None)
+    else:
+        clock = Clock(speed)
+    original = builtins.input
+    builtins.input = answer
+    try:
+        game.main(_RecordedMoves(moves), clock, rng=random.Random(f"{recording.seed}/flavor"))
+    except EOFError:
+        pass  # The session ended without the player quitting, and so does the replay.
+    finally:
+        builtins.input = original
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls replay`` options to an argument parser."""
+    parser.add_argument("path", help="recording made with rpsls --record")
+    parser.add_argument("--summary", action="store_true", help="only count the outcomes, do not render")
+
+
+def run(args):
+    """Runs ``rpsls replay``, paced by ``rpsls --speed`` like the game."""
+    try:
+        recording = read_recording(args.path)
+    except (OSError, RecordingError) as error:
+        sys.exit(f"❌ {error}")
+    if not args.summary:
+        replay_session(recording, args.speed)
+        return
+    summary = summarize(recording)
+    tally = summary.tally
+    print(f"🎬 {args.path}: seed {recording.seed}, {summary.rounds:,} rounds, "
+          f"{summary.invalid:,} invalid selections{'' if summary.finished else ', unfinished'}")
+    print(f"📊 SCORE: Wins: {tally.wins} | Losses: {tally.losses} | Ties: {tally.ties}")
@@ -11,10 +11,11 @@ Creation Date: 10/24/2021
 Last Updated: 10/13/2025
 """
 
+import math
 import random
-import time
+import sys
 from enum import IntEnum
-from ascii_images import AsciiArt  # Import our cool ASCII art module
+from timing import Clock, parseSpeed, speedFromEnvironment
 
 
 class Action(IntEnum):
@@ -25,8 +26,22 @@ class Action(IntEnum):
     Spock = 4
 
 
+# Number of actions; len() of an Enum class is slow enough to matter per round
+ACTION_COUNT = len(Action)
+
+
+class Outcome(IntEnum):
+    """Result of a round from the point of view of the first player."""
+    Tie = 0
+    Win = 1
+    Loss = 2
+
+
 delayA = float(1.0)
 
+# Clock pacing the game's pauses unless a function is handed another one
+gameClock = Clock()
+
 # The sacred rules as decreed by Sheldon Cooper
 victories = {
     Action.Scissors: [Action.Lizard, Action.Paper],
@@ -50,6 +65,50 @@ victory_explanations = {
     (Action.Rock, Action.Scissors): "Rock crushes scissors"
 }
 
+
+def _buildResolutionTables():
+    """Flattens ``victories`` and ``victory_explanations`` into lookup tables.
+
+    Returns:
+        tuple: Two 25-entry tuples indexed by ``user * 5 + computer``: the
+            Outcome of every pairing and the explanation of who beat whom
+            (empty for ties).
+    """
+    outcomes = []
+    explanations = []
+    for userAction in Action:
+        for computerAction in Action:
+            if userAction == computerAction:
+                outcomes.append(Outcome.Tie)
+                explanations.append("")
+            elif computerAction in victories[userAction]:
+                outcomes.append(Outcome.Win)
+                explanations.append(victory_explanations[(userAction, computerAction)])
+            else:
+                outcomes.append(Outcome.Loss)
+                explanations.append(victory_explanations[(computerAction, userAction)])
+    return tuple(outcomes), tuple(explanations)
+
+
+# Precomputed outcome and explanation of every (user, computer) pairing
+OUTCOME_TABLE, EXPLANATION_TABLE = _buildResolutionTables()
+
+
+def resolve(userAction, computerAction):
+    """Resolves a round with a single table lookup.
+
+    Args:
+        userAction (Action): The action selected by the user.
+        computerAction (Action): The action selected by the computer.
+
+    Returns:
+        tuple: The Outcome for the user and the explanation of the winning
+            move ("" for a tie).
+    """
+    index = userAction * ACTION_COUNT + computerAction
+    return OUTCOME_TABLE[index], EXPLANATION_TABLE[index]
+
+
 # Snarky computer taunts (Sheldon-style)
 computer_taunts = [
     "Bazinga! Prepare to be defeated!",
@@ -87,10 +146,51 @@ tie_quotes = [
 ]
 
 
+def loadArt():
+    """Imports our cool ASCII art module the first time art is shown.
+
+    The game logic never needs the art, so the simulator, tournaments and
+    the server run without ever importing ``ascii_images``. Once loaded,
+    ``AsciiArt`` and ``ACTION_ART`` are ordinary globals of this module.
+
+    Returns:
+        type: The AsciiArt class.
+    """
+    global AsciiArt, ACTION_ART
+    if "AsciiArt" not in globals():
+        from ascii_images import AsciiArt
+        ACTION_ART = {
+            Action.Rock: AsciiArt.ROCK,
+            Action.Paper: AsciiArt.PAPER,
+            Action.Scissors: AsciiArt.SCISSORS,
+            Action.Lizard: AsciiArt.LIZARD,
+            Action.Spock: AsciiArt.SPOCK
+        }
+    return AsciiArt
+
+
+def actionArt(action):
+    """Returns the ASCII art of an action, or "" if there is none.
+
+    Args:
+        action (Action): The action to draw.
+    """
+    loadArt()
+    return ACTION_ART.get(action, "")
+
+
+def __getattr__(name):
+    """Loads the art on first access to ``AsciiArt`` or ``ACTION_ART``."""
+    if name in ("AsciiArt", "ACTION_ART"):
+        loadArt()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def printBanner():
     """Prints an epic ASCII banner for the game."""
     print("\n" + "=" * 70)
-    print(AsciiArt.GAME_TITLE)
+    print(loadArt().GAME_TITLE)
     print("=" * 70)
     print("                    As seen on 'The Big Bang Theory'!")
     print("\nScissors cuts Paper. Paper covers Rock. Rock crushes Lizard.")
@@ -106,14 +206,24 @@ def showActionArt(action):
     Args:
         action (Action): The action to display art for.
     """
-    art_map = {
-        Action.Rock: AsciiArt.ROCK,
-        Action.Paper: AsciiArt.PAPER,
-        Action.Scissors: AsciiArt.SCISSORS,
-        Action.Lizard: AsciiArt.LIZARD,
-        Action.Spock: AsciiArt.SPOCK
-    }
-    print(art_map.get(action, ""))
+    print(actionArt(action))
+
+
+def battleSceneText(winner_action, loser_action):
+    """Returns the framed battle scene between two actions.
+
+    Args:
+        winner_action (Action): The winning action.
+        loser_action (Action): The losing action.
+
+    Returns:
+        str: The scene exactly as showBattleScene() prints it, or "" if
+            there is no art for this pairing.
+    """
+    battle_art = loadArt().BATTLE_SCENES.get((winner_action, loser_action), "")
+    if not battle_art:
+        return ""
+    return f"\n{'~' * 70}\n{battle_art}\n{'~' * 70}\n\n"
 
 
 def showBattleScene(winner_action, loser_action):
@@ -123,100 +233,194 @@ def showBattleScene(winner_action, loser_action):
         winner_action (Action): The winning action.
         loser_action (Action): The losing action.
     """
-    battle_key = (winner_action, loser_action)
-    battle_art = AsciiArt.BATTLE_SCENES.get(battle_key, "")
-    if battle_art:
-        print("\n" + "~" * 70)
-        print(battle_art)
-        print("~" * 70 + "\n")
+    battle_text = battleSceneText(winner_action, loser_action)
+    if battle_text:
+        sys.stdout.write(battle_text)
+
+
+def countDown(clock=None):
+    """Prints a countdown sequence to build suspense before revealing results.
 
+    Args:
+        clock (Clock): Paces the countdown, ``gameClock`` by default. A fast
+            clock skips the countdown altogether.
+    """
+    clock = clock if clock is not None else gameClock
+    if clock.fast:
+        return
 
-def countDown():
-    """Prints a countdown sequence to build suspense before revealing results."""
     countdown_items = ["**Rock**", "**Paper**", "**Scissors**", "**Lizard**", "**Spock**"]
 
     for item in countdown_items:
         print(item)
-        time.sleep(delayA * 0.6)
+        clock.pause(delayA * 0.6)
 
     print("\n💥 SHOOT! 💥\n")
-    time.sleep(delayA * 0.5)
+    clock.pause(delayA * 0.5)
 
 
-def getUserSelection():
+def getUserSelection(rng=None):
     """Prompts the user for their action and returns it.
 
+    Args:
+        rng (random.Random): Picks the taunt, the ``random`` module by
+            default; a seeded one makes the session reproducible.
+
     Returns:
         Action: The user's selected action as an Action enum member.
     """
+    rng = rng if rng is not None else random
     choices = [f"{action.name}[{action.value}]" for action in Action]
     choicesStr = ", ".join(choices)
-    print(f"\n🎮 {random.choice(computer_taunts)}")
+    print(f"\n🎮 {rng.choice(computer_taunts)}")
     selection = int(input(f"\n👉 Enter your choice ({choicesStr}): "))
     action = Action(selection)
     return action
 
 
-def getComputerSelection():
+def parseAction(text):
+    """Parses a move given as its number ("4") or its name ("Spock").
+
+    Args:
+        text (str): The move as typed by a player.
+
+    Returns:
+        Action: The matching Action enum member.
+
+    Raises:
+        ValueError: If the text names no action.
+    """
+    text = text.strip()
+    if text.isdigit():
+        return Action(int(text))
+    try:
+        return Action[text.capitalize()]
+    except KeyError:
+        raise ValueError(f"Unknown action: {text!r}") from None
+
+
+def getComputerSelection(strategy=None):
     """Generates a random action for the computer.
 
+    Args:
+        strategy (Strategy): Optional strategy to pick the move instead of a
+            ``random.randint()`` choice. cli() always passes one, by default
+            a UniformStrategy drawing from a batched MoveGenerator.
+
     Returns:
         Action: The computer's randomly selected action as an Action enum member.
     """
-    selection = random.randint(0, len(Action) - 1)
+    if strategy is not None:
+        return Action(strategy.move())
+    selection = random.randint(0, ACTION_COUNT - 1)
     action = Action(selection)
     return action
 
 
-def determineWinner(userAction, computerAction):
+def _buildRoundFrames(userAction, computerAction):
+    """Renders everything determineWinner() prints for one pairing.
+
+    Returns:
+        tuple: The user's block, the computer's block, and the result block
+            split around its only variable part, the random quote.
+    """
+    userBlock = (f"\n{'═' * 70}\n"
+                 f"              🧑 YOU CHOSE: {userAction.name.upper()}\n"
+                 f"{'═' * 70}\n"
+                 f"{actionArt(userAction)}\n")
+    computerBlock = (f"\n{'═' * 70}\n"
+                     f"           🤖 COMPUTER CHOSE: {computerAction.name.upper()}\n"
+                     f"{'═' * 70}\n"
+                     f"{actionArt(computerAction)}\n")
+
+    outcome, explanation = resolve(userAction, computerAction)
+    if outcome == Outcome.Tie:
+        resultHead = f"\n{'─' * 70}\n{loadArt().TIE_SCENE}\n"
+        resultTail = f"\nBoth players selected {userAction.name}. It's a tie!\n"
+    elif outcome == Outcome.Win:
+        resultHead = (f"{battleSceneText(userAction, computerAction)}{'─' * 70}\n"
+                      f"⚔️  {explanation.upper()}! ⚔️\n")
+        resultTail = f"\n🎯 {userAction.name} beats {computerAction.name}! YOU WIN! 🎯\n"
+    else:
+        resultHead = (f"{battleSceneText(computerAction, userAction)}{'─' * 70}\n"
+                      f"💥 {explanation.upper()}! 💥\n")
+        resultTail = f"\n😢 {computerAction.name} beats {userAction.name}! YOU LOSE! 😢\n"
+    resultTail += f"{'─' * 70}\n\n"
+    return userBlock, computerBlock, resultHead, resultTail
+
+
+# Pre-rendered output of every (user, computer) pairing, filled on first use
+_roundFrames = [None] * (ACTION_COUNT * ACTION_COUNT)
+
+# Quotes for each Outcome, indexed by its value
+_outcomeQuotes = (tie_quotes, victory_quotes, defeat_quotes)
+
+
+def roundFrames(userAction, computerAction):
+    """Returns the cached output of a round, rendering it on first use.
+
+    Args:
+        userAction (Action): The action selected by the user.
+        computerAction (Action): The action selected by the computer.
+
+    Returns:
+        tuple: See _buildRoundFrames().
+    """
+    index = userAction * ACTION_COUNT + computerAction
+    frames = _roundFrames[index]
+    if frames is None:
+        frames = _roundFrames[index] = _buildRoundFrames(Action(userAction), Action(computerAction))
+    return frames
+
+
+def determineWinner(userAction, computerAction, clock=None, rng=None):
     """Determines and prints the winner of the round with dramatic flair.
 
+    The output of each pairing is rendered once and then written in one go
+    per dramatic pause, rather than line by line.
+
     Args:
         userAction (Action): The action selected by the user.
         computerAction (Action): The action selected by the computer.
+        clock (Clock): Paces the reveal, ``gameClock`` by default.
+        rng (random.Random): Picks the quote, the ``random`` module by default.
+
+    Returns:
+        Outcome: The result of the round for the user.
     """
-    print(f"\n{'═' * 70}")
-    print(f"              🧑 YOU CHOSE: {userAction.name.upper()}")
-    print(f"{'═' * 70}")
-    showActionArt(userAction)
-
-    time.sleep(delayA * 0.8)
-
-    print(f"\n{'═' * 70}")
-    print(f"           🤖 COMPUTER CHOSE: {computerAction.name.upper()}")
-    print(f"{'═' * 70}")
-    showActionArt(computerAction)
-
-    time.sleep(delayA * 0.8)
-
-    defeats = victories[userAction]
-
-    if userAction == computerAction:
-        print(f"\n{'─' * 70}")
-        print(AsciiArt.TIE_SCENE)
-        print(f"{random.choice(tie_quotes)}")
-        print(f"Both players selected {userAction.name}. It's a tie!")
-        print(f"{'─' * 70}\n")
-    elif computerAction in defeats:
-        explanation = victory_explanations.get((userAction, computerAction), "")
-        showBattleScene(userAction, computerAction)
-        print(f"{'─' * 70}")
-        print(f"⚔️  {explanation.upper()}! ⚔️")
-        print(f"{random.choice(victory_quotes)}")
-        print(f"🎯 {userAction.name} beats {computerAction.name}! YOU WIN! 🎯")
-        print(f"{'─' * 70}\n")
+    userBlock, computerBlock, resultHead, resultTail = roundFrames(userAction, computerAction)
+    # Through resolve() rather than the table, so that rpsls --profile sees the rules.
+    outcome = resolve(userAction, computerAction)[0]
+    result = resultHead + (rng if rng is not None else random).choice(_outcomeQuotes[outcome]) + resultTail
+    write = sys.stdout.write
+    clock = clock if clock is not None else gameClock
+
+    if delayA and not clock.fast:
+        write(userBlock)
+        clock.pause(delayA * 0.8)
+        write(computerBlock)
+        clock.pause(delayA * 0.8)
+        write(result)
     else:
-        explanation = victory_explanations.get((computerAction, userAction), "")
-        showBattleScene(computerAction, userAction)
-        print(f"{'─' * 70}")
-        print(f"💥 {explanation.upper()}! 💥")
-        print(f"{random.choice(defeat_quotes)}")
-        print(f"😢 {computerAction.name} beats {userAction.name}! YOU LOSE! 😢")
-        print(f"{'─' * 70}\n")
+        write(userBlock + computerBlock + result)
+
+    return outcome
 
 
-def main():
-    """Main game loop with enhanced user experience."""
+def main(opponent=None, clock=None, history=None, rng=None, recorder=None, events=None):
+    """Main game loop with enhanced user experience.
+
+    Args:
+        opponent (Strategy): Optional computer strategy, for example one
+            that learns from your moves; uniformly random by default.
+        clock (Clock): Paces the game's pauses, ``gameClock`` by default.
+        history (HistoryStore): Optional store every round is appended to.
+        rng (random.Random): Picks taunts and quotes, kept apart from the
+            computer's moves; the ``random`` module by default.
+        recorder (SessionRecorder): Optional recorder of the session for
+            ``rpsls replay``.
+        events (EventBus): Optional bus every round is published on.
+    """
     printBanner()
 
     wins = 0
@@ -225,23 +429,32 @@ def main():
 
     while True:
         try:
-            userAction = getUserSelection()
+            userAction = getUserSelection(rng)
         except ValueError:
+            if recorder is not None:
+                recorder.invalid()
             rangeStr = f"[0, {len(Action) - 1}]"
             print(f"\n❌ Invalid selection! Enter a value in range {rangeStr}")
             print("Even Penny knows how to follow simple instructions! 🙄\n")
             continue
 
-        computerAction = getComputerSelection()
-        countDown()
+        computerAction = getComputerSelection(opponent)
+        countDown(clock)
 
-        determineWinner(userAction, computerAction)
+        outcome = determineWinner(userAction, computerAction, clock, rng)
+        if opponent is not None:
+            opponent.observe(computerAction, userAction)
+        if history is not None:
+            history.append(userAction, computerAction)
+        if recorder is not None:
+            recorder.append(userAction, computerAction)
+        if events is not None:
+            events.publish(userAction, computerAction)
 
         # Update score
-        defeats = victories[userAction]
-        if userAction == computerAction:
+        if outcome == Outcome.Tie:
             ties += 1
-        elif computerAction in defeats:
+        elif outcome == Outcome.Win:
             wins += 1
         else:
             losses += 1
@@ -251,8 +464,12 @@ def main():
 
         playAgain = input("🔄 Play again? (y/n): ")
         if playAgain.lower() != "y":
+            if recorder is not None:
+                recorder.finish()
+            if events is not None:
+                events.flush()
             print("\n" + "=" * 70)
-            print(AsciiArt.GOODBYE_SCENE)
+            print(loadArt().GOODBYE_SCENE)
             print(f"🏁 FINAL SCORE: Wins: {wins} | Losses: {losses} | Ties: {ties}")
             if wins > losses:
                 print("👑 Congratulations! You've proven yourself worthy!")
@@ -266,5 +483,145 @@ def main():
         print("\n" + "─" * 70 + "\n")
 
 
+# Sub-commands of the ``rpsls`` script: (name, module, help text).
+# Only the module of the command being run is imported, see cli().
+SUBCOMMANDS = [
+    ("simulate", "simulation", "play strategies against each other headlessly"),
+    ("tournament", "tournament", "round-robin tournament between computer strategies"),
+    ("evaluate", "evaluation", "test whether one strategy beats another, stopping as soon as it is clear"),
+    ("evolve", "evolution", "breed lookup-table strategies by evolutionary search across processes"),
+    ("serve", "server", "host games for many players over TCP"),
+    ("loadtest", "loadtest", "measure a running game server with simulated players"),
+    ("lobby", "lobby", "match players against each other by rating, or load-test the matchmaking"),
+    ("stream", "streaming", "resolve a log of moves into JSON Lines or CSV results"),
+    ("history", "history", "show, rotate or compact a game history file"),
+    ("replay", "replay", "replay a session recorded with --record, in full or as a summary"),
+    ("leaderboard", "leaderboard", "show the best players of a leaderboard database"),
+    ("ratings", "ratings", "rate the players of a history file with Elo or Glicko-2"),
+    ("rules", "rules", "validate and try out variants with 7, 15, 101 or any odd number of moves"),
+    ("solve", "solver", "compute the Nash equilibrium of a variant and best responses to a player"),
+]
+
+
+def cli(argv=None):
+    """Entry point of the ``rpsls`` script.
+
+    Without a sub-command the interactive game is started, exactly as
+    before; sub-commands such as ``rpsls simulate`` are dispatched to the
+    module that implements them.
+
+    Args:
+        argv (list[str]): Command-line arguments, defaults to ``sys.argv``.
+    """
+    # Imported here: the game logic is imported by worker processes that
+    # never parse a command line, and argparse costs more than the rest.
+    import argparse
+    import importlib
+
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("--opponent", metavar="STRATEGY", default="uniform",
+                         help="computer strategy for the interactive game, e.g. markov (default: uniform)")
+    options.add_argument("--seed", type=int,
+                         help="seed for the computer's moves and taunts, to replay the same session")
+    options.add_argument("--record", metavar="PATH",
+                         help="record the interactive game for rpsls replay")
+    options.add_argument("--tui", action="store_true",
+                         help="play full screen with animations, keys pick moves without enter")
+    options.add_argument("--history", metavar="PATH",
+                         help="append every round of the interactive game to this history file")
+    pace = options.add_mutually_exclusive_group()
+    pace.add_argument("--speed", type=parseSpeed, metavar="FACTOR",
+                      help="play the interactive game FACTOR times faster, 'max' for no delay "
+                           "(default: $RPSLS_SPEED or 1)")
+    pace.add_argument("--no-delay", dest="speed", action="store_const", const=math.inf,
+                      help="no pauses and no countdown animation, same as --speed max")
+    options.add_argument("--dashboard", action="store_true",
+                         help="publish the interactive game's rounds and show their aggregates at the end")
+    options.add_argument("--profile", action="store_true",
+                         help="time every stage of the game and print a summary at exit")
+    options.add_argument("--profile-output", metavar="PATH",
+                         help="also write the profile as JSON to this file (implies --profile)")
+    # Sub-command modules pull in asyncio, sqlite3, NumPy and the like, so
+    # only the module of the selected command is imported: a first pass
+    # over the global options finds the command, and the other commands
+    # are registered with their help text alone.
+    peek = argparse.ArgumentParser(add_help=False, parents=[options], exit_on_error=False)
+    peek.add_argument("command", nargs="?")
+    try:
+        selected = peek.parse_known_args(argv)[0].command
+    except argparse.ArgumentError:
+        selected = None  # Reported by the full parser below.
+
+    parser = argparse.ArgumentParser(
+        prog="rpsls",
+        description="Rock-Paper-Scissors-Lizard-Spock, as seen on 'The Big Bang Theory'.",
+        parents=[options],
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    for name, module_name, help_text in SUBCOMMANDS:
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        if name == selected:
+            module = importlib.import_module(module_name)
+            module.add_arguments(subparser)
+            subparser.set_defaults(handler=module.run)
+
+    args = parser.parse_args(argv)
+    if args.speed is None:
+        try:
+            args.speed = speedFromEnvironment()
+        except ValueError as error:
+            parser.error(f"invalid RPSLS_SPEED: {error}")
+
+    profiler = None
+    if args.profile or args.profile_output:
+        import profiling
+        profiler = profiling.enable()
+    try:
+        if args.command is None:
+            from contextlib import ExitStack
+            from strategies import make_strategy
+            seed = args.seed
+            if seed is None and args.record:
+                seed = random.getrandbits(63)  # A recording needs a known seed.
+            opponent = make_strategy(args.opponent)
+            opponent.reset(seed)
+            clock = Clock(args.speed)
+            # Taunts and quotes get their own generator, so that they do not
+            # shift the computer's moves and the other way round.
+            rng = random.Random(f"{seed}/flavor") if seed is not None else None
+            events = dashboard = None
+            if args.dashboard:
+                from events import Dashboard, EventBus
+                events = EventBus()
+                dashboard = events.subscribe(Dashboard())
+            with ExitStack() as stack:
+                history = recorder = None
+                if args.history:
+                    from history import HistoryStore
+                    history = stack.enter_context(HistoryStore(args.history))
+                if args.record:
+                    from replay import SessionRecorder
+                    try:
+                        recorder = stack.enter_context(SessionRecorder(args.record, seed, countdown=not clock.fast))
+                    except ValueError as error:
+                        parser.error(str(error))
+                if args.tui:
+                    import tui
+                    try:
+                        tui.play(opponent, clock, history, rng, recorder, events)
+                    except RuntimeError as error:
+                        parser.error(str(error))
+                else:
+                    main(opponent, clock, history, rng, recorder, events)
+            if dashboard is not None:
+                print(dashboard.render())
+        else:
+            args.handler(args)
+    finally:
+        if profiler is not None:
+            profiling.disable()
+            profiling.report(profiler, args.profile_output)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
\ No newline at end of file
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/rounds.py
+"""Compact in-memory storage of played rounds.
+
+A round is three small integers: the user's Action, the computer's Action
+and the Outcome for the user. Keeping them as Action members in a tuple
+costs well over a hundred bytes per round; the types here keep them as
+plain ints instead:
+
+* ``RoundRecord`` is a single round in a ``__slots__`` object, for code
+  that handles rounds one at a time.
+* ``RoundLog`` is a column store of three ``array('B')`` columns, one byte
+  per field, so a round costs three bytes and hundreds of millions of them
+  fit in memory for analysis.
+
+Both convert to and from Action and Outcome members at the edges, and the
+outcome always comes from the game's ``OUTCOME_TABLE``.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+from array import array
+
+from rockPaperScissorsLizardSpock import ACTION_COUNT, OUTCOME_TABLE, Action, Outcome
+from simulation import OUTCOME_TRANSLATION, Tally, pair_codes
+
+# Translation tables splitting a packed pair code back into its two moves.
+_USER_BY_PAIR = bytes(code // ACTION_COUNT if code < ACTION_COUNT * ACTION_COUNT else 0 for code in range(256))
+_COMPUTER_BY_PAIR = bytes(code % ACTION_COUNT if code < ACTION_COUNT * ACTION_COUNT else 0 for code in range(256))
+
+
+def _check_moves(moves):
+    """Raises ValueError unless every byte of ``moves`` is an Action value."""
+    if moves and max(moves) >= ACTION_COUNT:
+        raise ValueError(f"Moves must be in range [0, {ACTION_COUNT - 1}]")
+
+
+def _check_move(move):
+    """Raises ValueError unless ``move`` is an Action value."""
+    if not 0 <= move < ACTION_COUNT:
+        raise ValueError(f"Moves must be in range [0, {ACTION_COUNT - 1}]")
+
+
+class RoundRecord:
+    """One round as three plain ints.
+
+    Args:
+        user (int): The user's Action.
+        computer (int): The computer's Action.
+        outcome (int): The Outcome for the user; looked up when omitted.
+
+    Raises:
+        ValueError: If a move is not an Action value.
+    """
+
+    __slots__ = ("user", "computer", "outcome")
+
+    def __init__(self, user, computer, outcome=None):
+        self.user = int(user)
+        self.computer = int(computer)
+        _check_move(self.user)
+        _check_move(self.computer)
+        self.outcome = int(OUTCOME_TABLE[self.user * ACTION_COUNT + self.computer] if outcome is None else outcome)
+
+    @classmethod
+    def from_actions(cls, userAction, computerAction):
+        """Makes a record of a round played with Action members."""
+        return cls(userAction, computerAction)
+
+    def to_actions(self):
+        """Returns the round as ``(Action, Action, Outcome)`` members."""
+        return Action(self.user), Action(self.computer), Outcome(self.outcome)
+
+    def __eq__(self, other):
+        if not isinstance(other, RoundRecord):
+            return NotImplemented
+        return (self.user, self.computer, self.outcome) == (other.user, other.computer, other.outcome)
+
+    def __repr__(self):
+        return (f"RoundRecord(user={Action(self.user).name}, computer={Action(self.computer).name}, "
+                f"outcome={Outcome(self.outcome).name})")
+
+
+class RoundLog:
+    """Column store of rounds at one byte per field.
+
+    The columns are public ``array('B')`` objects, so they can be handed to
+    ``bytes``, ``memoryview`` or ``numpy.frombuffer`` without a copy.
+
+    Attributes:
+        users (array): The user's Action of every round.
+        computers (array): The computer's Action of every round.
+        outcomes (array): The Outcome for the user of every round.
+    """
+
+    __slots__ = ("users", "computers", "outcomes")
+
+    def __init__(self):
+        self.users = array("B")
+        self.computers = array("B")
+        self.outcomes = array("B")
+
+    def append(self, user, computer):
+        """Records one round.
+
+        Args:
+            user (int): The user's Action.
+            computer (int): The computer's Action.
+
+        Raises:
+            ValueError: If a move is not an Action value.
+        """
+        _check_move(user)
+        _check_move(computer)
+        outcome = OUTCOME_TABLE[user * ACTION_COUNT + computer]
+        self.users.append(user)
+        self.computers.append(computer)
+        self.outcomes.append(outcome)
+
+    def append_record(self, record):
+        """Records one RoundRecord."""
+        self.users.append(record.user)
+        self.computers.append(record.computer)
+        self.outcomes.append(record.outcome)
+
+    def extend(self, user_moves, computer_moves):
+        """Records a block of rounds, resolved without a Python loop.
+
+        Args:
+            user_moves: Action values of the user, as ``bytes`` or any
+                sequence of ints.
+            computer_moves: Action values of the computer, same length.
+
+        Raises:
+            ValueError: If the blocks differ in length or hold a value that
+                is not an Action.
+        """
+        user_moves = bytes(user_moves)
+        computer_moves = bytes(computer_moves)
+        if len(user_moves) != len(computer_moves):
+            raise ValueError("user_moves and computer_moves must have the same length")
+        _check_moves(user_moves)
+        _check_moves(computer_moves)
+        self.users.frombytes(user_moves)
+        self.computers.frombytes(computer_moves)
+        self.outcomes.frombytes(pair_codes(user_moves, computer_moves).translate(OUTCOME_TRANSLATION))
+
+    @classmethod
+    def from_packed(cls, data):
+        """Makes a log from packed rounds, one ``user * 5 + computer`` byte each.
+
+        This is the format of ``rpsls stream --packed``.
+
+        Raises:
+            ValueError: On a byte that is not a valid pairing.
+        """
+        data = bytes(data)
+        if data and max(data) >= ACTION_COUNT * ACTION_COUNT:
+            raise ValueError("Packed rounds must be in range "
+                             f"[0, {ACTION_COUNT * ACTION_COUNT - 1}]")
+        log = cls()
+        log.users.frombytes(data.translate(_USER_BY_PAIR))
+        log.computers.frombytes(data.translate(_COMPUTER_BY_PAIR))
+        log.outcomes.frombytes(data.translate(OUTCOME_TRANSLATION))
+        return log
+
+    def packed(self):
+        """Returns the rounds packed one ``user * 5 + computer`` byte each."""
+        return pair_codes(self.users.tobytes(), self.computers.tobytes())
+
+    def tally(self):
+        """Returns the user's wins, losses and ties over every round."""
+        outcomes = self.outcomes.tobytes()
+        wins = outcomes.count(Outcome.Win)
+        losses = outcomes.count(Outcome.Loss)
+        return Tally(wins, losses, len(outcomes) - wins - losses)
+
+    @property
+    def nbytes(self):
+        """int: Memory held by the three columns, in bytes."""
+        return sum(column.buffer_info()[1] * column.itemsize
+                   for column in (self.users, self.computers, self.outcomes))
+
+    def actions(self, index):
+        """Returns round ``index`` as ``(Action, Action, Outcome)`` members."""
+        return Action(self.users[index]), Action(self.computers[index]), Outcome(self.outcomes[index])
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            log = RoundLog()
+            log.users = self.users[index]
+            log.computers = self.computers[index]
+            log.outcomes = self.outcomes[index]
+            return log
+        return RoundRecord(self.users[index], self.computers[index], self.outcomes[index])
+
+    def __iter__(self):
+        for user, computer, outcome in zip(self.users, self.computers, self.outcomes):
+            yield RoundRecord(user, computer, outcome)
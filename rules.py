@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/rules.py
+"""Rule engine for Rock-Paper-Scissors variants with any odd number of moves.
+
+The classic game hard-codes its five moves in the ``Action`` enum and the
+``victories`` dict. A ``Ruleset`` holds the same knowledge for N moves:
+
+* a bit-matrix, one int per move with bit ``j`` set when it beats move
+  ``j``, used to validate the rules;
+* a flat N x N outcome table in ``bytes``, so resolving a round is one
+  index whatever N is;
+* for cyclic variants, where every move beats the ``(N - 1) / 2`` moves
+  that follow it, the modular formula behind resolve_many().
+
+Every ruleset is validated as a tournament: N is odd, and each move beats
+exactly ``(N - 1) / 2`` others and loses to the rest.
+
+Built-in variants are ``rpsls`` (the classic game), ``rps7``, ``rps15`` and
+``rps101``. Others are loaded from JSON rules files::
+
+    {
+      "name": "RPS-7",
+      "moves": ["Rock", "Fire", "Scissors", "Sponge", "Paper", "Air", "Water"],
+      "cyclic": true,
+      "explanations": {"Rock": {"Fire": "Rock pounds out fire"}}
+    }
+
+where ``"cyclic": true`` can be replaced by an explicit ``"beats"`` object
+mapping every move to the list of moves it beats. Explanations are
+optional; missing ones read "<winner> beats <loser>".
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import json
+import random
+import sys
+import time
+
+from rockPaperScissorsLizardSpock import Action, Outcome, victories, victory_explanations
+from simulation import Tally
+
+# Moves travel as single bytes, like the classic Action values.
+MAX_MOVES = 255
+
+# The gestures of RPS-7, RPS-15 and RPS-101 in their published order, in
+# which every gesture beats the (N - 1) / 2 that follow it, wrapping around.
+RPS7_MOVES = ("Rock", "Fire", "Scissors", "Sponge", "Paper", "Air", "Water")
+RPS15_MOVES = ("Rock", "Fire", "Scissors", "Snake", "Human", "Tree", "Wolf", "Sponge", "Paper", "Air",
+               "Water", "Dragon", "Devil", "Lightning", "Gun")
+RPS101_MOVES = (
+    "Dynamite", "Tornado", "Quicksand", "Pit", "Chain", "Gun", "Law", "Whip", "Sword", "Rock",
+    "Death", "Wall", "Sun", "Camera", "Fire", "Chainsaw", "School", "Scissors", "Poison", "Cage",
+    "Axe", "Peace", "Computer", "Castle", "Snake", "Blood", "Porcupine", "Vulture", "Monkey", "King",
+    "Queen", "Prince", "Princess", "Police", "Woman", "Baby", "Man", "Home", "Train", "Car",
+    "Noise", "Bicycle", "Tree", "Turnip", "Duck", "Wolf", "Cat", "Bird", "Fish", "Spider",
+    "Cockroach", "Brain", "Community", "Cross", "Money", "Vampire", "Sponge", "Church", "Butter", "Book",
+    "Paper", "Cloud", "Airplane", "Moon", "Grass", "Film", "Toilet", "Air", "Planet", "Guitar",
+    "Bowl", "Cup", "Beer", "Rain", "Water", "TV", "Rainbow", "UFO", "Alien", "Prayer",
+    "Mountain", "Satan", "Dragon", "Diamond", "Platinum", "Gold", "Devil", "Fence", "Video Game", "Math",
+    "Robot", "Heart", "Electricity", "Lightning", "Medusa", "Power", "Laser", "Nuke", "Sky", "Tank",
+    "Helicopter",
+)
+
+
+class RulesError(ValueError):
+    """Raised for rules that are malformed or not a fair tournament."""
+
+
+class Ruleset:
+    """The moves of a variant and who beats whom.
+
+    Args:
+        name (str): Name of the variant.
+        moves (list[str]): Move names; a move's value is its position.
+        beats (list[int]): Per move, a bit mask of the moves it beats.
+        explanations (dict): Maps ``(winner, loser)`` values to the text
+            explaining the win.
+        cyclic (bool): Whether every move beats the ``(N - 1) / 2`` moves
+            that follow it, which enables the modular resolve_many().
+
+    Raises:
+        RulesError: If the rules fail validate().
+    """
+
+    def __init__(self, name, moves, beats, explanations=None, cyclic=False):
+        self.name = name
+        self.moves = tuple(moves)
+        self.beats = tuple(beats)
+        self.explanations = dict(explanations or {})
+        self.cyclic = cyclic
+        self.validate()
+        self.size = len(self.moves)
+        self._values = {move.lower(): value for value, move in enumerate(self.moves)}
+        self.outcome_table = bytes(self._outcome(user, computer)
+                                   for user in range(self.size) for computer in range(self.size))
+        # What resolve() returns for every pairing, like the game's EXPLANATION_TABLE.
+        self._results = tuple(self._result(pair) for pair in range(len(self.outcome_table)))
+
+    @classmethod
+    def from_cycle(cls, name, moves, explanations=None):
+        """Makes a cyclic ruleset: every move beats the next ``(N - 1) / 2``."""
+        size = len(moves)
+        half = (size - 1) // 2
+        beats = [sum(1 << ((move + step) % size) for step in range(1, half + 1)) for move in range(size)]
+        return cls(name, moves, beats, explanations, cyclic=True)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Makes a ruleset from the parsed contents of a rules file.
+
+        Raises:
+            RulesError: If the data is malformed or the rules are unfair.
+        """
+        try:
+            name = str(data.get("name", "custom"))
+            moves = [str(move) for move in data["moves"]]
+        except (AttributeError, KeyError, TypeError):
+            raise RulesError("rules need a list of \"moves\"") from None
+        values = {move.lower(): value for value, move in enumerate(moves)}
+        if len(values) != len(moves):
+            raise RulesError("move names must be unique")
+
+        def value_of(move):
+            try:
+                return values[str(move).lower()]
+            except KeyError:
+                raise RulesError(f"unknown move {move!r}") from None
+
+        explanations = {}
+        rows = data.get("explanations") or {}
+        if not isinstance(rows, dict) or not all(isinstance(losers, dict) for losers in rows.values()):
+            raise RulesError("\"explanations\" must map each winner to a table of loser: text")
+        for winner, losers in rows.items():
+            for loser, text in losers.items():
+                explanations[(value_of(winner), value_of(loser))] = str(text)
+        if data.get("cyclic"):
+            return cls.from_cycle(name, moves, explanations)
+        if "beats" not in data:
+            raise RulesError("rules need either \"cyclic\": true or a \"beats\" table")
+        table = data["beats"]
+        if not isinstance(table, dict) or not all(isinstance(losers, list) for losers in table.values()):
+            raise RulesError("\"beats\" must map each move to the list of moves it beats")
+        beats = [0] * len(moves)
+        for winner, losers in table.items():
+            for loser in losers:
+                beats[value_of(winner)] |= 1 << value_of(loser)
+        return cls(name, moves, beats, explanations)
+
+    @classmethod
+    def from_file(cls, path):
+        """Loads a JSON rules file, see the module docstring for the format."""
+        with open(path, encoding="utf-8") as stream:
+            try:
+                data = json.load(stream)
+            except json.JSONDecodeError as error:
+                raise RulesError(f"{path} is not valid JSON: {error}") from None
+        return cls.from_dict(data)
+
+    def validate(self):
+        """Checks that the rules describe a fair tournament.
+
+        Raises:
+            RulesError: Unless there is an odd number of at least three and
+                at most MAX_MOVES moves, no move beats itself, every pair of
+                different moves has exactly one winner, and each move beats
+                exactly ``(N - 1) / 2`` others.
+        """
+        size = len(self.moves)
+        if size < 3 or size % 2 == 0 or size > MAX_MOVES:
+            raise RulesError(f"{self.name} needs an odd number of moves between 3 and {MAX_MOVES}, not {size}")
+        if len(self.beats) != size:
+            raise RulesError(f"{self.name} has {len(self.beats)} rows of rules for {size} moves")
+        half = (size - 1) // 2
+        everyone = (1 << size) - 1
+        for move, mask in enumerate(self.beats):
+            name = self.moves[move]
+            if mask >> move & 1:
+                raise RulesError(f"{name} cannot beat itself")
+            if mask & ~everyone:
+                raise RulesError(f"{name} beats a move that does not exist")
+            if mask.bit_count() != half:
+                raise RulesError(f"{name} beats {mask.bit_count()} moves instead of {half}")
+            for other in range(move):
+                if (mask >> other & 1) == (self.beats[other] >> move & 1):
+                    raise RulesError(f"{name} and {self.moves[other]} must beat each other exactly once")
+
+    def _outcome(self, user, computer):
+        if user == computer:
+            return Outcome.Tie
+        return Outcome.Win if self.beats[user] >> computer & 1 else Outcome.Loss
+
+    def _result(self, pair):
+        user, computer = divmod(pair, self.size)
+        outcome = Outcome(self.outcome_table[pair])
+        if outcome == Outcome.Win:
+            return outcome, self.explanation(user, computer)
+        if outcome == Outcome.Loss:
+            return outcome, self.explanation(computer, user)
+        return outcome, ""
+
+    def value(self, move):
+        """Returns the value of a move given by number or (any case) name.
+
+        Raises:
+            ValueError: If there is no such move.
+        """
+        text = str(move).strip()
+        if text.isdigit() and int(text) < self.size:
+            return int(text)
+        try:
+            return self._values[text.lower()]
+        except KeyError:
+            raise ValueError(f"{self.name} has no move {move!r}") from None
+
+    def explanation(self, winner, loser):
+        """Returns the text explaining why ``winner`` beats ``loser``."""
+        text = self.explanations.get((winner, loser))
+        if text is None:
+            text = f"{self.moves[winner]} beats {self.moves[loser].lower()}"
+        return text
+
+    def resolve(self, user, computer):
+        """Resolves a round with a single table lookup.
+
+        Args:
+            user (int): The user's move value.
+            computer (int): The computer's move value.
+
+        Returns:
+            tuple: The Outcome for the user and the explanation of the
+                winning move ("" for a tie).
+        """
+        return self._results[user * self.size + computer]
+
+    def resolve_many(self, user_moves, computer_moves):
+        """Resolves blocks of rounds without a Python loop where possible.
+
+        Pair codes ``user * N + computer`` fit in a byte for N up to 15 and
+        are looked up with ``bytes.translate`` like in the simulator. Cyclic
+        variants of up to 127 moves use the modular formula instead: the
+        user wins when ``(computer - user) mod N`` is between 1 and
+        ``(N - 1) / 2``. Anything else falls back to the outcome table.
+
+        Args:
+            user_moves (bytes): Move values of the user.
+            computer_moves (bytes): Move values of the computer, same length.
+
+        Returns:
+            tuple: The per-round Outcome values as ``bytes`` and the Tally.
+
+        Raises:
+            ValueError: If the blocks differ in length or hold a value that
+                is not a move.
+        """
+        user_moves = bytes(user_moves)
+        computer_moves = bytes(computer_moves)
+        if len(user_moves) != len(computer_moves):
+            raise ValueError("user_moves and computer_moves must have the same length")
+        for moves in (user_moves, computer_moves):
+            if moves and max(moves) >= self.size:
+                raise ValueError(f"Moves must be in range [0, {self.size - 1}]")
+        size = self.size
+        if size * size <= 256:
+            # The byte-wise sum of two big ints never carries: codes stay below 256.
+            scaled = user_moves.translate(bytes(value * size % 256 for value in range(256)))
+            codes = int.from_bytes(scaled, "little") + int.from_bytes(computer_moves, "little")
+            table = self.outcome_table.ljust(256, bytes([Outcome.Tie]))
+        elif self.cyclic and 2 * size <= 256:
+            # computer + (N - user) is below 2N, so again no byte ever carries.
+            negated = user_moves.translate(bytes((size - value) % 256 for value in range(256)))
+            codes = int.from_bytes(negated, "little") + int.from_bytes(computer_moves, "little")
+            half = (size - 1) // 2
+            table = bytes(Outcome.Tie if distance % size == 0 else
+                          Outcome.Win if distance % size <= half else Outcome.Loss
+                          for distance in range(256))
+        else:
+            outcomes = bytes(map(self.outcome_table.__getitem__,
+                                 (user * size + computer for user, computer in zip(user_moves, computer_moves))))
+            codes = None
+        if codes is not None:
+            outcomes = codes.to_bytes(len(user_moves), "little").translate(table)
+        wins = outcomes.count(Outcome.Win)
+        losses = outcomes.count(Outcome.Loss)
+        return outcomes, Tally(wins, losses, len(outcomes) - wins - losses)
+
+    def random_moves(self, n, rng=random):
+        """Returns ``n`` uniformly random move values as ``bytes``.
+
+        Args:
+            n (int): Number of moves.
+            rng (random.Random): Source of randomness.
+        """
+        # Bytes at or above the largest multiple of N would bias the result.
+        limit = 256 - 256 % self.size
+        table = bytes(value % self.size for value in range(256))
+        rejected = bytes(range(limit, 256))
+        out = bytearray()
+        while len(out) < n:
+            missing = n - len(out)
+            out += rng.randbytes(missing + missing // 2 + 16).translate(table, rejected)
+        del out[n:]
+        return bytes(out)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"Ruleset({self.name!r}, {self.size} moves)"
+
+
+def classic_ruleset():
+    """The five moves of the game module, built from its ``victories``."""
+    beats = [sum(1 << loser for loser in victories[action]) for action in Action]
+    return Ruleset("Rock-Paper-Scissors-Lizard-Spock", [action.name for action in Action], beats,
+                   {(int(winner), int(loser)): text for (winner, loser), text in victory_explanations.items()})
+
+
+# Built-in variants by name, made on first use by load_ruleset().
+BUILTIN_RULESETS = {
+    "rpsls": classic_ruleset,
+    "rps7": lambda: Ruleset.from_cycle("RPS-7", RPS7_MOVES),
+    "rps15": lambda: Ruleset.from_cycle("RPS-15", RPS15_MOVES),
+    "rps101": lambda: Ruleset.from_cycle("RPS-101", RPS101_MOVES),
+}
+
+
+def load_ruleset(source):
+    """Returns a built-in variant by name, or loads a rules file.
+
+    Args:
+        source (str): ``rpsls``, ``rps7``, ``rps15``, ``rps101`` or the
+            path of a JSON rules file.
+
+    Raises:
+        RulesError: If the rules are malformed or unfair.
+        OSError: If the rules file cannot be read.
+    """
+    factory = BUILTIN_RULESETS.get(str(source).lower())
+    return factory() if factory is not None else Ruleset.from_file(source)
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls rules`` options to an argument parser."""
+    parser.add_argument("rules", nargs="?", default="rpsls",
+                        help=f"{', '.join(BUILTIN_RULESETS)} or a JSON rules file (default: rpsls)")
+    parser.add_argument("--resolve", nargs=2, metavar=("USER", "COMPUTER"), help="resolve one round")
+    parser.add_argument("-n", "--simulate", type=int, metavar="ROUNDS",
+                        help="resolve this many uniformly random rounds and report the speed")
+    parser.add_argument("--seed", type=int, help="seed for --simulate")
+
+
+def run(args):
+    """Runs ``rpsls rules``: validates a ruleset and optionally plays it."""
+    try:
+        ruleset = load_ruleset(args.rules)
+    except (OSError, RulesError) as error:
+        sys.exit(f"❌ {error}")
+    print(f"\n{'═' * 70}")
+    print(f"📜 {ruleset.name}: {ruleset.size} moves, each beats {(ruleset.size - 1) // 2} ✅")
+    print(f"{'═' * 70}")
+    if ruleset.size <= 15:
+        for move, name in enumerate(ruleset.moves):
+            beaten = [ruleset.moves[other] for other in range(ruleset.size) if ruleset.beats[move] >> other & 1]
+            print(f"  {move:>3}  {name:<12} beats {', '.join(beaten)}")
+    else:
+        print(f"  {', '.join(ruleset.moves)}")
+    if args.resolve:
+        try:
+            user, computer = (ruleset.value(move) for move in args.resolve)
+        except ValueError as error:
+            sys.exit(f"❌ {error}")
+        outcome, explanation = ruleset.resolve(user, computer)
+        print(f"{'─' * 70}")
+        print(f"⚔️  {ruleset.moves[user]} vs {ruleset.moves[computer]}: {outcome.name.upper()}"
+              + (f" ({explanation})" if explanation else ""))
+    if args.simulate:
+        rng = random.Random(args.seed)
+        start = time.perf_counter()
+        _, tally = ruleset.resolve_many(ruleset.random_moves(args.simulate, rng),
+                                        ruleset.random_moves(args.simulate, rng))
+        elapsed = time.perf_counter() - start
+        print(f"{'─' * 70}")
+        print(f"📊 SCORE: Wins: {tally.wins} | Losses: {tally.losses} | Ties: {tally.ties}")
+        print(f"⚡ {args.simulate / elapsed:,.0f} rounds/s")
+    print(f"{'─' * 70}\n")
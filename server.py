@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/server.py
+"""Asyncio TCP server for Rock-Paper-Scissors-Lizard-Spock.
+
+``rpsls serve`` lets any number of players connect at once (``nc`` or
+``telnet`` will do) and play sessions against the computer. The protocol is
+line based, one request and one reply per line:
+
+    server: HELLO <taunt>
+    client: <move>            a number 0-4 or an action name
+    server: RESULT <WIN|LOSS|TIE> <user> <computer> <wins> <losses> <ties> <explanation>
+    client: SCORE
+    server: SCORE <wins> <losses> <ties>
+    client: NAME <player>     name used on the leaderboard, "anonymous" until set
+    server: OK <player>
+    client: QUIT
+    server: BYE <wins> <losses> <ties>
+
+Anything else is answered with ``ERROR <message>``. The suspense of
+countDown() and determineWinner() is kept, but as ``asyncio.sleep`` so that
+a waiting player never holds up anybody else.
+
+``--dashboard SECONDS`` publishes every round, with its latency, on an
+events.EventBus and prints the live aggregates that often.
+
+``--metrics-port`` also serves the per-stage latency histograms of the
+profiling module and a few server gauges over HTTP, in the Prometheus text
+format.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import asyncio
+import random
+import time
+
+import profiling
+from rockPaperScissorsLizardSpock import (Action, Outcome, computer_taunts, delayA, parseAction,
+                                          resolve)
+from strategies import make_strategy
+
+DEFAULT_PORT = 5151
+
+# Seconds paused per round by countDown() (5 x 0.6 + 0.5) and
+# determineWinner() (2 x 0.8), before scaling by the delay factor.
+ROUND_PAUSE = 5 * 0.6 + 0.5 + 2 * 0.8
+
+
+class GameSession:
+    """Score of one connected player and the strategy playing against them.
+
+    Args:
+        strategy (Strategy): The computer's strategy for this session.
+    """
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self.name = "anonymous"
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+
+    def play(self, userAction):
+        """Plays one round against the computer and updates the score.
+
+        Args:
+            userAction (Action): The player's move.
+
+        Returns:
+            tuple: The Outcome, the computer's Action and the explanation.
+        """
+        computerAction = Action(self.strategy.move())
+        outcome, explanation = resolve(userAction, computerAction)
+        if outcome == Outcome.Tie:
+            self.ties += 1
+        elif outcome == Outcome.Win:
+            self.wins += 1
+        else:
+            self.losses += 1
+        self.strategy.observe(computerAction, userAction)
+        return outcome, computerAction, explanation
+
+    @property
+    def score(self):
+        """str: Wins, losses and ties separated by spaces."""
+        return f"{self.wins} {self.losses} {self.ties}"
+
+
+class GameServer:
+    """Serves game sessions over TCP.
+
+    Args:
+        delay (float): Scale of the per-round pause, like ``delayA``; 0
+            answers immediately.
+        strategy (str): Name of the computer strategy, see make_strategy().
+        leaderboard (Leaderboard): Optional leaderboard recording every round.
+        events (EventBus): Optional bus every round is published on, with
+            the seconds from the move arriving to the result being sent.
+    """
+
+    def __init__(self, delay=delayA, strategy="uniform", leaderboard=None, events=None):
+        self.delay = delay
+        self.strategy = strategy
+        self.leaderboard = leaderboard
+        self.events = events
+        make_strategy(strategy)  # Fail before accepting any connection.
+        self.sessions = 0
+        self.rounds = 0
+
+    async def handle(self, reader, writer):
+        """Plays one session with a connected client."""
+        strategy = make_strategy(self.strategy)
+        strategy.reset()
+        session = GameSession(strategy)
+        self.sessions += 1
+        try:
+            writer.write(f"HELLO {random.choice(computer_taunts)}\n".encode())
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = line.decode(errors="replace").strip()
+                command = request.upper()
+                if command == "QUIT":
+                    writer.write(f"BYE {session.score}\n".encode())
+                    break
+                if command == "SCORE":
+                    writer.write(f"SCORE {session.score}\n".encode())
+                elif command.startswith("NAME "):
+                    session.name = request[5:].strip()[:64] or session.name
+                    writer.write(f"OK {session.name}\n".encode())
+                else:
+                    try:
+                        userAction = parseAction(request)
+                    except ValueError:
+                        writer.write(f"ERROR Invalid selection! Enter a value in range [0, {len(Action) - 1}]\n"
+                                     .encode())
+                    else:
+                        started = time.perf_counter()
+                        if self.delay:
+                            await asyncio.sleep(self.delay * ROUND_PAUSE)
+                        outcome, computerAction, explanation = session.play(userAction)
+                        self.rounds += 1
+                        if self.leaderboard is not None:
+                            self.leaderboard.record(session.name, userAction, computerAction,
+                                                   opponent=f"{self.strategy} (bot)")
+                        writer.write(f"RESULT {outcome.name.upper()} {userAction.name} {computerAction.name} "
+                                     f"{session.score} {explanation}\n".encode())
+                        if self.events is not None:
+                            self.events.publish(userAction, computerAction, time.perf_counter() - started)
+                await writer.drain()
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    def metrics(self):
+        """Renders the stage histograms and server gauges for Prometheus.
+
+        Returns:
+            str: The Prometheus text format; the histograms are empty
+                unless profiling is enabled.
+        """
+        profiler = profiling.PROFILER or profiling.Profiler()
+        return profiler.prometheus({"sessions_active": self.sessions, "rounds_played": self.rounds})
+
+    async def handle_metrics(self, reader, writer):
+        """Answers one HTTP request, whatever its path, with metrics()."""
+        try:
+            while (await reader.readline()).strip():
+                pass  # The request line and headers do not matter.
+            body = self.metrics().encode()
+            writer.write(b"HTTP/1.0 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                         b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Starts listening.
+
+        Returns:
+            asyncio.Server: The listening server; port 0 picks a free port.
+        """
+        return await asyncio.start_server(self.handle, host, port, backlog=4096)
+
+
+async def _flush_periodically(leaderboard):
+    """Flushes rounds recorded just before the server went quiet."""
+    while True:
+        await asyncio.sleep(leaderboard.flush_interval)
+        leaderboard.flush()
+
+
+async def _show_dashboard_periodically(bus, dashboard, interval):
+    """Prints the dashboard every ``interval`` seconds, rounds still buffered included."""
+    while True:
+        await asyncio.sleep(interval)
+        bus.flush()
+        print(f"{'─' * 70}\n{dashboard.render()}")
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, delay=delayA, strategy="uniform", leaderboard=None,
+                metrics_port=None, dashboard_interval=None):
+    """Runs a game server until it is cancelled.
+
+    With ``metrics_port``, metrics are also served over HTTP for Prometheus
+    to scrape on that port. With ``dashboard_interval``, live aggregates of
+    the rounds are printed every that many seconds.
+    """
+    bus = dashboard = None
+    if dashboard_interval is not None:
+        from events import Dashboard, EventBus
+        bus = EventBus()
+        dashboard = bus.subscribe(Dashboard())
+    game = GameServer(delay, strategy, leaderboard, bus)
+    server = await game.start(host, port)
+    address = ", ".join(str(sock.getsockname()[:2]) for sock in server.sockets)
+    print(f"🖖 Serving Rock-Paper-Scissors-Lizard-Spock on {address}")
+    metrics = None
+    if metrics_port is not None:
+        metrics = await asyncio.start_server(game.handle_metrics, host, metrics_port)
+        print(f"📈 Metrics on http://{host}:{metrics.sockets[0].getsockname()[1]}/metrics")
+    flusher = asyncio.create_task(_flush_periodically(leaderboard)) if leaderboard is not None else None
+    reporter = (asyncio.create_task(_show_dashboard_periodically(bus, dashboard, dashboard_interval))
+                if dashboard is not None else None)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in (flusher, reporter):
+            if task is not None:
+                task.cancel()
+        if metrics is not None:
+            metrics.close()
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls serve`` options to an argument parser."""
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument("--delay", type=float, default=delayA,
+                        help=f"suspense per round, scaled like delayA; 0 disables it (default: {delayA})")
+    parser.add_argument("--strategy", default="uniform", help="computer strategy (default: uniform)")
+    parser.add_argument("--leaderboard", metavar="PATH", help="record every round in this leaderboard database")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="serve Prometheus metrics over HTTP on this port (enables profiling)")
+    parser.add_argument("--dashboard", type=float, metavar="SECONDS",
+                        help="print live move, outcome, streak and latency aggregates this often")
+
+
+def run(args):
+    """Runs ``rpsls serve`` until interrupted."""
+    leaderboard = None
+    if args.leaderboard:
+        from leaderboard import Leaderboard
+        leaderboard = Leaderboard(args.leaderboard)
+    # Histograms are what the endpoint is for, so it switches profiling on;
+    # with ``rpsls --profile`` it is already on and cli() reports at exit.
+    profiler = profiling.enable() if args.metrics_port is not None and profiling.PROFILER is None else None
+    try:
+        asyncio.run(serve(args.host, args.port, args.delay, args.strategy, leaderboard, args.metrics_port,
+                          args.dashboard))
+    except KeyboardInterrupt:
+        print("\n🖖 Live long and prosper!")
+    finally:
+        if leaderboard is not None:
+            leaderboard.close()
+        if profiler is not None:
+            profiling.disable()
+
+
+# Does nothing unless profiling started before this import.
+profiling.instrument(__name__)
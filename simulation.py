@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/simulation.py
+"""Headless batch simulation of Rock-Paper-Scissors-Lizard-Spock.
+
+No art, no prompts and definitely no ``time.sleep``: rounds are resolved in
+large blocks of packed bytes so that millions of rounds per second can be
+played on a single core. Outcomes come from the game module's
+``OUTCOME_TABLE``, the same table behind ``resolve()``, so the simulator can
+never disagree with the interactive game.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import random
+import time
+from collections import namedtuple
+
+from rockPaperScissorsLizardSpock import OUTCOME_TABLE, Action, Outcome
+from strategies import make_strategy
+
+# NumPy is optional and slow to import, so numpy_or_none() imports it on first
+# use; after that ``np`` is the module, or None if it is not installed.
+_NOT_IMPORTED = object()
+np = _NOT_IMPORTED
+
+Tally = namedtuple("Tally", ["wins", "losses", "ties"])
+Tally.__doc__ = "Round counts from the point of view of the first strategy."
+
+CHUNK_SIZE = 1 << 20
+
+# The game's outcome table packed into bytes, indexed by ``a * len(Action) + b``.
+OUTCOME_BY_PAIR = bytes(OUTCOME_TABLE)
+# The same table padded to 256 entries so it can drive ``bytes.translate``.
+OUTCOME_TRANSLATION = OUTCOME_BY_PAIR.ljust(256, bytes([Outcome.Tie]))
+# Translation table multiplying a move byte by the number of actions.
+_SCALE_BY_ACTIONS = bytes((value * len(Action)) % 256 for value in range(256))
+
+
+def numpy_or_none():
+    """Returns NumPy, importing it on first use, or None if it is missing."""
+    global np
+    if np is _NOT_IMPORTED:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
+
+
+def pair_codes(moves_a, moves_b):
+    """Combines two move blocks into one block of ``a * 5 + b`` pair codes.
+
+    Both blocks are read as big integers and added, which does the
+    per-byte arithmetic in C: no pair code exceeds 24, so there is never a
+    carry between neighbouring bytes.
+
+    Args:
+        moves_a (bytes): Moves of the first strategy.
+        moves_b (bytes): Moves of the second strategy, same length.
+
+    Returns:
+        bytes: One pair code per round.
+    """
+    scaled = int.from_bytes(moves_a.translate(_SCALE_BY_ACTIONS), "little")
+    combined = scaled + int.from_bytes(moves_b, "little")
+    return combined.to_bytes(len(moves_a), "little")
+
+
+def _resolve_many_numpy(user_moves, computer_moves, chunk_size):
+    """Vectorized resolve_many() for NumPy arrays."""
+    table = np.frombuffer(OUTCOME_BY_PAIR, dtype=np.uint8)
+    width = np.uint8(len(Action))
+    outcomes = np.empty(user_moves.shape[0], dtype=np.uint8)
+    index = np.empty(min(chunk_size, outcomes.shape[0]), dtype=np.uint8)
+    # Work in chunks so that 100M-round arrays never need a wide temporary.
+    for start in range(0, outcomes.shape[0], chunk_size):
+        stop = min(start + chunk_size, outcomes.shape[0])
+        pair = index[:stop - start]
+        np.multiply(user_moves[start:stop], width, out=pair, casting="unsafe")
+        pair += computer_moves[start:stop].astype(np.uint8, copy=False)
+        np.take(table, pair, out=outcomes[start:stop])
+    counts = np.bincount(outcomes, minlength=len(Outcome))
+    return outcomes, Tally(int(counts[Outcome.Win]), int(counts[Outcome.Loss]), int(counts[Outcome.Tie]))
+
+
+def _resolve_many_bytes(user_moves, computer_moves):
+    """Pure-Python resolve_many() on packed bytes."""
+    user_moves = bytes(user_moves)
+    computer_moves = bytes(computer_moves)
+    outcomes = pair_codes(user_moves, computer_moves).translate(OUTCOME_TRANSLATION)
+    wins = outcomes.count(bytes([Outcome.Win]))
+    losses = outcomes.count(bytes([Outcome.Loss]))
+    return outcomes, Tally(wins, losses, len(outcomes) - wins - losses)
+
+
+def resolve_many(user_moves, computer_moves, chunk_size=CHUNK_SIZE):
+    """Resolves whole arrays of rounds at once.
+
+    With NumPy installed the moves are combined into pair codes and looked
+    up in the outcome table with vectorized operations; without it the
+    moves are packed into ``bytes`` and resolved by the same byte tricks
+    the simulator uses. Neither path loops over rounds in Python.
+
+    Args:
+        user_moves: Action values of the first player, as a NumPy integer
+            array, ``bytes`` or any sequence of ints.
+        computer_moves: Action values of the second player, same length.
+        chunk_size (int): Rounds per vectorized step on the NumPy path.
+
+    Returns:
+        tuple: The per-round outcomes (a ``uint8`` array with NumPy, otherwise
+            ``bytes``) holding Outcome values, and the aggregate Tally.
+
+    Raises:
+        ValueError: If the arrays differ in length or hold a value that is
+            not an Action, such as a float.
+    """
+    if len(user_moves) != len(computer_moves):
+        raise ValueError("user_moves and computer_moves must have the same length")
+    numpy = numpy_or_none()
+    if numpy is not None:
+        user_moves = numpy.asarray(user_moves)
+        computer_moves = numpy.asarray(computer_moves)
+    for moves in (user_moves, computer_moves):
+        if not len(moves):
+            continue
+        if numpy is not None:
+            if moves.dtype.kind not in "iu":
+                raise ValueError(f"Moves must be integers, got {moves.dtype} values")
+            low, high = moves.min(), moves.max()
+        else:
+            low, high = min(moves), max(moves)
+        if low < 0 or high >= len(Action):
+            raise ValueError(f"Moves must be in range [0, {len(Action) - 1}]")
+    if numpy is not None:
+        return _resolve_many_numpy(user_moves, computer_moves, chunk_size)
+    try:
+        return _resolve_many_bytes(user_moves, computer_moves)
+    except TypeError:  # bytes() takes integers only.
+        raise ValueError("Moves must be integers") from None
+
+
+def _simulate_blocks(n_rounds, strategy_a, strategy_b, chunk_size, bus=None):
+    """Plays history-independent strategies block by block."""
+    win = bytes([Outcome.Win])
+    loss = bytes([Outcome.Loss])
+    wins = losses = 0
+    remaining = n_rounds
+    while remaining:
+        n = min(remaining, chunk_size)
+        moves_a = strategy_a.moves(n)
+        moves_b = strategy_b.moves(n)
+        pairs = pair_codes(moves_a, moves_b)
+        if bus is not None:
+            bus.publish_block(pairs)
+        outcomes = pairs.translate(OUTCOME_TRANSLATION)
+        wins += outcomes.count(win)
+        losses += outcomes.count(loss)
+        remaining -= n
+    return Tally(wins, losses, n_rounds - wins - losses)
+
+
+def _simulate_rounds(n_rounds, strategy_a, strategy_b, bus=None):
+    """Plays adaptive strategies one round at a time."""
+    outcome_by_pair = OUTCOME_BY_PAIR
+    width = len(Action)
+    counts = [0, 0, 0]
+    move_a, move_b = strategy_a.move, strategy_b.move
+    observe_a, observe_b = strategy_a.observe, strategy_b.observe
+    for _ in range(n_rounds):
+        a = move_a()
+        b = move_b()
+        counts[outcome_by_pair[a * width + b]] += 1
+        observe_a(a, b)
+        observe_b(b, a)
+        if bus is not None:
+            bus.publish(a, b)
+    if bus is not None:
+        bus.flush()
+    return Tally(counts[Outcome.Win], counts[Outcome.Loss], counts[Outcome.Tie])
+
+
+def simulate(n_rounds, strategy_a, strategy_b, seed=None, chunk_size=CHUNK_SIZE, bus=None):
+    """Plays ``n_rounds`` rounds between two strategies without any I/O.
+
+    Args:
+        n_rounds (int): Number of rounds to play.
+        strategy_a (Strategy): The first player (the "user" side).
+        strategy_b (Strategy): The second player (the "computer" side).
+        seed (int): Seed for both strategies; ``None`` for a random seed.
+        chunk_size (int): Rounds resolved per block for non-adaptive
+            strategies, which bounds memory use.
+        bus (EventBus): Optional bus every round is published on.
+
+    Returns:
+        Tally: Wins, losses and ties from ``strategy_a``'s point of view.
+    """
+    if n_rounds < 0:
+        raise ValueError("n_rounds must not be negative")
+    rng = random.Random(seed)
+    strategy_a.reset(rng.getrandbits(64))
+    strategy_b.reset(rng.getrandbits(64))
+    return play(n_rounds, strategy_a, strategy_b, chunk_size, bus)
+
+
+def play(n_rounds, strategy_a, strategy_b, chunk_size=CHUNK_SIZE, bus=None):
+    """Plays on from the strategies' current state, without resetting them.
+
+    simulate() is reset() followed by play(); calling play() repeatedly
+    continues one long match, so adaptive strategies keep what they learnt.
+
+    Returns:
+        Tally: Wins, losses and ties from ``strategy_a``'s point of view.
+    """
+    if strategy_a.adaptive or strategy_b.adaptive:
+        return _simulate_rounds(n_rounds, strategy_a, strategy_b, bus)
+    return _simulate_blocks(n_rounds, strategy_a, strategy_b, chunk_size, bus)
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls simulate`` options to an argument parser."""
+    parser.add_argument("-n", "--rounds", type=int, default=10_000_000,
+                        help="number of rounds to play (default: 10,000,000)")
+    parser.add_argument("-a", "--strategy-a", default="uniform",
+                        help="first strategy (default: uniform)")
+    parser.add_argument("-b", "--strategy-b", default="uniform",
+                        help="second strategy (default: uniform)")
+    parser.add_argument("--seed", type=int, help="seed for reproducible runs")
+    parser.add_argument("--dashboard", action="store_true",
+                        help="stream every round into live aggregates and print them at the end")
+    parser.add_argument("--window", type=int, default=10_000,
+                        help="rounds in the dashboard's sliding window (default: 10,000)")
+
+
+def run(args):
+    """Runs ``rpsls simulate`` and prints the tally."""
+    strategy_a = make_strategy(args.strategy_a)
+    strategy_b = make_strategy(args.strategy_b)
+    bus = dashboard = None
+    if args.dashboard:
+        from events import Dashboard, EventBus
+        bus = EventBus()
+        dashboard = bus.subscribe(Dashboard(args.window))
+    start = time.perf_counter()
+    tally = simulate(args.rounds, strategy_a, strategy_b, seed=args.seed, bus=bus)
+    elapsed = time.perf_counter() - start
+    rate = args.rounds / elapsed if elapsed > 0 else float("inf")
+    print(f"🤖 {strategy_a.name} vs {strategy_b.name}: {args.rounds:,} rounds "
+          f"in {elapsed:.3f}s ({rate:,.0f} rounds/s)")
+    print(f"📊 SCORE: Wins: {tally.wins} | Losses: {tally.losses} | Ties: {tally.ties}")
+    if dashboard is not None:
+        print(dashboard.render())
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/solver.py
+"""Game-theory solver for Rock-Paper-Scissors-Lizard-Spock and its variants.
+
+The rules only say who beats whom; this module turns them into a payoff
+matrix, ``+w`` for the row player's wins, ``-w`` for its losses and 0 for
+ties, where every winning pair may carry its own weight ``w`` (say, a
+Spock-smashes-scissors win counts double). Such a zero-sum game has a Nash
+equilibrium: a mix of moves that no opponent can exploit.
+
+nash_equilibrium() finds it in one of two ways:
+
+* ``simplex``: the exact solution of the game's linear program by a dense
+  tableau simplex, vectorized with NumPy when it is installed. RPS-101
+  takes a few milliseconds.
+* ``fictitious``: fictitious play, where both players keep best-responding
+  to the other's empirical mix. It only converges towards the equilibrium
+  but bounds how far off it is, and works for any size.
+
+best_response() answers the other question, how to exploit a player whose
+move distribution was observed, and BestResponseStrategy uses both online:
+it plays the equilibrium until it has seen enough of the opponent, then
+best-responds to their recent moves::
+
+    rpsls --opponent solver:BestResponseStrategy
+    rpsls solve rps101
+    rpsls solve --weight spock,scissors=2 --against 5,1,1,1,1
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import math
+import sys
+import time
+from array import array
+from collections import namedtuple
+from itertools import accumulate
+
+import simulation
+from rules import RulesError, classic_ruleset, load_ruleset
+from strategies import Strategy
+
+METHODS = ("simplex", "fictitious")
+
+# Reduced costs and ratios closer to zero than this count as zero.
+TOLERANCE = 1e-9
+
+Equilibrium = namedtuple("Equilibrium", ["strategy", "opponent_strategy", "value", "gap", "method", "iterations"])
+Equilibrium.__doc__ = """A Nash equilibrium found by nash_equilibrium().
+
+strategy and opponent_strategy are the row and column players' mixes, one
+probability per move, and value the row player's expected payoff. gap
+bounds how far the mixes are from an equilibrium: 0 (up to rounding) for
+the simplex, shrinking with the iterations for fictitious play.
+"""
+
+BestResponse = namedtuple("BestResponse", ["moves", "payoffs", "value"])
+BestResponse.__doc__ = """The answer of best_response(): the moves with the highest expected
+payoff against the observed distribution, every move's expected payoff,
+and that highest payoff."""
+
+
+def payoff_matrix(ruleset=None, weights=None):
+    """Builds the row player's payoff matrix of a ruleset.
+
+    Args:
+        ruleset (Ruleset): The rules, the classic game by default.
+        weights (dict): Maps ``(winner, loser)`` pairs, like the keys of
+            ``victory_explanations``, to what the win is worth; every other
+            win is worth 1. Moves may be given as values, Actions or names.
+
+    Returns:
+        list[list[float]]: ``matrix[user][computer]`` is the user's payoff.
+
+    Raises:
+        ValueError: If a weighted pair is not a win or a weight is not positive.
+    """
+    ruleset = ruleset if ruleset is not None else classic_ruleset()
+    size = ruleset.size
+    worth = {}
+    for (winner, loser), weight in (weights or {}).items():
+        winner, loser = (int(move) if isinstance(move, int) else ruleset.value(move) for move in (winner, loser))
+        if not ruleset.beats[winner] >> loser & 1:
+            raise ValueError(f"{ruleset.moves[winner]} does not beat {ruleset.moves[loser]}")
+        if not weight > 0:
+            raise ValueError(f"the weight of {ruleset.moves[winner]} beating {ruleset.moves[loser]} must be positive")
+        worth[(winner, loser)] = float(weight)
+    matrix = [[0.0] * size for _ in range(size)]
+    for winner in range(size):
+        for loser in range(size):
+            if ruleset.beats[winner] >> loser & 1:
+                weight = worth.get((winner, loser), 1.0)
+                matrix[winner][loser] = weight
+                matrix[loser][winner] = -weight
+    return matrix
+
+
+def parse_weights(specs):
+    """Parses ``WINNER,LOSER=WEIGHT`` command-line weights into a dict."""
+    weights = {}
+    for spec in specs or ():
+        pair, _, weight = spec.partition("=")
+        winner, _, loser = pair.partition(",")
+        try:
+            weights[(winner.strip(), loser.strip())] = float(weight)
+        except ValueError:
+            raise ValueError(f"weights look like WINNER,LOSER=WEIGHT, not {spec!r}") from None
+    return weights
+
+
+def _normalize(values):
+    """Scales non-negative values to probabilities."""
+    total = sum(values)
+    if not total > 0:
+        raise ValueError("a distribution needs a positive total")
+    return [value / total for value in values]
+
+
+def _check(matrix):
+    """Returns the matrix as rows of floats after checking its shape."""
+    rows = [[float(value) for value in row] for row in matrix]
+    if not rows or not rows[0] or any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("a payoff matrix needs equally long, non-empty rows")
+    return rows
+
+
+def _simplex_numpy(numpy, payoffs):
+    """Runs the simplex on ``max sum(y)`` s.t. ``payoffs @ y <= 1``, ``y >= 0``.
+
+    Returns:
+        tuple: The optimal ``y``, the dual ``u`` (one per row) and pivots.
+    """
+    rows, columns = payoffs.shape
+    tableau = numpy.zeros((rows + 1, columns + rows + 1))
+    tableau[:rows, :columns] = payoffs
+    tableau[:rows, columns:columns + rows] = numpy.eye(rows)
+    tableau[:rows, -1] = 1.0
+    tableau[rows, :columns] = -1.0
+    basis = numpy.arange(columns, columns + rows)
+    pivots = 0
+    while True:
+        entering = int(numpy.argmin(tableau[rows, :-1]))
+        if tableau[rows, entering] >= -TOLERANCE:
+            break
+        column = tableau[:rows, entering]
+        ratios = numpy.full(rows, numpy.inf)
+        positive = column > TOLERANCE
+        ratios[positive] = tableau[:rows, -1][positive] / column[positive]
+        leaving = int(numpy.argmin(ratios))
+        tableau[leaving] /= tableau[leaving, entering]
+        pivot_row = tableau[leaving]
+        factors = tableau[:, entering].copy()
+        factors[leaving] = 0.0
+        tableau -= numpy.outer(factors, pivot_row)
+        basis[leaving] = entering
+        pivots += 1
+    y = numpy.zeros(columns)
+    basic = basis < columns
+    y[basis[basic]] = tableau[:rows, -1][basic]
+    return y.tolist(), tableau[rows, columns:columns + rows].tolist(), pivots
+
+
+def _simplex_lists(payoffs):
+    """_simplex_numpy() on plain lists, for when NumPy is not installed."""
+    rows, columns = len(payoffs), len(payoffs[0])
+    width = columns + rows + 1
+    tableau = [payoffs[row] + [1.0 if other == row else 0.0 for other in range(rows)] + [1.0]
+               for row in range(rows)]
+    tableau.append([-1.0] * columns + [0.0] * (rows + 1))
+    basis = list(range(columns, columns + rows))
+    pivots = 0
+    while True:
+        objective = tableau[rows]
+        entering = min(range(width - 1), key=objective.__getitem__)
+        if objective[entering] >= -TOLERANCE:
+            break
+        leaving = None
+        best = math.inf
+        for row in range(rows):
+            coefficient = tableau[row][entering]
+            if coefficient > TOLERANCE and tableau[row][-1] / coefficient < best:
+                leaving, best = row, tableau[row][-1] / coefficient
+        pivot = tableau[leaving][entering]
+        pivot_row = tableau[leaving] = [value / pivot for value in tableau[leaving]]
+        for row in range(rows + 1):
+            factor = tableau[row][entering]
+            if row != leaving and factor:
+                tableau[row] = [value - factor * scaled for value, scaled in zip(tableau[row], pivot_row)]
+        basis[leaving] = entering
+        pivots += 1
+    y = [0.0] * columns
+    for row, variable in enumerate(basis):
+        if variable < columns:
+            y[variable] = tableau[row][-1]
+    return y, tableau[rows][columns:columns + rows], pivots
+
+
+def _solve_simplex(matrix):
+    """Exact equilibrium of a zero-sum game by linear programming.
+
+    Shifting every payoff to at least 1 keeps the equilibria and makes the
+    game's value positive. The column player's mix is then ``y / sum(y)``
+    for the optimal ``y`` of ``max sum(y)`` s.t. ``payoffs @ y <= 1``, and
+    the row player's mix comes from the dual prices of the same tableau.
+    """
+    shift = 1.0 - min(min(row) for row in matrix)
+    numpy = simulation.numpy_or_none()
+    if numpy is not None:
+        y, u, pivots = _simplex_numpy(numpy, numpy.asarray(matrix) + shift)
+    else:
+        y, u, pivots = _simplex_lists([[value + shift for value in row] for row in matrix])
+    total = sum(y)
+    return _normalize(u), [value / total for value in y], 1.0 / total - shift, pivots
+
+
+def _solve_fictitious(matrix, iterations):
+    """Approximate equilibrium by fictitious play, see nash_equilibrium()."""
+    rows, columns = len(matrix), len(matrix[0])
+    numpy = simulation.numpy_or_none()
+    row_counts = [0] * rows
+    column_counts = [0] * columns
+    if numpy is not None:
+        payoffs = numpy.asarray(matrix)
+        row_totals = numpy.zeros(rows)  # Row payoffs against the column player's history.
+        column_totals = numpy.zeros(columns)  # Row payoffs the column player has faced.
+        row = column = 0
+        for _ in range(iterations):
+            row_counts[row] += 1
+            column_counts[column] += 1
+            column_totals += payoffs[row]
+            row_totals += payoffs[:, column]
+            row = int(row_totals.argmax())
+            column = int(column_totals.argmin())
+    else:
+        columns_of = list(zip(*matrix))
+        row_totals = [0.0] * rows
+        column_totals = [0.0] * columns
+        row = column = 0
+        for _ in range(iterations):
+            row_counts[row] += 1
+            column_counts[column] += 1
+            column_totals = [total + value for total, value in zip(column_totals, matrix[row])]
+            row_totals = [total + value for total, value in zip(row_totals, columns_of[column])]
+            row = max(range(rows), key=row_totals.__getitem__)
+            column = min(range(columns), key=column_totals.__getitem__)
+    strategy = _normalize(row_counts)
+    opponent_strategy = _normalize(column_counts)
+    return strategy, opponent_strategy, iterations
+
+
+def _guarantees(matrix, strategy, opponent_strategy):
+    """Returns what each player's mix guarantees, as the row player's payoff.
+
+    The row player's mix earns at least the first number against any
+    column, the column player's concedes at most the second against any
+    row; the two meet at an equilibrium.
+    """
+    numpy = simulation.numpy_or_none()
+    if numpy is not None:
+        payoffs = numpy.asarray(matrix)
+        return (float((numpy.asarray(strategy) @ payoffs).min()),
+                float((payoffs @ numpy.asarray(opponent_strategy)).max()))
+    guaranteed = min(sum(p * row[column] for p, row in zip(strategy, matrix)) for column in range(len(matrix[0])))
+    conceded = max(sum(q * payoff for q, payoff in zip(opponent_strategy, row)) for row in matrix)
+    return guaranteed, conceded
+
+
+def nash_equilibrium(matrix, method="simplex", iterations=10_000):
+    """Finds a Nash equilibrium of a zero-sum game.
+
+    Args:
+        matrix (list[list[float]]): The row player's payoffs, see
+            payoff_matrix(); any rectangular matrix works.
+        method (str): ``simplex`` for the exact solution or ``fictitious``
+            for fictitious play.
+        iterations (int): Rounds of fictitious play.
+
+    Returns:
+        Equilibrium: Both players' mixes, the value and the gap.
+
+    Raises:
+        ValueError: On an unknown method or a malformed matrix.
+    """
+    matrix = _check(matrix)
+    if method == "simplex":
+        strategy, opponent_strategy, value, iterations = _solve_simplex(matrix)
+    elif method == "fictitious":
+        if iterations < 1:
+            raise ValueError("fictitious play needs at least one iteration")
+        strategy, opponent_strategy, iterations = _solve_fictitious(matrix, iterations)
+        value = None
+    else:
+        raise ValueError(f"unknown method {method!r}, expected one of {', '.join(METHODS)}")
+    guaranteed, conceded = _guarantees(matrix, strategy, opponent_strategy)
+    if value is None:
+        value = (guaranteed + conceded) / 2
+    return Equilibrium(strategy, opponent_strategy, value, max(0.0, conceded - guaranteed), method, iterations)
+
+
+def best_response(matrix, distribution):
+    """Finds the moves that exploit an observed move distribution best.
+
+    Args:
+        matrix (list[list[float]]): The row player's payoffs.
+        distribution (list[float]): The opponent's (column) moves, as
+            probabilities or plain counts.
+
+    Returns:
+        BestResponse: The best moves, every move's expected payoff and the
+            best payoff.
+
+    Raises:
+        ValueError: If the distribution does not fit the matrix or is empty.
+    """
+    matrix = _check(matrix)
+    if len(distribution) != len(matrix[0]):
+        raise ValueError(f"the distribution needs {len(matrix[0])} entries, not {len(distribution)}")
+    probabilities = _normalize([float(value) for value in distribution])
+    numpy = simulation.numpy_or_none()
+    if numpy is not None:
+        payoffs = (numpy.asarray(matrix) @ numpy.asarray(probabilities)).tolist()
+    else:
+        payoffs = [sum(p * payoff for p, payoff in zip(probabilities, row)) for row in matrix]
+    best = max(payoffs)
+    return BestResponse([move for move, payoff in enumerate(payoffs) if payoff >= best - TOLERANCE], payoffs, best)
+
+
+def exploitability(matrix, strategy):
+    """Returns how much a best-responding opponent gains over the game's value.
+
+    Args:
+        matrix (list[list[float]]): The row player's payoffs of a game.
+        strategy (list[float]): The row player's mix.
+    """
+    matrix = _check(matrix)
+    value = nash_equilibrium(matrix).value
+    guaranteed, _ = _guarantees(matrix, strategy, [1.0] * len(matrix[0]))
+    return max(0.0, value - guaranteed)
+
+
+class BestResponseStrategy(Strategy):
+    """Plays the equilibrium, then exploits what it has seen of the opponent.
+
+    Until ``warmup`` opponent moves are known it mixes like the Nash
+    equilibrium, which cannot lose in expectation. After that it plays a
+    best response to the opponent's moves in the last ``window`` rounds,
+    recomputed every ``interval`` rounds.
+
+    Args:
+        ruleset (Ruleset): The rules, the classic game by default.
+        weights (dict): Win weights, see payoff_matrix().
+        window (int): Number of recent opponent moves remembered.
+        warmup (int): Opponent moves needed before exploiting them.
+        interval (int): Rounds between recomputations of the response.
+    """
+
+    name = "bestresponse"
+    adaptive = True
+
+    def __init__(self, ruleset=None, weights=None, window=256, warmup=32, interval=8):
+        super().__init__()
+        if not 1 <= warmup <= window or interval < 1:
+            raise ValueError("need 1 <= warmup <= window and interval >= 1")
+        self.matrix = payoff_matrix(ruleset, weights)
+        self.window = window
+        self.warmup = warmup
+        self.interval = interval
+        equilibrium = nash_equilibrium(self.matrix)
+        self._equilibrium = list(accumulate(equilibrium.strategy))
+        self._moves = range(len(self.matrix))
+        self.reset()
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.counts = [0] * len(self.matrix)
+        self.history = array("H", bytes(2 * self.window))
+        self.seen = 0
+        self._weights = self._equilibrium
+        self._best = None
+
+    def move(self):
+        if self._best is not None:
+            return self._best[0] if len(self._best) == 1 else self.rng.choice(self._best)
+        return self.rng.choices(self._moves, cum_weights=self._weights)[0]
+
+    def observe(self, own, opponent):
+        slot = self.seen % self.window
+        if self.seen >= self.window:
+            self.counts[self.history[slot]] -= 1
+        self.history[slot] = opponent
+        self.counts[opponent] += 1
+        self.seen += 1
+        if self.seen >= self.warmup and self.seen % self.interval == 0:
+            self._best = best_response(self.matrix, self.counts).moves
+
+    def __repr__(self):
+        return f"{type(self).__name__}(window={self.window}, warmup={self.warmup}, interval={self.interval})"
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls solve`` options to an argument parser."""
+    parser.add_argument("rules", nargs="?", default="rpsls",
+                        help="rpsls, rps7, rps15, rps101 or a JSON rules file (default: rpsls)")
+    parser.add_argument("--weight", action="append", metavar="WINNER,LOSER=WEIGHT",
+                        help="worth of one kind of win (default 1), repeatable")
+    parser.add_argument("--method", choices=METHODS, default="simplex",
+                        help="exact linear program or fictitious play (default: simplex)")
+    parser.add_argument("--iterations", type=int, default=10_000,
+                        help="rounds of fictitious play (default: 10,000)")
+    parser.add_argument("--against", metavar="COUNTS",
+                        help="comma-separated move counts or shares of an opponent to best-respond to")
+
+
+def run(args):
+    """Runs ``rpsls solve``: prints the equilibrium and optionally a best response."""
+    try:
+        ruleset = load_ruleset(args.rules)
+        matrix = payoff_matrix(ruleset, parse_weights(args.weight))
+        against = [float(value) for value in args.against.split(",")] if args.against else None
+        simulation.numpy_or_none()  # Import it before the clock starts.
+        start = time.perf_counter()
+        equilibrium = nash_equilibrium(matrix, args.method, args.iterations)
+        elapsed = time.perf_counter() - start
+        response = best_response(matrix, against) if against is not None else None
+    except (OSError, RulesError, ValueError) as error:
+        sys.exit(f"❌ {error}")
+    print(f"\n{'═' * 70}")
+    print(f"🧮 {ruleset.name}: Nash equilibrium by {equilibrium.method} in {elapsed * 1e3:.2f}ms "
+          f"({equilibrium.iterations} {'pivots' if equilibrium.method == 'simplex' else 'iterations'})")
+    print(f"{'═' * 70}")
+    shares = sorted(enumerate(equilibrium.strategy), key=lambda item: -item[1])
+    for move, share in shares[:15]:
+        if share > TOLERANCE:
+            print(f"  {ruleset.moves[move]:<12} {share:>8.2%}")
+    if len(shares) > 15:
+        print(f"  ... and {len(shares) - 15} more moves")
+    print(f"⚖️  Value: {equilibrium.value:+.6f}   Gap: {equilibrium.gap:.2e}")
+    if response is not None:
+        best = ", ".join(ruleset.moves[move] for move in response.moves)
+        print(f"{'─' * 70}")
+        print(f"🎯 Best response: {best} (expected payoff {response.value:+.4f} per round)")
+    print(f"{'─' * 70}\n")
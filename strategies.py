@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/strategies.py
+"""Computer strategies for Rock-Paper-Scissors-Lizard-Spock.
+
+A strategy picks moves for one side of a game. Every strategy can play one
+round at a time through ``move()``/``observe()``, and strategies that do not
+depend on the game history can also produce a whole block of moves at once
+through ``moves()``, which is what lets the headless simulator run millions of
+rounds per second.
+
+Moves are plain ``int`` values of the ``Action`` enum so that they can be
+packed into ``bytes`` without any conversion.
+
+Strategies are pluggable: built-in ones register themselves with
+``@register_strategy`` and any other ``Strategy`` subclass can be named on
+the command line as ``package.module:ClassName``.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import importlib
+import random
+from array import array
+
+from rockPaperScissorsLizardSpock import ACTION_COUNT, Action, victories
+
+# Maps a random byte onto a move. 255 is the only value that would bias the
+# result (256 is not a multiple of 5), so it is dropped instead.
+_BYTE_TO_MOVE = bytes(value % len(Action) for value in range(256))
+_REJECTED_BYTES = bytes([255])
+
+# Random bytes drawn per refill of a MoveGenerator's buffer.
+MOVE_BUFFER_SIZE = 4096
+
+# The moves that beat each action, indexed by action value.
+_COUNTERS = tuple(
+    tuple(int(winner) for winner in Action if action in victories[winner])
+    for action in Action
+)
+
+# Registered strategies by command-line name, see register_strategy().
+STRATEGIES = {}
+
+
+def register_strategy(cls):
+    """Class decorator making a strategy available by its ``name``.
+
+    Args:
+        cls (type): A Strategy subclass that can be built without arguments.
+
+    Returns:
+        type: The class itself, unchanged.
+    """
+    STRATEGIES[cls.name] = cls
+    return cls
+
+
+class Strategy:
+    """Base class for all computer strategies.
+
+    Subclasses implement ``move()``. Strategies whose moves depend on what
+    happened in earlier rounds set ``adaptive = True`` and update their
+    state in ``observe()``; the simulator then plays them round by round.
+    """
+
+    name = "strategy"
+    adaptive = False
+
+    def __init__(self):
+        self.rng = random.Random()
+
+    def reset(self, seed=None):
+        """Forgets all state and reseeds the strategy's private RNG.
+
+        Args:
+            seed (int): Seed for the random number generator.
+        """
+        self.rng.seed(seed)
+
+    def move(self):
+        """Returns the next move.
+
+        Returns:
+            int: The value of the chosen Action.
+        """
+        raise NotImplementedError
+
+    def observe(self, own, opponent):
+        """Tells the strategy what was played in the last round.
+
+        Args:
+            own (int): The move this strategy played.
+            opponent (int): The move the opponent played.
+        """
+
+    def moves(self, n):
+        """Returns the next ``n`` moves as a ``bytes`` object.
+
+        Args:
+            n (int): Number of moves to generate.
+
+        Returns:
+            bytes: One Action value per byte.
+        """
+        move = self.move
+        return bytes(move() for _ in range(n))
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class MoveGenerator:
+    """Uniformly random moves served from a buffer that is refilled in bulk.
+
+    Each refill draws a block of random bytes and maps it onto moves with
+    ``bytes.translate``, rejecting the one biased byte value, so a move
+    costs an iterator step instead of a ``random.randint()`` call. Bytes
+    are always drawn in whole 32-bit words, which makes the move stream of
+    a seed the same however it is split between move() and moves().
+
+    Args:
+        seed (int): Seed of a private random number generator.
+        buffer_size (int): Random bytes drawn per refill.
+        rng (random.Random): Generator to draw from instead of a private
+            one; ``seed`` is then ignored.
+    """
+
+    def __init__(self, seed=None, buffer_size=MOVE_BUFFER_SIZE, rng=None):
+        self.rng = random.Random(seed) if rng is None else rng
+        self.buffer_size = -(-buffer_size // 4) * 4
+        self.clear()
+
+    def seed(self, seed=None):
+        """Reseeds the generator and drops the buffered moves."""
+        self.rng.seed(seed)
+        self.clear()
+
+    def clear(self):
+        """Drops the buffered moves, e.g. after the RNG was reseeded."""
+        self._buffer = iter(b"")
+        self._next = self._buffer.__next__
+
+    def _draw(self, n):
+        """Draws random bytes for at least ``n`` moves, in whole words."""
+        return self.rng.randbytes(-(-n // 4) * 4).translate(_BYTE_TO_MOVE, _REJECTED_BYTES)
+
+    def move(self):
+        """Returns the next move.
+
+        Returns:
+            int: The value of a uniformly random Action.
+        """
+        try:
+            return self._next()
+        except StopIteration:
+            self._buffer = iter(self._draw(self.buffer_size))
+            self._next = self._buffer.__next__
+            return self.move()
+
+    __next__ = move
+
+    def __iter__(self):
+        return self
+
+    def moves(self, n):
+        """Returns the next ``n`` moves as a ``bytes`` object."""
+        out = bytearray(self._buffer)
+        while len(out) < n:
+            missing = n - len(out)
+            # Ask for 1/64 extra so that the rejected bytes rarely need a refill.
+            out += self._draw(missing + (missing >> 6) + 16)
+        # Whatever is left over is served first by the next call.
+        self._buffer = iter(bytes(out[n:]))
+        self._next = self._buffer.__next__
+        del out[n:]
+        return bytes(out)
+
+
+@register_strategy
+class UniformStrategy(Strategy):
+    """Picks every action with equal probability from a MoveGenerator.
+
+    This is the computer of the interactive game and the default of the
+    simulator, the tournament and the server.
+    """
+
+    name = "uniform"
+
+    def __init__(self):
+        super().__init__()
+        self.generator = MoveGenerator(rng=self.rng)
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.generator.clear()
+
+    def move(self):
+        return self.generator.move()
+
+    def moves(self, n):
+        return self.generator.moves(n)
+
+
+class ConstantStrategy(Strategy):
+    """Always plays the same action (Bart Simpson's "good old rock")."""
+
+    def __init__(self, action=Action.Rock):
+        super().__init__()
+        self.action = Action(action)
+        self.name = self.action.name.lower()
+
+    def move(self):
+        return int(self.action)
+
+    def moves(self, n):
+        return bytes([self.action]) * n
+
+    def __repr__(self):
+        return f"{type(self).__name__}(Action.{self.action.name})"
+
+
+@register_strategy
+class CycleStrategy(Strategy):
+    """Plays Rock, Paper, Scissors, Lizard, Spock in order, forever."""
+
+    name = "cycle"
+
+    def __init__(self):
+        super().__init__()
+        self.position = 0
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.position = 0
+
+    def move(self):
+        action = self.position
+        self.position = (action + 1) % ACTION_COUNT
+        return action
+
+    def moves(self, n):
+        start = self.position
+        count = len(Action)
+        cycle = bytes(range(count))
+        block = (cycle[start:] + cycle[:start]) * (n // count + 1)
+        self.position = (start + n) % count
+        return block[:n]
+
+
+class _PredictingStrategy(Strategy):
+    """Shared machinery of the strategies that predict the opponent.
+
+    Subclasses keep counts of what the opponent played in ``counts`` (five
+    counters per context) and set ``context`` to the offset of the counters
+    that apply to the next round. ``move()`` plays a counter to the most
+    frequent move in that context, or a random move while it knows nothing.
+    """
+
+    adaptive = True
+
+    def __init__(self, contexts, window):
+        super().__init__()
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.counts = array("I", bytes(4 * contexts * len(Action)))
+        # Ring buffer of the counter index bumped in each remembered round.
+        self.history = array("I", bytes(4 * window))
+        self.seen = 0
+        self.context = 0
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.counts = array("I", bytes(4 * len(self.counts)))
+        self.seen = 0
+        self.context = 0
+
+    def predict(self):
+        """Returns the opponent's most likely next move, or None if unknown."""
+        counts = self.counts
+        base = self.context
+        best = None
+        bestCount = 0
+        for action in range(ACTION_COUNT):
+            count = counts[base + action]
+            if count > bestCount:
+                best = action
+                bestCount = count
+        return best
+
+    def move(self):
+        predicted = self.predict()
+        if predicted is None:
+            return self.rng.randrange(ACTION_COUNT)
+        counters = _COUNTERS[predicted]
+        return counters[self.rng.getrandbits(1)] if len(counters) == 2 else self.rng.choice(counters)
+
+    def _remember(self, index):
+        """Counts ``index`` and forgets the round that fell out of the window."""
+        slot = self.seen % self.window
+        if self.seen >= self.window:
+            self.counts[self.history[slot]] -= 1
+        self.history[slot] = index
+        self.counts[index] += 1
+        self.seen += 1
+
+
+@register_strategy
+class FrequencyStrategy(_PredictingStrategy):
+    """Counters the opponent's most frequent move over the last rounds.
+
+    Args:
+        window (int): Number of recent rounds remembered.
+    """
+
+    name = "frequency"
+
+    def __init__(self, window=1024):
+        super().__init__(1, window)
+
+    def observe(self, own, opponent):
+        self._remember(opponent)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(window={self.window})"
+
+
+@register_strategy
+class MarkovStrategy(_PredictingStrategy):
+    """Counters the opponent's likeliest move given their last ``order`` moves.
+
+    The opponent's recent moves are packed into one base-5 number, which
+    selects a row of transition counts, so every update and prediction is
+    O(1) whatever the order.
+
+    Args:
+        order (int): Number of previous opponent moves the prediction uses.
+        window (int): Number of recent transitions remembered.
+    """
+
+    name = "markov"
+
+    def __init__(self, order=2, window=4096):
+        if order < 1:
+            raise ValueError("order must be at least 1")
+        super().__init__(len(Action) ** order, window)
+        self.order = order
+        self.states = len(Action) ** order
+        self.state = 0
+
+    def reset(self, seed=None):
+        super().reset(seed)
+        self.state = 0
+
+    def observe(self, own, opponent):
+        width = ACTION_COUNT
+        self._remember(self.state * width + opponent)
+        self.state = (self.state * width + opponent) % self.states
+        self.context = self.state * width
+
+    def __repr__(self):
+        return f"{type(self).__name__}(order={self.order}, window={self.window})"
+
+
+def strategy_names():
+    """Lists the names make_strategy() understands without a plug-in path.
+
+    Returns:
+        list[str]: Registered strategies followed by one constant strategy
+            per action.
+    """
+    return sorted(STRATEGIES) + [action.name.lower() for action in Action]
+
+
+def make_strategy(name):
+    """Creates a strategy from its command-line name.
+
+    Args:
+        name (str): A registered name such as ``uniform``, the name of an
+            action (for example ``rock``), case-insensitive, or a plug-in
+            given as ``package.module:ClassName``.
+
+    Returns:
+        Strategy: A fresh strategy instance.
+
+    Raises:
+        ValueError: If the name is not known or does not name a Strategy.
+    """
+    key = name.strip()
+    if ":" in key:
+        module_name, _, attribute = key.partition(":")
+        try:
+            factory = getattr(importlib.import_module(module_name), attribute)
+        except (ImportError, AttributeError) as error:
+            raise ValueError(f"Cannot load strategy {name!r}: {error}") from error
+        strategy = factory()
+        if not isinstance(strategy, Strategy):
+            raise ValueError(f"{name!r} is not a Strategy")
+        return strategy
+    key = key.lower()
+    if key in STRATEGIES:
+        return STRATEGIES[key]()
+    for action in Action:
+        if action.name.lower() == key:
+            return ConstantStrategy(action)
+    raise ValueError(f"Unknown strategy: {name!r}")
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/streaming.py
+"""Streaming replay of recorded moves without prompts, art or pauses.
+
+``rpsls stream`` reads moves from a file or stdin, resolves every round
+through the game's rules table and writes one result per round as JSON
+Lines or CSV. Every stage is a generator, so a move log of any size is
+processed in constant memory.
+
+Two input formats are understood:
+
+* text, one round per line: ``<user>`` or ``<user> <computer>``, where a
+  move is a number (``4``) or a name (``spock``), separated by spaces or a
+  comma. Rounds without a computer move are played by ``--opponent``.
+  Blank lines and lines starting with ``#`` are skipped.
+* packed (``--packed``), one byte per round holding ``user * 5 + computer``.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import csv
+import io
+import json
+import sys
+from contextlib import ExitStack
+
+from rockPaperScissorsLizardSpock import EXPLANATION_TABLE, OUTCOME_TABLE, Action, parseAction
+from simulation import Tally
+from strategies import make_strategy
+
+PACKED_CHUNK_SIZE = 1 << 16
+
+_WIDTH = len(Action)
+_PAIRS = range(_WIDTH * _WIDTH)
+
+
+def _json_body(pair):
+    """Renders the part of a JSON Lines record that follows the round number."""
+    user, computer = divmod(pair, _WIDTH)
+    fields = json.dumps({
+        "user": Action(user).name,
+        "computer": Action(computer).name,
+        "outcome": OUTCOME_TABLE[pair].name.lower(),
+        "explanation": EXPLANATION_TABLE[pair],
+    }, ensure_ascii=False)
+    return ", " + fields[1:] + "\n"
+
+
+def _csv_body(pair):
+    """Renders the part of a CSV row that follows the round number."""
+    user, computer = divmod(pair, _WIDTH)
+    row = io.StringIO()
+    csv.writer(row, lineterminator="\n").writerow(
+        ["", Action(user).name, Action(computer).name, OUTCOME_TABLE[pair].name.lower(), EXPLANATION_TABLE[pair]])
+    return row.getvalue()
+
+
+# Everything but the round number is fixed per pairing, so it is rendered once.
+_JSON_BODIES = tuple(_json_body(pair) for pair in _PAIRS)
+_CSV_BODIES = tuple(_csv_body(pair) for pair in _PAIRS)
+CSV_HEADER = "round,user,computer,outcome,explanation\n"
+
+
+def read_lines(lines):
+    """Parses text rounds.
+
+    Args:
+        lines: An iterable of lines, such as an open text file.
+
+    Yields:
+        tuple: ``(user, computer)`` move values; ``computer`` is None when
+            the line only holds the user's move.
+
+    Raises:
+        ValueError: On a line that is not one or two moves.
+    """
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = line.replace(",", " ").split()
+        try:
+            if len(fields) == 1:
+                yield int(parseAction(fields[0])), None
+            elif len(fields) == 2:
+                yield int(parseAction(fields[0])), int(parseAction(fields[1]))
+            else:
+                raise ValueError("expected one or two moves")
+        except ValueError as error:
+            raise ValueError(f"line {number}: {error}") from None
+
+
+def read_packed(stream, chunk_size=PACKED_CHUNK_SIZE):
+    """Parses packed rounds, one ``user * 5 + computer`` byte per round.
+
+    Args:
+        stream: A binary file object.
+        chunk_size (int): Bytes read at a time.
+
+    Yields:
+        tuple: ``(user, computer)`` move values.
+
+    Raises:
+        ValueError: On a byte that is not a valid pairing.
+    """
+    pairs = [divmod(pair, _WIDTH) for pair in _PAIRS]
+    offset = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        if max(chunk) >= len(pairs):
+            bad = next(index for index, pair in enumerate(chunk) if pair >= len(pairs))
+            raise ValueError(f"byte {offset + bad}: {chunk[bad]} is not a valid pairing")
+        for pair in chunk:
+            yield pairs[pair]
+        offset += len(chunk)
+
+
+def pack_rounds(rounds):
+    """Packs ``(user, computer)`` rounds into the format read_packed() reads.
+
+    Args:
+        rounds: An iterable of ``(user, computer)`` move values.
+
+    Returns:
+        bytes: One byte per round.
+    """
+    return bytes(user * _WIDTH + computer for user, computer in rounds)
+
+
+def play(rounds, strategy):
+    """Fills in missing computer moves by asking ``strategy``.
+
+    Args:
+        rounds: An iterable of ``(user, computer)``; computer may be None.
+        strategy (Strategy): Plays the missing computer moves.
+
+    Yields:
+        tuple: ``(user, computer)`` with both moves set.
+    """
+    move, observe = strategy.move, strategy.observe
+    for user, computer in rounds:
+        if computer is None:
+            computer = move()
+        observe(computer, user)
+        yield user, computer
+
+
+def resolve_rounds(rounds):
+    """Resolves rounds through the game's outcome table.
+
+    Args:
+        rounds: An iterable of ``(user, computer)`` move values.
+
+    Yields:
+        int: The pair index ``user * 5 + computer`` of each round, which
+            indexes OUTCOME_TABLE and EXPLANATION_TABLE.
+    """
+    for user, computer in rounds:
+        yield user * _WIDTH + computer
+
+
+def write_results(pairs, out, output_format="jsonl"):
+    """Writes one record per resolved round.
+
+    Args:
+        pairs: An iterable of pair indexes, as made by resolve_rounds().
+        out: A text file object.
+        output_format (str): ``jsonl`` or ``csv``.
+
+    Returns:
+        Tally: Wins, losses and ties of the user.
+    """
+    if output_format == "csv":
+        bodies = _CSV_BODIES
+        out.write(CSV_HEADER)
+        prefix = "{}"
+    else:
+        bodies = _JSON_BODIES
+        prefix = '{{"round": {}'
+    counts = [0] * len(bodies)
+    write = out.write
+    for number, pair in enumerate(pairs, start=1):
+        write(prefix.format(number) + bodies[pair])
+        counts[pair] += 1
+    outcomes = [0, 0, 0]
+    for pair, count in enumerate(counts):
+        outcomes[OUTCOME_TABLE[pair]] += count
+    return Tally(outcomes[1], outcomes[2], outcomes[0])
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls stream`` options to an argument parser."""
+    parser.add_argument("input", nargs="?", default="-", help="move log to read (default: stdin)")
+    parser.add_argument("--packed", action="store_true",
+                        help="input holds one user*5+computer byte per round")
+    parser.add_argument("-f", "--format", choices=("jsonl", "csv"), default="jsonl",
+                        help="output format (default: jsonl)")
+    parser.add_argument("-o", "--output", default="-", help="file to write (default: stdout)")
+    parser.add_argument("--opponent", default="uniform",
+                        help="strategy playing missing computer moves (default: uniform)")
+    parser.add_argument("--seed", type=int, help="seed for the opponent")
+
+
+def run(args):
+    """Runs ``rpsls stream``; the final score goes to stderr."""
+    strategy = make_strategy(args.opponent)
+    strategy.reset(args.seed)
+    with ExitStack() as stack:
+        if args.packed:
+            source = sys.stdin.buffer if args.input == "-" else stack.enter_context(open(args.input, "rb"))
+            rounds = read_packed(source)
+        else:
+            source = sys.stdin if args.input == "-" else stack.enter_context(open(args.input, encoding="utf-8"))
+            rounds = play(read_lines(source), strategy)
+        out = sys.stdout if args.output == "-" else stack.enter_context(
+            open(args.output, "w", encoding="utf-8", newline=""))
+        try:
+            tally = write_results(resolve_rounds(rounds), out, args.format)
+        except ValueError as error:
+            sys.exit(f"❌ {args.input}: {error}")
+    print(f"📊 SCORE: Wins: {tally.wins} | Losses: {tally.losses} | Ties: {tally.ties}", file=sys.stderr)
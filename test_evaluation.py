@@ -0,0 +1,51 @@
+# test_evaluation.py
+import pytest
+
+import evaluation
+import rockPaperScissorsLizardSpock as game
+import simulation
+import strategies
+
+
+def test_clear_edge_is_accepted_after_the_first_chunk():
+    result = evaluation.evaluate(strategies.ConstantStrategy(game.Action.Rock),
+                                 strategies.ConstantStrategy(game.Action.Scissors), seed=1)
+    assert result.decision == "H1"
+    assert result.rounds == evaluation.FIRST_CHUNK_SIZE
+    assert result.llr >= result.upper_bound
+    assert result.win_rate == 1.0 and result.edge == 1.0
+
+
+@pytest.mark.parametrize("a, b", [("uniform", "uniform"), ("cycle", "markov"), ("paper", "scissors")])
+def test_no_edge_is_rejected(a, b):
+    result = evaluation.evaluate(strategies.make_strategy(a), strategies.make_strategy(b), seed=3)
+    assert result.decision == "H0"
+    assert result.llr <= result.lower_bound
+    assert result.rounds < 1_000_000
+    assert sum(result.tally) == result.rounds
+
+
+def test_inconclusive_when_rounds_run_out():
+    result = evaluation.evaluate(strategies.UniformStrategy(), strategies.UniformStrategy(),
+                                 max_rounds=1_500, seed=3)
+    assert result.decision == "inconclusive"
+    assert result.rounds == 1_500
+    with pytest.raises(ValueError):
+        evaluation.evaluate(strategies.UniformStrategy(), strategies.UniformStrategy(), delta=0)
+
+
+def test_confidence_intervals():
+    low, high = evaluation.wilson_interval(520, 1000)
+    assert low < 0.52 < high and high - low == pytest.approx(0.062, abs=0.002)
+    assert evaluation.wilson_interval(0, 0) == (0.0, 1.0)
+    edge, (low, high) = evaluation.edge_interval(simulation.Tally(400, 400, 200))
+    assert edge == 0 and low == pytest.approx(-high)
+    lower, upper = evaluation.sprt_bounds(0.05, 0.05)
+    assert lower == pytest.approx(-upper) and upper == pytest.approx(2.944, abs=0.001)
+
+
+def test_evaluate_command(capsys):
+    game.cli(["evaluate", "-a", "rock", "-b", "lizard", "--seed", "1"])
+    out = capsys.readouterr().out
+    assert "rock beats lizard by at least 1.0%" in out
+    assert "Win rate of decisive rounds: 100.00%" in out
@@ -0,0 +1,216 @@
+# test_events.py
+import asyncio
+import random
+from collections import Counter
+
+import pytest
+
+import events
+import rockPaperScissorsLizardSpock as game
+import server
+import simulation
+from strategies import make_strategy
+
+Action = game.Action
+Outcome = game.Outcome
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(simulation, "np", None)
+    return request.param
+
+
+class Recorder:
+    def __init__(self):
+        self.pairs = bytearray()
+        self.latencies = []
+
+    def consume(self, pairs, latencies):
+        self.pairs += pairs
+        self.latencies += latencies or []
+
+
+def _random_pairs(count, seed=1):
+    rng = random.Random(seed)
+    return bytes(rng.randrange(events.PAIR_COUNT) for _ in range(count))
+
+
+def test_bus_batches_rounds_in_order():
+    bus = events.EventBus(batch_size=3)
+    recorder = bus.subscribe(Recorder())
+    bus.publish(Action.Spock, Action.Rock, latency=0.5)
+    bus.publish(Action.Rock, Action.Rock)
+    assert recorder.pairs == b""  # Still buffered.
+    bus.publish_block(bytes([0, 1]))
+    bus.publish(Action.Lizard, Action.Spock)
+    bus.flush()
+    assert bytes(recorder.pairs) == bytes([20, 0, 0, 1, 19]) and recorder.latencies == [0.5]
+    assert bus.published == 5
+    event = next(events.decode(bytes([20])))
+    assert event == (Action.Spock, Action.Rock, Outcome.Win, "Spock vaporizes rock")
+
+
+def test_sliding_window_counts_the_last_rounds(backend):
+    pairs = _random_pairs(25_000)
+    window = events.SlidingWindow(5000)
+    rng = random.Random(2)
+    start = 0
+    while start < len(pairs):
+        block = pairs[start:start + rng.choice([1, 7, 300, 2000, 6000])]
+        window.consume(block)
+        start += len(block)
+        last = pairs[max(0, start - 5000):start]
+        assert window.counts == [last.count(bytes([code])) for code in range(events.PAIR_COUNT)]
+    assert len(window) == 5000 and sum(window.outcome_counts()) == 5000
+    wins = Counter(code // 5 for code in last if game.OUTCOME_TABLE[code] == Outcome.Win)
+    moves = Counter(code // 5 for code in last)
+    assert window.win_rates() == pytest.approx([wins[action] / moves[action] for action in Action])
+    assert window.snapshot()["user_moves"]["Rock"] == moves[Action.Rock]
+
+
+def test_streaks_across_blocks():
+    streaks = events.Streaks()
+    win, loss, tie = bytes([20]), bytes([1]), bytes([0])  # Spock-Rock, Rock-Paper, Rock-Rock.
+    streaks.consume(loss + win * 3)
+    streaks.consume(win * 4)
+    streaks.consume(win * 2 + tie + loss * 5 + tie)
+    assert streaks.longest == [1, 9, 5] and (streaks.current, streaks.length) == (Outcome.Tie, 1)
+    streaks.consume(tie * 3)
+    assert streaks.length == 4 and streaks.longest[Outcome.Tie] == 4
+
+    pairs = _random_pairs(20_000, seed=5)
+    outcomes = [game.OUTCOME_TABLE[code] for code in pairs]
+    longest = [0, 0, 0]
+    run = 0
+    for index, outcome in enumerate(outcomes):
+        run = run + 1 if index and outcomes[index - 1] == outcome else 1
+        longest[outcome] = max(longest[outcome], run)
+    chunked = events.Streaks()
+    for start in range(0, len(pairs), 999):
+        chunked.consume(pairs[start:start + 999])
+    assert chunked.longest == longest and chunked.length == run
+
+
+def test_latency_quantiles_within_the_relative_error(backend):
+    rng = random.Random(3)
+    latencies = [rng.lognormvariate(-6, 1.5) for _ in range(20_000)] + [0.0] * 100
+    sketch = events.LatencySketch(relative_accuracy=0.01)
+    for start in range(0, len(latencies), 1000):
+        sketch.consume(b"", latencies[start:start + 1000])
+    ordered = sorted(latencies)
+    for fraction in (0.5, 0.9, 0.99):
+        exact = ordered[int(fraction * (len(ordered) - 1))]
+        assert sketch.quantile(fraction) == pytest.approx(exact, rel=0.011)
+    assert sketch.quantile(0.001) == 0.0 and sketch.count == 20_100
+
+    bounded = events.LatencySketch(relative_accuracy=0.01, max_buckets=300)
+    bounded.add(latencies)
+    assert len(bounded.buckets) <= 300 < len(sketch.buckets)
+    assert bounded.quantile(0.99) == pytest.approx(sketch.quantile(0.99))
+
+
+def test_count_min_sketch_never_undercounts():
+    sketch = events.CountMinSketch(width=256, depth=4)
+    truth = Counter(random.Random(4).randrange(5000) for _ in range(20_000))
+    for key, count in truth.items():
+        sketch.add(key, count)
+    assert all(sketch.estimate(key) >= count for key, count in truth.items())
+    assert sum(sketch.estimate(key) - count for key, count in truth.items()) / len(truth) < 2 * 20_000 / 256
+    with pytest.raises(ValueError):
+        events.CountMinSketch(width=100)
+
+
+@pytest.mark.parametrize("length", [3, 8])
+def test_top_sequences_find_the_repeated_pattern(length, backend):
+    rng = random.Random(6)
+    favourite = [Action.Spock, Action.Lizard, Action.Spock, Action.Rock, Action.Paper, Action.Spock,
+                 Action.Lizard, Action.Rock][:length]
+    moves = []
+    while len(moves) < 30_000:
+        moves += favourite if rng.random() < 0.3 else [rng.randrange(5) for _ in range(length)]
+    pairs = bytes(move * 5 + rng.randrange(5) for move in moves)
+    top = events.TopSequences(length, k=3, width=1 << 12)
+    for start in range(0, len(pairs), 5000):
+        top.consume(pairs[start:start + 5000])
+    best, count = top.top()[0]
+    assert best == tuple(favourite)
+    exact = sum(1 for index in range(len(moves) - length + 1) if moves[index:index + length] == favourite)
+    assert count >= exact
+
+
+def test_top_sequences_do_not_depend_on_block_sizes(backend):
+    rng = random.Random(7)
+    moves = []
+    while len(moves) < 3000:
+        moves += [Action.Rock, Action.Spock, Action.Spock, Action.Paper] if rng.random() < 0.4 else [rng.randrange(5)]
+    pairs = bytes(move * 5 for move in moves)
+    whole = events.TopSequences(4, k=3)
+    whole.consume(pairs)
+    single = events.TopSequences(4, k=3)
+    for index in range(len(pairs)):
+        single.consume(pairs[index:index + 1])
+    varied = events.TopSequences(4, k=3)
+    start = 0
+    while start < len(pairs):
+        block = pairs[start:start + rng.choice([1, 2, 3, 50, 2000])]
+        varied.consume(block)
+        start += len(block)
+    assert single.top() == varied.top() == whole.top() != []
+
+
+def test_simulation_publishes_every_round():
+    for opponent in ("uniform", "markov"):
+        bus = events.EventBus()
+        dashboard = bus.subscribe(events.Dashboard(window=1000))
+        tally = simulation.simulate(5000, make_strategy("uniform"), make_strategy(opponent), seed=1,
+                                    chunk_size=1024, bus=bus)
+        assert bus.published == dashboard.rounds == 5000
+        outcomes = dashboard.window.outcome_counts()
+        assert sum(outcomes) == 1000 and outcomes[Outcome.Win] <= tally.wins
+        assert "📡 5,000 rounds" in dashboard.render()
+
+
+def test_server_publishes_rounds_with_latency():
+    bus = events.EventBus(batch_size=1)
+    dashboard = bus.subscribe(events.Dashboard())
+
+    async def scenario():
+        listener = await server.GameServer(delay=0, strategy="rock", events=bus).start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await reader.readline()
+            writer.write(b"paper\nspock\nQUIT\n")
+            for _ in range(3):
+                await reader.readline()
+            writer.close()
+
+    asyncio.run(scenario())
+    assert dashboard.streaks.longest[Outcome.Win] == 2 and dashboard.latency.count == 2
+    assert "Latency p50" in dashboard.render()
+
+
+def test_cli_simulate_dashboard(capsys):
+    game.cli(["simulate", "-n", "20000", "--seed", "1", "--dashboard", "--window", "500"])
+    out = capsys.readouterr().out
+    assert "the last 500 in the window" in out and "🔁 1." in out
+
+
+def test_interactive_games_publish_to_the_dashboard(monkeypatch, capsys):
+    answers = iter(["4", "y", "4", "n"])
+    monkeypatch.setattr("builtins.input", lambda *_args: next(answers))
+    game.cli(["--seed", "3", "--no-delay", "--dashboard"])
+    assert "📡 2 rounds" in capsys.readouterr().out
+
+    import tui
+    bus = events.EventBus()
+    dashboard = bus.subscribe(events.Dashboard())
+    ui = tui.GameUI(make_strategy("uniform"), game.Clock(float("inf")), random.Random(1), events=bus)
+    for key in "0k":
+        ui.press(key, 0.0)
+    ui.press("q", 0.0)
+    assert dashboard.rounds == 2 and dashboard.window.counts[ui.round[0] * 5 + ui.round[1]] >= 1
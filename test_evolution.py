@@ -0,0 +1,75 @@
+# test_evolution.py
+import random
+from array import array
+
+import pytest
+
+import evolution
+import rockPaperScissorsLizardSpock as game
+from simulation import simulate
+from strategies import ConstantStrategy
+
+
+def _constant(action, memory=1):
+    return bytes([action]) * evolution.table_size(memory)
+
+
+def test_matches_follow_the_game_rules():
+    for user in game.Action:
+        for computer in game.Action:
+            tally = evolution.play_match(_constant(user), _constant(computer), 1000)
+            outcome = game.resolve(user, computer)[0]
+            expected = {game.Outcome.Win: (1000, 0, 0), game.Outcome.Loss: (0, 1000, 0),
+                        game.Outcome.Tie: (0, 0, 1000)}[outcome]
+            assert tally == expected
+
+
+def test_cycle_counting_matches_round_by_round_play():
+    rng = random.Random(4)
+    population = evolution.random_population(6, 2, rng)
+    size = evolution.table_size(2)
+    genomes = [bytes(population[start:start + size]) for start in range(0, len(population), size)]
+    for a, b in zip(genomes, genomes[1:]):
+        for rounds in (1, 7, 1000, 12345):
+            expected = simulate(rounds, evolution.EvolvedStrategy(a), evolution.EvolvedStrategy(b))
+            assert evolution.play_match(a, b, rounds) == expected
+
+
+def test_evolved_strategy_plays_its_table():
+    genome = bytearray(_constant(game.Action.Paper, 2))
+    tally = simulate(1000, evolution.EvolvedStrategy(genome), ConstantStrategy(game.Action.Rock))
+    assert tally.wins == 1000
+
+
+def test_results_do_not_depend_on_workers_or_resuming(tmp_path):
+    path = tmp_path / "run.evo"
+    serial = evolution.evolve(60, 4, memory=1, opponents=4, rounds=50, seed=3, workers=1)
+    evolution.evolve(60, 2, memory=1, opponents=4, rounds=50, seed=3, workers=1, checkpoint=str(path))
+    assert evolution.load_checkpoint(path)[1].generation == 2
+    resumed = evolution.evolve(60, 4, opponents=4, rounds=50, workers=2, checkpoint=str(path), resume=True)
+    assert resumed.generation == 4
+    assert resumed.population == serial.population and list(resumed.fitness) == list(serial.fitness)
+
+
+def test_next_generation_keeps_the_elite():
+    rng = random.Random(1)
+    population = evolution.random_population(50, 1, rng)
+    fitness = array("d", [index / 50 for index in range(50)])
+    children = evolution.next_generation(population, fitness, 25, rng, elite=0.1)
+    assert len(children) == len(population) and not children.translate(None, bytes(range(5)))
+    assert children[:25] == population[49 * 25:]
+
+
+def test_checkpoint_validation(tmp_path):
+    path = tmp_path / "bad.evo"
+    path.write_bytes(b"RPSLSREC" + bytes(40))
+    with pytest.raises(evolution.CheckpointError):
+        evolution.load_checkpoint(path)
+    with pytest.raises(ValueError):
+        evolution.evolve(10, 1, opponents=10, workers=1)
+
+
+def test_cli_evolve(capsys):
+    game.cli(["evolve", "-p", "30", "-g", "2", "--memory", "1", "--opponents", "3", "-j", "1"])
+    out = capsys.readouterr().out
+    assert "Generation    2" in out and "vs markov" in out
@@ -0,0 +1,85 @@
+# test_history.py
+import builtins
+
+import pytest
+
+import history
+import rockPaperScissorsLizardSpock as game
+import simulation
+import timing
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def scan_mode(request, monkeypatch):
+    if request.param == "pure-python":
+        monkeypatch.setattr(simulation, "np", None)
+    elif simulation.numpy_or_none() is None:
+        pytest.skip("NumPy is not installed")
+
+
+def test_records_are_fixed_width(tmp_path):
+    path = tmp_path / "games.bin"
+    with history.HistoryStore(path) as store:
+        store.append(game.Action.Rock, game.Action.Scissors, player=3, timestamp=1.5)
+    data = path.read_bytes()
+    assert len(data) == history.HEADER.size + history.RECORD.size
+    assert history.RECORD.unpack(data[history.HEADER.size:]) == (1.5, 3, 0, 2, game.Outcome.Win)
+
+
+def test_player_totals_survive_reopen_rotation_and_compaction(tmp_path, scan_mode):
+    path = tmp_path / "games.bin"
+    with history.HistoryStore(path, buffer_size=3) as store:
+        for _ in range(10):
+            store.append(game.Action.Spock, game.Action.Rock, player=1)    # win
+        for _ in range(4):
+            store.append(game.Action.Spock, game.Action.Lizard, player=2)  # loss
+        store.rotate()
+        store.append(game.Action.Paper, game.Action.Paper, player=1)       # tie
+        assert len(store.segments()) == 2
+
+    with history.HistoryStore(path) as store:
+        expected = {1: (10, 0, 1), 2: (0, 4, 0)}
+        assert store.player_totals() == expected
+        assert store.outcome_counts() == (10, 4, 1)
+        store.append(game.Action.Rock, game.Action.Lizard, player=2)
+        assert store.totals(2) == (1, 4, 0)
+        assert store.compact() == 1
+        assert store.segments() == [path]
+        assert store.outcome_counts() == (1, 0, 1)
+
+    with history.HistoryStore(path) as store:
+        assert store.player_totals() == {1: (10, 0, 1), 2: (1, 4, 0)}
+        assert store.totals() == (11, 4, 1)
+
+
+def test_torn_records_are_dropped_and_foreign_files_rejected(tmp_path):
+    path = tmp_path / "games.bin"
+    with history.HistoryStore(path) as store:
+        store.append(game.Action.Rock, game.Action.Rock)
+    with open(path, "ab") as stream:
+        stream.write(b"\x00" * 5)
+    with history.HistoryStore(path) as store:
+        assert store.totals() == (0, 0, 1)
+    other = tmp_path / "notes.txt"
+    other.write_text("Bazinga! This is not a history file.")
+    with pytest.raises(history.HistoryError):
+        history.HistoryStore(other)
+
+
+def test_append_rejects_moves_that_are_not_actions(tmp_path):
+    with history.HistoryStore(tmp_path / "games.bin") as store:
+        for user, computer in [(0, 7), (5, 0), (-1, 2)]:
+            with pytest.raises(ValueError):
+                store.append(user, computer)
+        assert store.totals() == (0, 0, 0)
+
+
+def test_main_appends_rounds(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(timing.time, "sleep", lambda *_: None)
+    inputs = iter(["4", "y", "4", "n"])
+    monkeypatch.setattr(builtins, "input", lambda _prompt="": next(inputs))
+    monkeypatch.setattr(game.random, "randint", lambda a, b: 2)
+    with history.HistoryStore(tmp_path / "games.bin") as store:
+        game.main(history=store)
+        assert store.totals() == (2, 0, 0)
+    capsys.readouterr()
@@ -0,0 +1,72 @@
+# test_leaderboard.py
+import asyncio
+
+import leaderboard
+import rockPaperScissorsLizardSpock as game
+import server
+
+
+def test_batched_rounds_rank_players(tmp_path):
+    path = tmp_path / "scores.db"
+    with leaderboard.Leaderboard(str(path), batch_size=5, flush_interval=3600) as board:
+        for _ in range(3):
+            board.record("Sheldon", game.Action.Spock, game.Action.Rock)
+        board.record("Penny", game.Action.Rock, game.Action.Paper)
+        assert board.rounds_played("Sheldon") == 0  # Still batched.
+        board.record("Leonard", game.Action.Rock, game.Action.Rock)  # Fifth round: the batch is written.
+        assert board.rounds_played("Sheldon") == 3
+        assert [entry.name for entry in board.top(2)] == ["Sheldon", "Leonard"]
+
+    with leaderboard.Leaderboard(str(path)) as board:
+        top = board.top()
+        assert top[0] == ("Sheldon", 3, 0, 0)
+        assert top[-1] == ("Penny", 0, 1, 0)
+        assert board.rounds_played("Leonard") == 1
+
+
+def test_top_is_cached_until_flush():
+    board = leaderboard.Leaderboard(":memory:", batch_size=100, flush_interval=3600)
+    board.record("Howard", game.Action.Lizard, game.Action.Paper)
+    assert board.top() == []
+    assert board.top() is board.top()
+    board.flush()
+    assert board.top() == [("Howard", 1, 0, 0)]
+    board.close()
+
+
+def test_ratings_are_updated_stored_and_ranked(tmp_path):
+    path = str(tmp_path / "scores.db")
+    with leaderboard.Leaderboard(path, batch_size=100, flush_interval=3600) as board:
+        for _ in range(5):
+            board.record("Sheldon", game.Action.Spock, game.Action.Rock, opponent="rock (bot)")
+            board.record("Penny", game.Action.Scissors, game.Action.Rock, opponent="rock (bot)")
+        assert board.ratings["Sheldon"] > board.ratings["rock (bot)"] > board.ratings["Penny"]
+        assert board.top_rated() == []  # Written with the batch.
+        board.flush()
+        assert [name for name, _ in board.top_rated()] == ["Sheldon", "rock (bot)", "Penny"]
+        sheldon = board.ratings.entry("Sheldon")
+
+    with leaderboard.Leaderboard(path) as board:
+        assert board.ratings.entry("Sheldon") == sheldon and board.top_rated(1)[0] == ("Sheldon", sheldon)
+        assert sheldon.games == 5 and board.ratings.entry("rock (bot)").games == 10
+
+
+def test_server_records_named_players():
+    board = leaderboard.Leaderboard(":memory:", batch_size=1)
+
+    async def scenario():
+        listener = await server.GameServer(delay=0, strategy="rock", leaderboard=board).start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await reader.readline()
+            writer.write(b"NAME Raj\npaper\nQUIT\n")
+            replies = [await reader.readline() for _ in range(3)]
+            writer.close()
+            return replies
+
+    replies = asyncio.run(scenario())
+    assert replies[0] == b"OK Raj\n"
+    assert board.top() == [("Raj", 1, 0, 0)]
+    assert [name for name, _ in board.top_rated()] == ["Raj", "rock (bot)"]
+    board.close()
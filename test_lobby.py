@@ -0,0 +1,106 @@
+# test_lobby.py
+import asyncio
+
+import pytest
+
+import lobby
+import rockPaperScissorsLizardSpock as game
+
+
+def test_queue_pairs_the_nearest_rating_oldest_first():
+    queue = lobby.MatchQueue(bucket_width=50, base_gap=100, widen_rate=50)
+    for index, rating in enumerate([1000, 1510, 1520, 2000]):
+        queue.push(lobby.Ticket(f"p{index}", rating, joined=index))
+    assert len(queue) == 4
+    # Same bucket as p1 and p2: the one waiting longest is picked.
+    assert queue.match(lobby.Ticket("new", 1530, joined=10), now=10).name == "p1"
+    assert queue.match(lobby.Ticket("new", 1800, joined=10), now=10) is None  # Nobody within 100 points.
+    assert len(queue) == 3
+
+
+def test_reach_widens_while_waiting():
+    queue = lobby.MatchQueue(bucket_width=50, base_gap=100, widen_rate=50)
+    low = lobby.Ticket("low", 1000, joined=0)
+    high = lobby.Ticket("high", 1400, joined=0)
+    queue.push(low)
+    queue.push(high)
+    assert queue.sweep(now=1) == []
+    assert queue.sweep(now=6) == [(low, high)]
+    assert len(queue) == 0
+    late = lobby.Ticket("late", 1000, joined=7)
+    queue.push(high)
+    queue.push(late)
+    assert queue.sweep(now=15) == [(high, late)]  # Oldest first, whatever the buckets.
+
+
+def test_removed_tickets_are_never_matched():
+    queue = lobby.MatchQueue()
+    gone = lobby.Ticket("gone", 1500, joined=0)
+    stays = lobby.Ticket("stays", 1500, joined=1)
+    queue.push(gone)
+    queue.push(stays)
+    queue.remove(gone)
+    assert queue.match(lobby.Ticket("new", 1500, joined=2), now=2) is stays
+    assert queue.match(lobby.Ticket("new", 1500, joined=2), now=2) is None
+
+
+def test_lobby_resolves_rounds_and_forfeits():
+    async def scenario():
+        players = lobby.Lobby(move_timeout=0.05, queue_timeout=0.2, sweep_interval=0.01)
+        first, second = await asyncio.gather(players.join("alice", 1500), players.join("bob", 1550))
+        first.submit(game.Action.Spock)
+        second.submit(game.Action.Scissors)
+        results = await asyncio.gather(first.result(), second.result())
+
+        assert players.rating("alice") > 1500 > players.rating("bob")  # Too far apart to be matched now.
+        third, fourth = await asyncio.gather(players.join("alice", 1500), players.join("bob", 1500))
+        third.submit(game.Action.Rock)  # Bob never moves.
+        forfeit = await asyncio.gather(third.result(), fourth.result())
+
+        with pytest.raises(TimeoutError):
+            await players.join("carol")
+        players.close()
+        return players, results, forfeit
+
+    players, results, forfeit = asyncio.run(scenario())
+    assert results[0] == (game.Outcome.Win, game.Action.Spock, game.Action.Scissors, "Spock smashes scissors")
+    assert results[1][0] == game.Outcome.Loss
+    assert forfeit[0][0] == game.Outcome.Win and forfeit[1][:2] == (game.Outcome.Loss, None)
+    assert players.matches == 2 and players.forfeits == 1 and players.timeouts == 1
+    assert players.ratings.entry("bob").games == 2
+
+
+async def _client(port, lines):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    replies = [await reader.readline()]
+    for line in lines:
+        if line is not None:
+            writer.write(f"{line}\n".encode())
+        replies.append(await reader.readline())
+    writer.close()
+    return [reply.decode().strip() for reply in replies]
+
+
+def test_line_protocol():
+    async def scenario():
+        players = lobby.Lobby(move_timeout=1.0, queue_timeout=1.0)
+        listener = await lobby.LobbyServer(players).start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            # None waits for a reply without sending anything.
+            replies = await asyncio.gather(_client(port, ["NAME alice", "spock", "QUEUE", None, "spock", "QUIT"]),
+                                           _client(port, ["NAME bob", "QUEUE", None, "rock", "QUIT"]))
+        players.close()
+        return replies
+
+    alice, bob = asyncio.run(scenario())
+    assert alice[1] == "OK alice 1500" and alice[2].startswith("ERROR Not in a match")
+    assert alice[4] == "MATCHED bob 1500" and alice[5] == "RESULT WIN Spock Rock Spock vaporizes rock"
+    assert alice[6] == "BYE 1 0 0"
+    assert bob[3] == "MATCHED alice 1500" and bob[4] == "RESULT LOSS Rock Spock Spock vaporizes rock"
+
+
+def test_simulated_load():
+    report = asyncio.run(lobby.simulate(400, rounds=2, seed=3, ramp=0.2, think=0.01))
+    assert report.matches >= 390 and report.forfeits == 0 and report.timeouts == 0
+    assert report.gap_p50 <= 100
@@ -0,0 +1,115 @@
+# test_profiling.py
+import asyncio
+import builtins
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import profiling
+import rockPaperScissorsLizardSpock as game
+import server
+import timing
+
+
+@pytest.fixture
+def profiler():
+    yield profiling.enable()
+    profiling.disable()
+
+
+def test_disabled_profiling_leaves_the_functions_alone(profiler):
+    wrapped = game.determineWinner
+    assert wrapped.__wrapped__.__name__ == "determineWinner"
+    profiling.disable()
+    assert game.determineWinner is wrapped.__wrapped__
+    assert "__wrapped__" not in vars(timing.Clock.pause)
+    assert profiling.PROFILER is None
+
+
+def test_only_imported_modules_are_wrapped():
+    code = ("import sys, profiling, rockPaperScissorsLizardSpock; profiling.enable(); "
+            "print(sorted({'server', 'leaderboard', 'tui'} & set(sys.modules))); "
+            "import tui; print(tui.GameUI.start_round.__wrapped__.__name__, tui.decode_keys.__wrapped__.__name__); "
+            "profiling.disable(); print(hasattr(tui.GameUI.frame, '__wrapped__'))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split("\n")[:3] == ["[]", "start_round decode_keys", "False"]
+
+
+def test_tui_rounds_are_profiled(profiler):
+    import tui
+    from strategies import make_strategy
+
+    ui = tui.GameUI(make_strategy("uniform"), timing.Clock(float("inf")))
+    ui.press("k", 0.0)
+    ui.frame(0.0)
+    stages = profiler.to_dict()["stages"]
+    assert stages["session"]["count"] == 1 and stages["rules"]["count"] == 1 and stages["render"]["count"] >= 1
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = profiling.Histogram()
+    for micros in [1] * 90 + [1000] * 9 + [50_000]:
+        histogram.record(micros / 1e6)
+    assert histogram.count == 100 and histogram.maximum == pytest.approx(0.05)
+    assert histogram.quantile(0.5) <= 2e-6
+    assert 1e-3 <= histogram.quantile(0.99) <= 1024e-6 * 2
+    assert histogram.quantile(1.0) == pytest.approx(0.05)
+
+
+def test_game_stages_are_timed_exclusively(profiler, monkeypatch, capsys):
+    monkeypatch.setattr(game, "delayA", 0.01)
+    inputs = iter(["4", "y", "0", "n"])
+    monkeypatch.setattr(builtins, "input", lambda _prompt="": next(inputs))
+    game.main(clock=timing.Clock(sleep=time.sleep))
+    capsys.readouterr()
+
+    stages = profiler.to_dict()["stages"]
+    for stage in ("input", "rng", "rules", "render", "countdown", "sleep"):
+        assert stages[stage]["count"] > 0, stage
+    assert stages["rules"]["count"] >= 2  # Every round, even with its frames cached.
+    assert stages["input"]["count"] == 2 and stages["sleep"]["count"] == 2 * (6 + 2)
+    # The reveal pauses inside determineWinner() count as sleep, not render.
+    assert stages["sleep"]["sum_seconds"] >= 2 * (3.5 + 1.6) * 0.01 * 0.9
+    assert stages["render"]["sum_seconds"] < stages["sleep"]["sum_seconds"]
+    assert "render" in profiler.summary()
+
+
+def test_cli_profile_dump(monkeypatch, tmp_path, capsys):
+    inputs = iter(["1", "n"])
+    monkeypatch.setattr(builtins, "input", lambda _prompt="": next(inputs))
+    path = tmp_path / "profile.json"
+    game.cli(["--no-delay", "--profile-output", str(path)])
+    assert "PROFILE" in capsys.readouterr().err
+    data = json.loads(path.read_text())
+    assert data["stages"]["render"]["count"] == 1
+    assert len(data["bucket_bounds_seconds"]) == len(data["stages"]["render"]["buckets"])
+    assert profiling.PROFILER is None and not hasattr(game.determineWinner, "__wrapped__")
+
+
+def test_prometheus_endpoint(profiler):
+    async def scenario():
+        game_server = server.GameServer(delay=0, strategy="rock")
+        listener = await game_server.start(port=0)
+        metrics = await asyncio.start_server(game_server.handle_metrics, "127.0.0.1", 0)
+        async with listener, metrics:
+            reader, writer = await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1])
+            await reader.readline()
+            writer.write(b"paper\n")
+            await reader.readline()
+            writer.close()
+            reader, writer = await asyncio.open_connection("127.0.0.1", metrics.sockets[0].getsockname()[1])
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            return (await reader.read()).decode()
+
+    response = asyncio.run(scenario())
+    head, body = response.split("\r\n\r\n", 1)
+    assert head.startswith("HTTP/1.0 200 OK")
+    assert "# TYPE rpsls_stage_seconds histogram" in body
+    assert 'rpsls_stage_seconds_count{stage="session"} 1' in body
+    assert 'rpsls_stage_seconds_bucket{stage="input",le="+Inf"} 1' in body
+    assert "rpsls_rounds_played 1" in body
@@ -0,0 +1,113 @@
+# test_ratings.py
+import random
+
+import pytest
+
+import history
+import ratings
+import rockPaperScissorsLizardSpock as game
+import simulation
+
+Outcome = game.Outcome
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(simulation, "np", None)
+    return request.param
+
+
+def _random_games(table, count, players=20, seed=1):
+    rng = random.Random(seed)
+    rows = [table.row(f"p{index}") for index in range(players)]
+    firsts, seconds, outcomes = [], [], []
+    for _ in range(count):
+        first, second = rng.sample(rows, 2)
+        firsts.append(first)
+        seconds.append(second)
+        outcomes.append(rng.choice(list(Outcome)))
+    return firsts, seconds, outcomes
+
+
+def test_glicko2_matches_the_worked_example(backend):
+    # The example from Glickman's "Example of the Glicko-2 system".
+    table = ratings.RatingTable(tau=0.5)
+    table.set("player", 1500, 200)
+    for name, rating, deviation in [("a", 1400, 30), ("b", 1550, 100), ("c", 1700, 300)]:
+        table.set(name, rating, deviation)
+    rows = [table.row(name) for name in ["a", "b", "c"]]
+    table.update([table.row("player")] * 3, rows, [Outcome.Win, Outcome.Loss, Outcome.Loss])
+    rating = table.entry("player")
+    assert rating.rating == pytest.approx(1464.06, abs=0.01)
+    assert rating.deviation == pytest.approx(151.52, abs=0.01)
+    assert rating.volatility == pytest.approx(0.05999, abs=1e-5)
+    assert rating.games == 3
+
+
+def test_elo_update():
+    table = ratings.RatingTable("elo", k=32)
+    table.record("kirk", "khan", Outcome.Win)
+    assert table["kirk"] == 1516 and table["khan"] == 1484
+    table.record("kirk", "khan", Outcome.Tie)
+    assert table["kirk"] + table["khan"] == pytest.approx(3000)
+    assert table["kirk"] < 1516
+    with pytest.raises(ValueError):
+        ratings.RatingTable("trueskill")
+
+
+@pytest.mark.parametrize("system", ratings.SYSTEMS)
+def test_periods_of_one_game_replay_incremental_updates(system, backend):
+    incremental = ratings.RatingTable(system)
+    batch = ratings.RatingTable(system)
+    firsts, seconds, outcomes = _random_games(batch, 300)
+    names = list(batch)
+    for first, second, outcome in zip(firsts, seconds, outcomes):
+        incremental.record(names[first], names[second], outcome)
+    batch.update(firsts, seconds, outcomes, period=1)
+    for name in names:
+        assert batch.entry(name) == pytest.approx(incremental.entry(name))
+
+
+@pytest.mark.parametrize("system", ratings.SYSTEMS)
+def test_backends_agree_on_long_periods(system, monkeypatch):
+    pytest.importorskip("numpy")
+    vectorized = ratings.RatingTable(system)
+    games = _random_games(vectorized, 2000, players=50, seed=7)
+    vectorized.update(*games, period=100)
+    monkeypatch.setattr(simulation, "np", None)
+    scalar = ratings.RatingTable(system)
+    _random_games(scalar, 0, players=50)
+    scalar.recompute(*games, period=100)
+    for name in vectorized:
+        assert scalar.entry(name) == pytest.approx(vectorized.entry(name))
+
+
+def test_table_is_a_mapping_and_ranks_players():
+    table = ratings.RatingTable()
+    table.record("spock", "kirk", Outcome.Win)
+    table.record("spock", "mccoy", Outcome.Win)
+    assert len(table) == 3 and "kirk" in table and "sulu" not in table
+    assert table.get("sulu", 1000) == 1000 and table.entry("sulu") == ratings.DEFAULT
+    assert [name for name, _ in table.top(2)] == ["spock", "mccoy"]
+    table.recompute([], [], [])
+    assert table.entry("spock") == ratings.DEFAULT
+
+
+def test_ratings_from_history(tmp_path, backend, capsys):
+    path = tmp_path / "games.bin"
+    with history.HistoryStore(path) as store:
+        for _ in range(30):
+            store.append(game.Action.Spock, game.Action.Rock, player=1)
+            store.append(game.Action.Rock, game.Action.Paper, player=2)
+        store.rotate()
+        store.append(game.Action.Lizard, game.Action.Lizard, player=3)
+        table = ratings.from_history(store, period=10)
+    names = [name for name, _ in table.top()]
+    assert names[0] == 1 and names[-1] == 2 and sorted(names[1:3], key=str) == [3, "computer"]
+    assert table.entry("computer").games == 61
+    game.cli(["ratings", str(path), "--system", "elo", "-k", "2"])
+    out = capsys.readouterr().out
+    assert "61 games" in out and "  1  1 " in out
@@ -0,0 +1,87 @@
+# test_replay.py
+import builtins
+import sys
+
+import pytest
+
+import replay
+import rockPaperScissorsLizardSpock as game
+import timing
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(timing.time, "sleep", lambda *_args: None)
+
+
+def _piped_input(monkeypatch, answers):
+    """Answers prompts like input() reading from a pipe."""
+    answers = iter(answers)
+
+    def answer(prompt=""):
+        sys.stdout.write(prompt)
+        return next(answers)
+
+    monkeypatch.setattr(builtins, "input", answer)
+
+
+def test_replay_prints_exactly_what_the_game_printed(monkeypatch, tmp_path, capsys):
+    path = tmp_path / "session.rec"
+    _piped_input(monkeypatch, ["4", "y", "lizard", "0", "y", "2", "n"])
+    game.cli(["--speed", "50", "--record", str(path), "--opponent", "markov"])
+    played = capsys.readouterr().out
+    assert "**Spock**" in played and "Invalid selection" in played
+
+    monkeypatch.setattr(builtins, "input", None)  # The replay must not ask anybody.
+    game.cli(["--no-delay", "replay", str(path)])
+    assert capsys.readouterr().out == played
+
+    recording = replay.read_recording(path)
+    assert recording.countdown and len(recording.events) == 5
+    summary = replay.summarize(recording)
+    assert summary.rounds == 3 and summary.invalid == 1 and summary.finished
+
+
+def test_same_seed_same_session(monkeypatch, capsys):
+    outputs = []
+    for _ in range(2):
+        _piped_input(monkeypatch, ["1", "y", "3", "n"])
+        game.cli(["--no-delay", "--seed", "7"])
+        outputs.append(capsys.readouterr().out)
+    assert outputs[0] == outputs[1]
+
+
+def test_summary_of_an_unfinished_recording(tmp_path, capsys):
+    path = tmp_path / "session.rec"
+    with replay.SessionRecorder(path, seed=-3, countdown=False, buffer_size=2) as recorder:
+        for _ in range(10):
+            recorder.append(game.Action.Spock, game.Action.Rock)
+        recorder.append(game.Action.Rock, game.Action.Paper)
+        recorder.invalid()
+    game.cli(["replay", "--summary", str(path)])
+    out = capsys.readouterr().out
+    assert "seed -3, 11 rounds, 1 invalid selections, unfinished" in out
+    assert "SCORE: Wins: 10 | Losses: 1 | Ties: 0" in out
+
+    game.cli(["replay", str(path)])  # Stops where the session stopped.
+    assert capsys.readouterr().out.count("YOU WIN") == 10
+
+
+def test_seeds_outside_64_bits_are_refused(tmp_path, capsys):
+    path = tmp_path / "session.rec"
+    with pytest.raises(SystemExit):
+        game.cli(["--seed", str(1 << 63), "--record", str(path)])
+    assert "range" in capsys.readouterr().err and not path.exists()
+    with replay.SessionRecorder(path, seed=(1 << 63) - 1) as recorder:
+        recorder.finish()
+    assert replay.read_recording(path).seed == (1 << 63) - 1
+
+
+def test_bad_recordings_are_rejected(tmp_path):
+    path = tmp_path / "notes.rec"
+    path.write_bytes(b"Bazinga!")
+    with pytest.raises(replay.RecordingError):
+        replay.read_recording(path)
+    path.write_bytes(replay.HEADER.pack(replay.MAGIC, replay.VERSION, 0, 1) + b"\x63")
+    with pytest.raises(replay.RecordingError):
+        replay.read_recording(path)
@@ -0,0 +1,56 @@
+# test_rounds.py
+import sys
+
+import pytest
+
+import rockPaperScissorsLizardSpock as game
+import rounds
+import streaming
+
+
+def test_round_record_converts_to_and_from_actions():
+    record = rounds.RoundRecord.from_actions(game.Action.Spock, game.Action.Rock)
+    assert (record.user, record.computer, record.outcome) == (4, 0, game.Outcome.Win)
+    assert record.to_actions() == (game.Action.Spock, game.Action.Rock, game.Outcome.Win)
+    assert record == rounds.RoundRecord(4, 0)
+    assert not hasattr(record, "__dict__")
+    assert sys.getsizeof(record) < sys.getsizeof((game.Action.Spock, game.Action.Rock, game.Outcome.Win))
+
+
+def test_round_log_matches_resolve():
+    log = rounds.RoundLog()
+    for user in game.Action:
+        for computer in game.Action:
+            log.append(user, computer)
+    log.extend([0, 4], b"\x02\x01")
+    assert len(log) == 27
+    for index, record in enumerate(log[:25]):
+        outcome, _ = game.resolve(record.user, record.computer)
+        assert log.actions(index)[2] is outcome
+    assert log[25] == rounds.RoundRecord(game.Action.Rock, game.Action.Scissors)
+    assert log.tally() == (11, 11, 5)
+    assert log.nbytes >= 3 * len(log)
+
+
+def test_round_log_packed_round_trip():
+    pairs = [(4, 0), (1, 1), (2, 4)]
+    log = rounds.RoundLog.from_packed(streaming.pack_rounds(pairs))
+    assert [(record.user, record.computer) for record in log] == pairs
+    assert log.packed() == streaming.pack_rounds(pairs)
+    assert [log.actions(i)[2] for i in range(3)] == [game.Outcome.Win, game.Outcome.Tie, game.Outcome.Loss]
+
+
+def test_round_log_rejects_bad_moves():
+    log = rounds.RoundLog()
+    with pytest.raises(ValueError):
+        log.extend([0, 5], [0, 0])
+    with pytest.raises(ValueError):
+        log.extend([0], [0, 1])
+    with pytest.raises(ValueError):
+        rounds.RoundLog.from_packed(b"\x19")
+    for user, computer in [(5, 0), (0, -1), (-1, 4)]:
+        with pytest.raises(ValueError):
+            log.append(user, computer)
+        with pytest.raises(ValueError):
+            rounds.RoundRecord(user, computer)
+    assert len(log) == 0
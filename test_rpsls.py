@@ -1,17 +1,22 @@
 # test_rpsls.py
 import builtins
+import math
+import os
+import subprocess
+import sys
 import types
 import pytest
 
 # Import the game and art modules
 import rockPaperScissorsLizardSpock as game
+import timing
 from ascii_images import AsciiArt
 
 
 @pytest.fixture(autouse=True)
 def no_sleep(monkeypatch):
     # Make time.sleep a no-op to speed up tests
-    monkeypatch.setattr(game.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(timing.time, "sleep", lambda *_args, **_kwargs: None)
 
 
 @pytest.fixture
@@ -146,6 +151,28 @@ def test_victories_and_explanations_are_consistent():
     assert len(game.victory_explanations) == 10
 
 
+def test_resolve_matches_victories_table():
+    assert len(game.OUTCOME_TABLE) == len(game.EXPLANATION_TABLE) == 25
+    for user in game.Action:
+        for comp in game.Action:
+            outcome, explanation = game.resolve(user, comp)
+            if user == comp:
+                assert outcome == game.Outcome.Tie and explanation == ""
+            elif comp in game.victories[user]:
+                assert outcome == game.Outcome.Win
+                assert explanation == game.victory_explanations[(user, comp)]
+            else:
+                assert outcome == game.Outcome.Loss
+                assert explanation == game.victory_explanations[(comp, user)]
+
+
+def test_determineWinner_returns_outcome(capsys):
+    assert game.determineWinner(game.Action.Rock, game.Action.Lizard) == game.Outcome.Win
+    assert game.determineWinner(game.Action.Rock, game.Action.Spock) == game.Outcome.Loss
+    assert game.determineWinner(game.Action.Rock, game.Action.Rock) == game.Outcome.Tie
+    capsys.readouterr()
+
+
 def test_showBattleScene_uses_art_when_available(capsys):
     # Use a known pair that exists in AsciiArt.BATTLE_SCENES
     user = game.Action.Rock
@@ -200,4 +227,109 @@ def test_invalid_selection_in_main_then_valid(monkeypatch, capsys, reset_delay):
     assert "Invalid selection" in out
     assert "It's a tie" in out or "TIE" in out
     assert "SCORE: Wins: 0 | Losses: 0 | Ties: 1" in out
-    assert "FINAL SCORE: Wins: 0 | Losses: 0 | Ties: 1" in out
\ No newline at end of file
+    assert "FINAL SCORE: Wins: 0 | Losses: 0 | Ties: 1" in out
+
+def test_main_with_adaptive_opponent(monkeypatch, capsys, reset_delay):
+    import strategies
+
+    # Rock three times; the frequency opponent counters from the second round on.
+    inputs = iter(["0", "y", "0", "y", "0", "n"])
+    monkeypatch.setattr(builtins, "input", lambda _prompt="": next(inputs))
+    monkeypatch.setattr(game.random, "choice", lambda seq: seq[0])
+    opponent = strategies.FrequencyStrategy()
+    opponent.reset(1)
+
+    game.main(opponent)
+    out = capsys.readouterr().out
+    final = out.split("FINAL SCORE:")[1].splitlines()[0]
+    assert "Losses: 2" in final or "Losses: 3" in final
+
+
+def test_determineWinner_writes_cached_frames_once_without_delay(monkeypatch):
+    class CountingStdout:
+        def __init__(self):
+            self.chunks = []
+
+        def write(self, text):
+            self.chunks.append(text)
+
+    monkeypatch.setattr(game, "delayA", 0)
+    monkeypatch.setattr(game.random, "choice", lambda seq: seq[0])
+    stdout = CountingStdout()
+    monkeypatch.setattr(game.sys, "stdout", stdout)
+
+    game.determineWinner(game.Action.Rock, game.Action.Scissors)
+    assert len(stdout.chunks) == 1
+    out = stdout.chunks[0]
+    assert "ROCK CRUSHES SCISSORS!" in out and game.victory_quotes[0] in out
+    assert game.roundFrames(game.Action.Rock, game.Action.Scissors) is game.roundFrames(0, 2)
+
+
+def test_clock_scales_and_skips_pauses():
+    from timing import Clock
+
+    pauses = []
+    Clock(speed=2, sleep=pauses.append).pause(1.0)
+    Clock(speed=math.inf, sleep=pauses.append).pause(1.0)
+    Clock(sleep=pauses.append).pause(0)
+    assert pauses == [0.5]
+    with pytest.raises(ValueError):
+        Clock(speed=0)
+
+
+def test_injected_clock_paces_countdown_and_reveal(capsys):
+    from timing import Clock
+
+    pauses = []
+    clock = Clock(speed=4, sleep=pauses.append)
+    game.countDown(clock)
+    game.determineWinner(game.Action.Paper, game.Action.Rock, clock)
+    assert pauses == pytest.approx([0.15] * 5 + [0.125] + [0.2] * 2)
+    assert "**Spock**" in capsys.readouterr().out
+
+    fast = Clock(speed=math.inf, sleep=pauses.append)
+    game.countDown(fast)
+    game.determineWinner(game.Action.Paper, game.Action.Rock, fast)
+    out = capsys.readouterr().out
+    assert "**Spock**" not in out and "PAPER COVERS ROCK" in out
+    assert len(pauses) == 8
+
+
+def test_speed_options(monkeypatch):
+    from timing import parseSpeed, speedFromEnvironment
+
+    assert parseSpeed("max") == math.inf and parseSpeed("2.5") == 2.5
+    with pytest.raises(ValueError):
+        parseSpeed("-1")
+    monkeypatch.setenv("RPSLS_SPEED", "3")
+    assert speedFromEnvironment() == 3.0
+
+    clocks = []
+    monkeypatch.setattr(game, "main", lambda opponent=None, clock=None, *_rest: clocks.append(clock))
+    game.cli(["--no-delay"])
+    game.cli(["--speed", "0.5"])
+    game.cli([])
+    assert [clock.speed for clock in clocks] == [math.inf, 0.5, 3.0]
+
+
+def test_import_defers_art_argparse_and_numpy():
+    code = ("import sys, rockPaperScissorsLizardSpock, simulation, strategies; "
+            "print(sorted({'ascii_images', 'argparse', 'numpy'} & set(sys.modules)))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+    assert game.actionArt(game.Action.Rock) == AsciiArt.ROCK
+    assert game.AsciiArt is game.loadArt()
+
+
+def test_cli_seeds_the_default_opponent(monkeypatch):
+    import strategies
+
+    sessions = []
+    monkeypatch.setattr(game, "main", lambda opponent=None, clock=None, *_rest: sessions.append(opponent.moves(50)))
+    game.cli(["--seed", "42", "--no-delay"])
+    game.cli(["--seed", "42", "--no-delay"])
+    assert sessions[0] == sessions[1]
+    expected = strategies.UniformStrategy()
+    expected.reset(42)
+    assert sessions[0] == expected.moves(50)
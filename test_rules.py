@@ -0,0 +1,91 @@
+# test_rules.py
+import json
+import random
+
+import pytest
+
+import rockPaperScissorsLizardSpock as game
+import rules
+
+
+def test_classic_ruleset_matches_the_game():
+    classic = rules.load_ruleset("rpsls")
+    for user in game.Action:
+        for computer in game.Action:
+            assert classic.resolve(user, computer) == game.resolve(user, computer)
+    assert classic.outcome_table == bytes(game.OUTCOME_TABLE)
+
+
+@pytest.mark.parametrize("name, size", [("rps7", 7), ("rps15", 15), ("rps101", 101)])
+def test_builtin_variants_are_fair_tournaments(name, size):
+    ruleset = rules.load_ruleset(name)
+    assert len(ruleset) == size
+    assert all(mask.bit_count() == (size - 1) // 2 for mask in ruleset.beats)
+    rock, scissors, paper = (ruleset.value(move) for move in ("rock", "scissors", "paper"))
+    assert ruleset.resolve(rock, scissors)[0] == game.Outcome.Win
+    assert ruleset.resolve(scissors, paper)[0] == game.Outcome.Win
+    assert ruleset.resolve(paper, rock) == (game.Outcome.Win, "Paper beats rock")
+    assert ruleset.resolve(rock, paper) == (game.Outcome.Loss, "Paper beats rock")
+
+
+@pytest.mark.parametrize("name", ["rpsls", "rps7", "rps15", "rps101"])
+def test_resolve_many_matches_resolve(name):
+    ruleset = rules.load_ruleset(name)
+    rng = random.Random(5)
+    users, computers = ruleset.random_moves(5000, rng), ruleset.random_moves(5000, rng)
+    assert max(users) < len(ruleset) and len(set(users)) == len(ruleset)
+    outcomes, tally = ruleset.resolve_many(users, computers)
+    assert list(outcomes) == [ruleset.resolve(u, c)[0] for u, c in zip(users, computers)]
+    assert sum(tally) == 5000
+    with pytest.raises(ValueError):
+        ruleset.resolve_many([len(ruleset)], [0])
+
+
+def test_non_cyclic_large_variant_uses_the_table():
+    ruleset = rules.load_ruleset("rps101")
+    shuffled = rules.Ruleset("shuffled", ruleset.moves, ruleset.beats)
+    users, computers = bytes(range(101)), bytes(reversed(range(101)))
+    assert shuffled.resolve_many(users, computers) == ruleset.resolve_many(users, computers)
+
+
+def test_rules_file(tmp_path):
+    path = tmp_path / "rps3.json"
+    path.write_text(json.dumps({
+        "name": "RPS",
+        "moves": ["Rock", "Paper", "Scissors"],
+        "beats": {"Rock": ["scissors"], "Paper": ["Rock"], "Scissors": ["Paper"]},
+        "explanations": {"Rock": {"Scissors": "Rock crushes scissors"}},
+    }))
+    ruleset = rules.load_ruleset(str(path))
+    assert ruleset.resolve(2, 0) == (game.Outcome.Loss, "Rock crushes scissors")
+    assert ruleset.resolve(ruleset.value("1"), ruleset.value("PAPER"))[0] == game.Outcome.Tie
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"moves": ["Rock", "Paper", "Scissors", "Well"], "cyclic": True}, "odd number"),
+    ({"moves": ["Rock", "rock", "Paper"], "cyclic": True}, "unique"),
+    ({"moves": ["Rock", "Paper", "Scissors"]}, "beats"),
+    ({"moves": ["Rock", "Paper", "Scissors"], "beats": {"Rock": ["Dynamite"]}}, "unknown move"),
+    ({"moves": ["Rock", "Paper", "Scissors"], "beats": {"Rock": ["Rock"], "Paper": ["Rock"], "Scissors": ["Paper"]}},
+     "itself"),
+    ({"moves": ["Rock", "Paper", "Scissors"], "beats": {"Rock": ["Paper", "Scissors"], "Paper": ["Scissors"]}},
+     "instead of 1"),
+    ({"moves": ["A", "B", "C", "D", "E"],
+      "beats": {"A": ["B", "C"], "B": ["C", "A"], "C": ["D", "E"], "D": ["E", "A"], "E": ["B", "D"]}},
+     "exactly once"),
+    ({"moves": ["Rock", "Paper", "Scissors"], "beats": [["Scissors"], ["Rock"], ["Paper"]]}, "beats"),
+    ({"moves": ["Rock", "Paper", "Scissors"], "beats": {"Rock": "Scissors"}}, "beats"),
+    ({"moves": ["Rock", "Paper", "Scissors"], "cyclic": True, "explanations": {"Rock": ["Scissors"]}},
+     "explanations"),
+])
+def test_unfair_rules_are_rejected(data, message):
+    with pytest.raises(rules.RulesError, match=message):
+        rules.Ruleset.from_dict(data)
+
+
+def test_rules_command(capsys):
+    game.cli(["rules", "rps7", "--resolve", "water", "rock", "-n", "1000", "--seed", "1"])
+    out = capsys.readouterr().out
+    assert "RPS-7: 7 moves, each beats 3" in out
+    assert "Water vs Rock: WIN (Water beats rock)" in out
+    assert "SCORE: Wins:" in out
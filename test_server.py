@@ -0,0 +1,54 @@
+# test_server.py
+import asyncio
+
+import loadtest
+import rockPaperScissorsLizardSpock as game
+import server
+import strategies
+
+
+def test_session_keeps_score():
+    session = server.GameSession(strategies.ConstantStrategy(game.Action.Scissors))
+    assert session.play(game.Action.Rock)[0] == game.Outcome.Win
+    assert session.play(game.Action.Paper)[:2] == (game.Outcome.Loss, game.Action.Scissors)
+    assert session.play(game.Action.Scissors)[0] == game.Outcome.Tie
+    assert session.score == "1 1 1"
+
+
+async def _talk(port, lines):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    replies = [await reader.readline()]
+    for line in lines:
+        writer.write(f"{line}\n".encode())
+        replies.append(await reader.readline())
+    writer.close()
+    return [reply.decode().strip() for reply in replies]
+
+
+def test_line_protocol():
+    async def scenario():
+        listener = await server.GameServer(delay=0, strategy="scissors").start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            return await _talk(port, ["spock", "2", "dynamite", "SCORE", "QUIT"])
+
+    hello, win, tie, error, score, bye = asyncio.run(scenario())
+    assert hello.startswith("HELLO ")
+    assert win == "RESULT WIN Spock Scissors 1 0 0 Spock smashes scissors"
+    assert tie == "RESULT TIE Scissors Scissors 1 0 1"
+    assert error.startswith("ERROR Invalid selection")
+    assert score == "SCORE 1 0 1"
+    assert bye == "BYE 1 0 1"
+
+
+def test_slow_rounds_do_not_block_other_clients():
+    async def scenario():
+        listener = await server.GameServer(delay=0.02, strategy="uniform").start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            return await loadtest.load_test(port=port, clients=50, rounds=3, seed=1)
+
+    report = asyncio.run(scenario())
+    assert report.rounds == 150 and report.errors == 0
+    # 50 clients x 3 rounds of ~0.1s each: concurrent, so far below 15s.
+    assert report.elapsed < 3
@@ -0,0 +1,124 @@
+# test_simulation.py
+import pytest
+
+import rockPaperScissorsLizardSpock as game
+import simulation
+import strategies
+
+
+def test_constant_strategies_follow_the_rules():
+    for a in game.Action:
+        for b in game.Action:
+            tally = simulation.simulate(100, strategies.ConstantStrategy(a), strategies.ConstantStrategy(b))
+            if a == b:
+                assert tally == (0, 0, 100)
+            elif b in game.victories[a]:
+                assert tally == (100, 0, 0)
+            else:
+                assert tally == (0, 100, 0)
+
+
+def test_uniform_simulation_is_reproducible_and_balanced():
+    n = 200_000
+    first = simulation.simulate(n, strategies.UniformStrategy(), strategies.UniformStrategy(), seed=7)
+    second = simulation.simulate(n, strategies.UniformStrategy(), strategies.UniformStrategy(), seed=7)
+    assert first == second
+    assert sum(first) == n
+    # Ties happen one time in five, wins and losses two times in five each.
+    assert abs(first.ties / n - 0.2) < 0.01
+    assert abs(first.wins / n - 0.4) < 0.01
+
+
+def test_block_and_round_paths_agree():
+    n = 1_003
+    block = simulation.simulate(n, strategies.CycleStrategy(), strategies.ConstantStrategy(game.Action.Paper),
+                                chunk_size=64)
+    cycle = strategies.CycleStrategy()
+    cycle.adaptive = True  # Force the round-by-round path.
+    rounds = simulation.simulate(n, cycle, strategies.ConstantStrategy(game.Action.Paper))
+    assert block == rounds
+    assert sum(block) == n
+
+
+def test_uniform_moves_are_valid_actions():
+    strategy = strategies.UniformStrategy()
+    strategy.reset(1)
+    moves = strategy.moves(10_000)
+    assert len(moves) == 10_000
+    assert set(moves) == {int(a) for a in game.Action}
+
+
+def test_move_generator_stream_does_not_depend_on_batching():
+    single = strategies.MoveGenerator(seed=3, buffer_size=10)
+    batched = strategies.MoveGenerator(seed=3)
+    expected = bytes(single.move() for _ in range(1000))
+    mixed = bytes([batched.move()]) + batched.moves(499) + bytes(next(batched) for _ in range(500))
+    assert mixed == expected
+    assert set(expected) == {int(a) for a in game.Action}
+    batched.seed(3)
+    assert batched.moves(1000) == expected
+
+
+def test_make_strategy_names():
+    assert isinstance(strategies.make_strategy("uniform"), strategies.UniformStrategy)
+    assert strategies.make_strategy("Spock").action == game.Action.Spock
+    with pytest.raises(ValueError):
+        strategies.make_strategy("dynamite")
+
+
+def test_cli_simulate(capsys):
+    game.cli(["simulate", "-n", "1000", "-a", "rock", "-b", "scissors"])
+    out = capsys.readouterr().out
+    assert "SCORE: Wins: 1000 | Losses: 0 | Ties: 0" in out
+
+
+def test_resolve_many_matches_resolve():
+    users = [int(a) for a in game.Action for _ in game.Action]
+    comps = [int(b) for _ in game.Action for b in game.Action]
+    outcomes, tally = simulation.resolve_many(users, comps)
+    assert [int(o) for o in outcomes] == [game.resolve(a, b)[0] for a, b in zip(users, comps)]
+    assert tally == (10, 10, 5)
+
+
+@pytest.mark.parametrize("moves", [[0.5], [1.0, 2.0], [0, 1.5]])
+def test_resolve_many_rejects_non_integer_moves(moves, monkeypatch):
+    users = list(moves)
+    with pytest.raises(ValueError):
+        simulation.resolve_many(users, [0] * len(users))
+    monkeypatch.setattr(simulation, "np", None)
+    with pytest.raises(ValueError):
+        simulation.resolve_many(users, [0] * len(users))
+
+
+def test_resolve_many_pure_python_fallback(monkeypatch):
+    monkeypatch.setattr(simulation, "np", None)
+    outcomes, tally = simulation.resolve_many(b"\x00\x00\x04", b"\x02\x01\x04")
+    assert outcomes == bytes([game.Outcome.Win, game.Outcome.Loss, game.Outcome.Tie])
+    assert tally == (1, 1, 1)
+    with pytest.raises(ValueError):
+        simulation.resolve_many([0, 5], [0, 0])
+    with pytest.raises(ValueError):
+        simulation.resolve_many([0], [0, 1])
+
+
+def test_adaptive_strategies_learn_patterns():
+    n = 5_000
+    for adaptive in (strategies.FrequencyStrategy(), strategies.MarkovStrategy(order=1)):
+        tally = simulation.simulate(n, adaptive, strategies.ConstantStrategy(game.Action.Lizard), seed=5)
+        assert tally.wins > 0.99 * n
+    tally = simulation.simulate(n, strategies.MarkovStrategy(order=2), strategies.CycleStrategy(), seed=5)
+    assert tally.wins > 0.99 * n
+
+
+def test_adaptive_memory_is_bounded():
+    markov = strategies.MarkovStrategy(order=3, window=100)
+    markov.reset(1)
+    for i in range(1_000):
+        markov.observe(markov.move(), i % 5)
+    assert len(markov.counts) == 5 ** 4
+    assert sum(markov.counts) == 100
+    frequency = strategies.FrequencyStrategy(window=10)
+    for _ in range(50):
+        frequency.observe(0, game.Action.Paper)
+    assert frequency.predict() == game.Action.Paper
+    assert frequency.move() in (game.Action.Scissors, game.Action.Lizard)
@@ -0,0 +1,94 @@
+# test_solver.py
+import random
+
+import pytest
+
+import rockPaperScissorsLizardSpock as game
+import rules
+import simulation
+import solver
+from strategies import ConstantStrategy
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(simulation, "np", None)
+    return request.param
+
+
+def test_payoff_matrix_follows_the_rules():
+    matrix = solver.payoff_matrix()
+    for user in game.Action:
+        for computer in game.Action:
+            outcome = game.resolve(user, computer)[0]
+            assert matrix[user][computer] == {game.Outcome.Tie: 0, game.Outcome.Win: 1, game.Outcome.Loss: -1}[outcome]
+
+    weighted = solver.payoff_matrix(weights={(game.Action.Spock, game.Action.Scissors): 2, ("rock", "lizard"): 0.5})
+    assert weighted[game.Action.Spock][game.Action.Scissors] == 2
+    assert weighted[game.Action.Scissors][game.Action.Spock] == -2
+    assert weighted[game.Action.Rock][game.Action.Lizard] == 0.5
+    with pytest.raises(ValueError):
+        solver.payoff_matrix(weights={("scissors", "spock"): 2})
+    with pytest.raises(ValueError):
+        solver.payoff_matrix(weights={("spock", "scissors"): 0})
+
+
+@pytest.mark.parametrize("name", ["rpsls", "rps7", "rps101"])
+def test_uniform_is_the_equilibrium_of_unweighted_variants(name, backend):
+    ruleset = rules.load_ruleset(name)
+    equilibrium = solver.nash_equilibrium(solver.payoff_matrix(ruleset))
+    assert equilibrium.value == pytest.approx(0, abs=1e-9) and equilibrium.gap < 1e-9
+    assert equilibrium.strategy == pytest.approx([1 / len(ruleset)] * len(ruleset))
+
+
+def test_weighted_equilibrium_and_its_value(backend):
+    matrix = solver.payoff_matrix(weights={("spock", "scissors"): 2, ("rock", "lizard"): 3})
+    equilibrium = solver.nash_equilibrium(matrix)
+    assert equilibrium.strategy == pytest.approx([0.125, 0.375, 0.1875, 0.125, 0.1875])
+    assert equilibrium.value == pytest.approx(0, abs=1e-9)
+    assert solver.exploitability(matrix, equilibrium.strategy) < 1e-9
+    assert solver.exploitability(matrix, [0.2] * 5) > 0.1
+
+
+def test_rectangular_games_match_between_backends(monkeypatch):
+    rng = random.Random(3)
+    matrix = [[rng.uniform(-5, 5) for _ in range(7)] for _ in range(4)]
+    exact = solver.nash_equilibrium(matrix)
+    assert exact.gap < 1e-9 and len(exact.strategy) == 4 and len(exact.opponent_strategy) == 7
+    monkeypatch.setattr(simulation, "np", None)
+    assert solver.nash_equilibrium(matrix).value == pytest.approx(exact.value)
+
+
+def test_fictitious_play_converges(backend):
+    matrix = solver.payoff_matrix(weights={("spock", "scissors"): 2})
+    exact = solver.nash_equilibrium(matrix)
+    approximate = solver.nash_equilibrium(matrix, "fictitious", iterations=20_000)
+    assert approximate.gap < 0.02
+    assert approximate.strategy == pytest.approx(exact.strategy, abs=0.02)
+    with pytest.raises(ValueError):
+        solver.nash_equilibrium(matrix, "guess")
+
+
+def test_best_response_to_an_observed_distribution():
+    matrix = solver.payoff_matrix()
+    response = solver.best_response(matrix, [10, 0, 0, 0, 0])  # Counts of an all-rock player.
+    assert sorted(response.moves) == [game.Action.Paper, game.Action.Spock] and response.value == 1
+    assert solver.best_response(matrix, [1] * 5).moves == list(range(5))
+    with pytest.raises(ValueError):
+        solver.best_response(matrix, [1, 2])
+
+
+def test_best_response_strategy_exploits_a_constant_opponent():
+    tally = simulation.simulate(2000, solver.BestResponseStrategy(), ConstantStrategy(game.Action.Lizard), seed=1)
+    assert tally.wins > 1900
+
+
+def test_cli_solve(capsys):
+    game.cli(["solve", "rps15", "--against", ",".join(["1"] * 14 + ["9"])])
+    out = capsys.readouterr().out
+    assert "RPS-15: Nash equilibrium by simplex" in out and "Best response:" in out
+    with pytest.raises(SystemExit):
+        game.cli(["solve", "--weight", "spock-scissors"])
@@ -0,0 +1,58 @@
+# test_streaming.py
+import io
+import json
+
+import pytest
+
+import rockPaperScissorsLizardSpock as game
+import streaming
+import strategies
+
+
+def test_read_lines_accepts_numbers_names_and_pairs():
+    lines = ["# recorded session", "", "4", "rock scissors", "Paper,1"]
+    assert list(streaming.read_lines(lines)) == [(4, None), (0, 2), (1, 1)]
+    with pytest.raises(ValueError, match="line 2"):
+        list(streaming.read_lines(["rock", "rock paper scissors"]))
+
+
+def test_packed_round_trip():
+    rounds = [(user, computer) for user in range(5) for computer in range(5)]
+    packed = streaming.pack_rounds(rounds)
+    assert list(streaming.read_packed(io.BytesIO(packed), chunk_size=7)) == rounds
+    with pytest.raises(ValueError, match="byte 1"):
+        list(streaming.read_packed(io.BytesIO(bytes([0, 25]))))
+
+
+def test_jsonl_output_matches_resolve():
+    out = io.StringIO()
+    rounds = [(4, 2), (0, 1), (3, 3)]
+    tally = streaming.write_results(streaming.resolve_rounds(rounds), out)
+    assert tally == (1, 1, 1)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [record["round"] for record in records] == [1, 2, 3]
+    for record, (user, computer) in zip(records, rounds):
+        outcome, explanation = game.resolve(user, computer)
+        assert record["outcome"] == outcome.name.lower()
+        assert record["explanation"] == explanation
+        assert record["user"] == game.Action(user).name
+
+
+def test_csv_output_and_opponent_fills_missing_moves():
+    out = io.StringIO()
+    rounds = streaming.play(streaming.read_lines(["rock", "spock"]), strategies.ConstantStrategy(game.Action.Scissors))
+    streaming.write_results(streaming.resolve_rounds(rounds), out, "csv")
+    assert out.getvalue().splitlines() == [
+        "round,user,computer,outcome,explanation",
+        "1,Rock,Scissors,win,Rock crushes scissors",
+        "2,Spock,Scissors,win,Spock smashes scissors",
+    ]
+
+
+def test_cli_stream_from_file(tmp_path, capsys):
+    log = tmp_path / "session.bin"
+    log.write_bytes(streaming.pack_rounds([(0, 2), (2, 0)]))
+    game.cli(["stream", "--packed", str(log), "-f", "csv"])
+    captured = capsys.readouterr()
+    assert "2,Scissors,Rock,loss,Rock crushes scissors" in captured.out
+    assert "Wins: 1 | Losses: 1 | Ties: 0" in captured.err
@@ -0,0 +1,43 @@
+# test_tournament.py
+import pytest
+
+import rockPaperScissorsLizardSpock as game
+import tournament
+
+
+def test_results_do_not_depend_on_worker_count():
+    names = ["uniform", "cycle", "rock", "paper"]
+    serial = tournament.tournament(names, 5_000, seed=11, workers=1, shard_size=1_000)
+    parallel = tournament.tournament(names, 5_000, seed=11, workers=2, shard_size=1_000)
+    assert serial == parallel
+    assert len(serial) == 6
+    assert all(sum(tally) == 5_000 for tally in serial.values())
+
+
+def test_standings_rank_by_score():
+    results = tournament.tournament(["rock", "paper", "scissors"], 100, workers=1)
+    table = tournament.standings(results)
+    # Everyone beats one opponent and loses to the other.
+    assert [row.score for row in table] == [0.5, 0.5, 0.5]
+    results = tournament.tournament(["rock", "scissors", "lizard"], 100, workers=1)
+    table = tournament.standings(results)
+    assert table[0].name == "rock" and table[0].wins == 200
+    assert table[-1].name == "lizard" and table[-1].losses == 200
+
+
+def test_plugin_strategies_and_validation():
+    results = tournament.tournament(["strategies:CycleStrategy", "spock"], 10, workers=1)
+    assert sum(results[("strategies:CycleStrategy", "spock")]) == 10
+    with pytest.raises(ValueError):
+        tournament.tournament(["rock"], 10)
+    with pytest.raises(ValueError):
+        tournament.tournament(["rock", "rock"], 10)
+    with pytest.raises(ValueError):
+        tournament.tournament(["rock", "no_such_module:Bot"], 10)
+
+
+def test_cli_tournament(capsys):
+    game.cli(["tournament", "rock", "scissors", "-n", "1000", "-j", "1"])
+    out = capsys.readouterr().out
+    assert "TOURNAMENT STANDINGS" in out
+    assert "rock" in out and "scissors" in out
@@ -0,0 +1,122 @@
+# test_tui.py
+import random
+
+import pytest
+
+import replay
+import rockPaperScissorsLizardSpock as game
+import tui
+import timing
+from strategies import make_strategy
+from timing import Clock
+
+
+def test_cells_of_wide_and_combining_characters():
+    assert tui.to_cells("ab", 4) == ["a", "b", " ", " "]
+    assert tui.to_cells("🤖x", 4) == ["🤖", "", "x", " "]
+    assert tui.to_cells("⚔️!", 4) == ["⚔️", "", "!", " "]
+    assert tui.to_cells("e\u0301", 2) == ["e\u0301", " "]  # A combining accent.
+    assert tui.to_cells("a🤖", 2) == ["a", " "]  # A wide character never straddles the edge.
+    assert tui.display_width("🤖 ⚔️ x") == 7
+
+
+def test_renderer_rewrites_only_what_changed():
+    written = []
+    renderer = tui.Renderer(written.append, 20, 3)
+    assert renderer.draw(["hello", "world"]) > 0
+    assert renderer.draw(["hello", "world"]) == 0
+    renderer.draw(["hello", "wOrld"])
+    assert written[-1] == "\x1b[2;2HO"
+    renderer.draw(["jello", "wOrld", "🤖"])
+    assert written[-1] == "\x1b[1;1Hj\x1b[3;1H🤖"
+    assert renderer.frames == 3
+
+    renderer.resize(10, 2)
+    renderer.draw(["jello"])
+    assert written[-1].startswith("\x1b[1;1Hjello")
+
+
+def _ui(seed=1, speed=1.0, **kwargs):
+    opponent = make_strategy("uniform")
+    opponent.reset(seed)
+    return tui.GameUI(opponent, Clock(speed), random.Random(f"{seed}/flavor"), **kwargs)
+
+
+def test_round_animates_over_time():
+    ui = _ui()
+    assert not ui.animating(0.0)
+    assert "Choose your move" in "\n".join(ui.frame(0.0))
+
+    ui.press("k", 10.0)
+    assert ui.round[0] == game.Action.Spock and ui.animating(10.0)
+    assert "**Rock**" in "\n".join(ui.frame(10.1)) and "**Paper**" not in "\n".join(ui.frame(10.1))
+    assert "SHOOT" in "\n".join(ui.frame(10.0 + 3.2))
+    assert "COMPUTER CHOSE: ..." in "\n".join(ui.frame(10.0 + tui.COUNTDOWN_TIME + 0.1))
+    computer = ui.round[1].name.upper()
+    assert f"COMPUTER CHOSE: {computer}" in "\n".join(ui.frame(10.0 + tui.COUNTDOWN_TIME + 0.9))
+    assert sum((ui.wins, ui.losses, ui.ties)) == 0
+
+    done = 10.0 + tui.ROUND_TIME
+    ui.update(done)
+    assert not ui.animating(done) and sum((ui.wins, ui.losses, ui.ties)) == 1
+    assert "Choose your next move" in "\n".join(ui.frame(done))
+
+
+def test_keys_during_an_animation_are_queued_or_skip_it():
+    ui = _ui(speed=2.0)
+    ui.press("0", 0.0)
+    ui.press("4", 0.5)
+    assert ui.pending == game.Action.Spock and ui.round[0] == game.Action.Rock
+    ui.press(" ", 0.6)  # Skips to the result, the queued move follows.
+    assert sum((ui.wins, ui.losses, ui.ties)) == 1
+    ui.update(0.6 + tui.REVEAL_STEP / 2)
+    assert ui.round[0] == game.Action.Spock and ui.pending is None
+    ui.press("q", 1.0)
+    assert ui.done
+
+
+def test_fast_clock_shows_results_at_once():
+    ui = _ui(speed=float("inf"))
+    for key in "0123":
+        ui.press(key, 0.0)
+    assert sum((ui.wins, ui.losses, ui.ties)) == 4 and not ui.animating(0.0)
+
+
+def test_sessions_replay_like_the_text_game(tmp_path, capsys, monkeypatch):
+    # The TUI draws taunts and quotes in the order main() does, so its
+    # recordings replay through the text game with the same flavor text.
+    monkeypatch.setattr(timing.time, "sleep", lambda *_args: None)
+    path = tmp_path / "session.rec"
+    with replay.SessionRecorder(path, seed=5, countdown=False) as recorder:
+        ui = _ui(seed=5, speed=float("inf"), recorder=recorder)
+        quotes = []
+        for key in "02k":
+            ui.press(key, 0.0)
+            quotes.append(ui.round[4])
+        ui.press("q", 0.0)
+    replay.replay_session(replay.read_recording(path))
+    out = capsys.readouterr().out
+    assert all(quote in out for quote in quotes) and ui.taunt in out
+
+
+def test_decode_keys_drops_escape_sequences():
+    assert tui.decode_keys(b"r\x1b[A\x1bOBk") == ["r", "k"]
+    assert tui.decode_keys(b"\x1b") == ["q"]
+    assert tui.decode_keys(b"")[0] in tui.QUIT_KEYS  # End of input.
+
+
+def test_run_loop_draws_diffs_and_exits():
+    ui = _ui()
+    written = []
+    renderer = tui.Renderer(written.append, 80, 30)
+    keys = iter([["1"], [], [], ["q"]])
+    times = iter(range(1000))
+    tui.run_loop(ui, renderer, lambda timeout: next(keys), lambda: (80, 30), now=lambda: next(times) / 10)
+    assert ui.done and renderer.frames >= 2
+    assert sum(len(text) for text in written[1:]) < len(written[0])
+
+
+def test_play_needs_a_terminal(monkeypatch):
+    monkeypatch.setattr("sys.stdin.isatty", lambda: False, raising=False)
+    with pytest.raises(RuntimeError):
+        tui.Terminal()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/timing.py
+"""Dramatic pauses for Rock-Paper-Scissors-Lizard-Spock.
+
+Every pause in the game goes through a Clock, so a whole session can be
+sped up, slowed down or run without any waiting by handing the game a
+different clock instead of patching ``time.sleep`` or ``delayA``.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import math
+import os
+import time
+
+# Environment variable holding the default game speed, e.g. "2" or "max".
+SPEED_ENVIRONMENT_VARIABLE = "RPSLS_SPEED"
+
+
+def parseSpeed(text):
+    """Parses a speed such as "2", "0.5", "max" or "inf".
+
+    Args:
+        text (str): The speed multiplier; "max" or "inf" mean no delay.
+
+    Returns:
+        float: The speed, ``math.inf`` for no delay at all.
+
+    Raises:
+        ValueError: If the text is not a positive number.
+    """
+    text = text.strip().lower()
+    if text in ("max", "inf", "infinity"):
+        return math.inf
+    speed = float(text)
+    if not speed > 0:
+        raise ValueError(f"Speed must be positive, got {text!r}")
+    return speed
+
+
+def speedFromEnvironment(default=1.0):
+    """Returns the speed set in ``RPSLS_SPEED``, or ``default`` if unset."""
+    text = os.environ.get(SPEED_ENVIRONMENT_VARIABLE, "")
+    return parseSpeed(text) if text.strip() else default
+
+
+class Clock:
+    """Waits for the game's pauses, scaled by a speed multiplier.
+
+    Args:
+        speed (float): 2 plays twice as fast, 0.5 half as fast and
+            ``math.inf`` does not wait at all ("fast mode", which also
+            skips the animations).
+        sleep (callable): Function that waits a number of seconds;
+            ``time.sleep`` by default.
+    """
+
+    def __init__(self, speed=1.0, sleep=None):
+        if not speed > 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._sleep = sleep
+
+    @property
+    def fast(self):
+        """bool: True if the clock never waits and animations are skipped."""
+        return self.speed == math.inf
+
+    def pause(self, seconds):
+        """Waits ``seconds`` divided by the speed.
+
+        Args:
+            seconds (float): The pause at normal speed.
+        """
+        if seconds <= 0 or self.fast:
+            return
+        sleep = self._sleep if self._sleep is not None else time.sleep
+        sleep(seconds / self.speed)
+
+    def __repr__(self):
+        return f"Clock(speed={self.speed})"
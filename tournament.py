@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/tournament.py
+"""Round-robin tournaments between computer strategies.
+
+Every pair of strategies plays a match, and every match is split into
+shards of rounds that are farmed out to a ``ProcessPoolExecutor``. Each
+shard gets its own seed derived from the tournament seed, the two
+strategy names and the shard number, so a tournament produces the same
+standings for a given seed no matter how many workers play it.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import itertools
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from simulation import Tally, simulate
+from strategies import make_strategy, strategy_names
+
+Standing = namedtuple("Standing", ["name", "wins", "losses", "ties", "score"])
+Standing.__doc__ = "One row of the standings table; score counts a tie as half a win."
+
+SHARD_SIZE = 1_000_000
+
+
+def _shard_seed(seed, name_a, name_b, shard):
+    """Derives the seed of one shard independently of how shards are scheduled."""
+    return random.Random(f"{seed}/{name_a}/{name_b}/{shard}").getrandbits(64)
+
+
+def _play_shard(name_a, name_b, rounds, seed):
+    """Plays one shard of a match; runs inside a worker process.
+
+    The global ``random`` module is reseeded as well, so plug-in strategies
+    that use it instead of their own ``rng`` are just as reproducible.
+    """
+    random.seed(seed)
+    return simulate(rounds, make_strategy(name_a), make_strategy(name_b), seed=seed)
+
+
+def _shards(names, rounds, seed, shard_size):
+    """Yields ``(name_a, name_b, rounds, seed)`` for every shard of every match."""
+    for name_a, name_b in itertools.combinations(names, 2):
+        for shard, start in enumerate(range(0, rounds, shard_size)):
+            yield name_a, name_b, min(shard_size, rounds - start), _shard_seed(seed, name_a, name_b, shard)
+
+
+def tournament(names, rounds, seed=0, workers=None, shard_size=SHARD_SIZE):
+    """Plays a round-robin tournament.
+
+    Args:
+        names (list[str]): Strategy names as accepted by make_strategy().
+        rounds (int): Rounds played by every pair of strategies.
+        seed (int): Tournament seed.
+        workers (int): Worker processes; ``None`` uses every core and ``1``
+            plays in the current process.
+        shard_size (int): Rounds per unit of work handed to a worker.
+            Adaptive strategies start learning afresh in every shard.
+
+    Returns:
+        dict: Tally of every match keyed by ``(name_a, name_b)``, from the
+            point of view of ``name_a``.
+
+    Raises:
+        ValueError: If fewer than two strategies, or duplicates, are given.
+    """
+    if len(names) < 2:
+        raise ValueError("A tournament needs at least two strategies")
+    if len(set(names)) != len(names):
+        raise ValueError("Strategy names must be unique")
+    for name in names:
+        make_strategy(name)  # Fail fast, before any worker starts.
+
+    shards = list(_shards(names, rounds, seed, shard_size))
+    if workers == 1:
+        tallies = [_play_shard(*shard) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tallies = list(executor.map(_play_shard, *zip(*shards))) if shards else []
+
+    results = {pair: Tally(0, 0, 0) for pair in itertools.combinations(names, 2)}
+    for (name_a, name_b, _, _), tally in zip(shards, tallies):
+        total = results[(name_a, name_b)]
+        results[(name_a, name_b)] = Tally(*(x + y for x, y in zip(total, tally)))
+    return results
+
+
+def standings(results):
+    """Turns match results into a standings table.
+
+    Args:
+        results (dict): The return value of tournament().
+
+    Returns:
+        list[Standing]: One row per strategy, best score first.
+    """
+    totals = {}
+    for (name_a, name_b), tally in results.items():
+        for name, wins, losses in ((name_a, tally.wins, tally.losses), (name_b, tally.losses, tally.wins)):
+            row = totals.setdefault(name, [0, 0, 0])
+            row[0] += wins
+            row[1] += losses
+            row[2] += tally.ties
+    table = []
+    for name, (wins, losses, ties) in totals.items():
+        played = wins + losses + ties
+        score = (wins + ties / 2) / played if played else 0.0
+        table.append(Standing(name, wins, losses, ties, score))
+    table.sort(key=lambda row: (-row.score, row.name))
+    return table
+
+
+def add_arguments(parser):
+    """Adds the ``rpsls tournament`` options to an argument parser."""
+    parser.add_argument("strategies", nargs="*",
+                        help="strategies to enter, or package.module:ClassName plug-ins "
+                             f"(default: {', '.join(strategy_names())})")
+    parser.add_argument("-n", "--rounds", type=int, default=1_000_000,
+                        help="rounds per match (default: 1,000,000)")
+    parser.add_argument("--seed", type=int, default=0, help="tournament seed (default: 0)")
+    parser.add_argument("-j", "--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE,
+                        help=f"rounds per unit of work (default: {SHARD_SIZE:,})")
+
+
+def run(args):
+    """Runs ``rpsls tournament`` and prints the standings table."""
+    names = args.strategies or strategy_names()
+    start = time.perf_counter()
+    results = tournament(names, args.rounds, seed=args.seed, workers=args.workers,
+                         shard_size=args.shard_size)
+    elapsed = time.perf_counter() - start
+    total_rounds = args.rounds * len(results)
+
+    print(f"\n{'═' * 70}")
+    print(f"🏆 TOURNAMENT STANDINGS ({len(names)} strategies, {args.rounds:,} rounds per match)")
+    print(f"{'═' * 70}")
+    print(f"{'#':>3}  {'Strategy':<24}{'Wins':>12}{'Losses':>12}{'Ties':>12}{'Score':>8}")
+    print(f"{'─' * 70}")
+    for place, row in enumerate(standings(results), start=1):
+        print(f"{place:>3}  {row.name:<24}{row.wins:>12}{row.losses:>12}{row.ties:>12}{row.score:>8.4f}")
+    print(f"{'─' * 70}")
+    print(f"⏱️  {total_rounds:,} rounds in {elapsed:.2f}s\n")
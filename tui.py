@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+# Rock-Paper-Scissors-Lizard-Spock/tui.py
+"""Full-screen terminal interface for Rock-Paper-Scissors-Lizard-Spock.
+
+``rpsls --tui`` plays the game on the alternate screen instead of printing
+line after line. It is built from three parts:
+
+* ``Renderer`` keeps two buffers of terminal cells: what is on the screen
+  and the frame being drawn. Drawing a frame compares them and rewrites
+  only the cells that changed, so an animation costs a few bytes per
+  frame, which keeps it smooth over SSH.
+* ``GameUI`` is the game as a state machine over time: the countdown, the
+  reveal of both moves and the battle scene are frames computed from the
+  time since the round started, never ``time.sleep``.
+* play() is the event loop. It waits on stdin with a timeout, so keys are
+  handled the moment they are pressed, even in the middle of an animation,
+  redraws at most ``fps`` times a second while something moves, and
+  sleeps until the next key press when nothing does.
+
+Keys: ``0``-``4`` or ``r p s l k`` pick a move (during an animation the
+move is queued for the next round), space or enter skip the animation and
+``q`` quits.
+
+Author: @seanl
+Version: 1.0.0
+Creation Date: 10/18/2026
+"""
+
+import os
+import random
+import selectors
+import shutil
+import sys
+import time
+import unicodedata
+
+try:
+    import termios
+    import tty
+except ImportError:  # Not a POSIX terminal, play() reports it.
+    termios = tty = None
+
+import profiling
+import rockPaperScissorsLizardSpock as game
+from rockPaperScissorsLizardSpock import Action, Outcome
+from timing import Clock
+
+FPS = 30
+
+# Seconds of each part of a round at speed 1, before scaling by delayA,
+# matching countDown() and determineWinner().
+COUNTDOWN_STEP = 0.6
+SHOOT_PAUSE = 0.5
+REVEAL_STEP = 0.8
+COUNTDOWN_TIME = 5 * COUNTDOWN_STEP + SHOOT_PAUSE
+ROUND_TIME = COUNTDOWN_TIME + 2 * REVEAL_STEP
+
+COUNTDOWN_ITEMS = ("**Rock**", "**Paper**", "**Scissors**", "**Lizard**", "**Spock**", "💥 SHOOT! 💥")
+
+MOVE_KEYS = {str(int(action)): action for action in Action}
+MOVE_KEYS.update({"r": Action.Rock, "p": Action.Paper, "s": Action.Scissors, "l": Action.Lizard,
+                  "k": Action.Spock})
+QUIT_KEYS = ("q", "Q", "\x03", "\x04")
+# Emoji variation selector, asking for the colourful two-cell form of a symbol.
+VARIATION_SELECTOR = "\ufe0f"
+SKIP_KEYS = (" ", "\r", "\n")
+
+# Eighths of a block, for progress bars that move smoothly between cells.
+_BAR_PARTS = " ▏▎▍▌▋▊▉"
+
+# Escape sequences for the alternate screen and the cursor.
+ENTER_SCREEN = "\x1b[?1049h\x1b[?25l\x1b[2J"
+LEAVE_SCREEN = "\x1b[?25h\x1b[?1049l"
+
+
+def char_width(char):
+    """Returns the number of terminal cells a character takes: 0, 1 or 2."""
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def to_cells(line, width):
+    """Splits a line into exactly ``width`` terminal cells.
+
+    A wide character takes its cell and an empty continuation cell,
+    zero-width characters stick to the character before them, and an emoji
+    variation selector widens a narrow character. The line is clipped or
+    padded with spaces.
+
+    Returns:
+        list[str]: One string per cell, "" for continuations.
+    """
+    cells = []
+    for char in line:
+        if char == VARIATION_SELECTOR and cells:
+            # Emoji presentation: the symbol before it now takes two cells.
+            if cells[-1] != "" and len(cells) < width:
+                cells[-1] += char
+                cells.append("")
+            elif cells[-1] == "":
+                cells[-2] += char
+            else:
+                cells[-1] += char
+            continue
+        size = char_width(char)
+        if size == 0:
+            if cells:
+                cells[-1 if cells[-1] else -2] += char
+            continue
+        if len(cells) + size > width:
+            break
+        cells.append(char)
+        if size == 2:
+            cells.append("")
+    cells += [" "] * (width - len(cells))
+    return cells
+
+
+def display_width(text):
+    """Returns the number of terminal cells a line of text takes."""
+    # An emoji variation selector widens the narrow symbol before it.
+    return sum(1 if char == VARIATION_SELECTOR else char_width(char) for char in text)
+
+
+class Renderer:
+    """Double-buffered, diff-based drawing of frames on a terminal.
+
+    Args:
+        write (callable): Writes a string to the terminal.
+        width (int): Columns of the terminal.
+        height (int): Rows of the terminal.
+    """
+
+    def __init__(self, write, width, height):
+        self.write = write
+        self.frames = 0
+        self.bytes_written = 0
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        """Adapts to a new terminal size; the next frame is drawn in full."""
+        self.width = width
+        self.height = height
+        self.front = [[None] * width for _ in range(height)]  # None: unknown, so always redrawn
+
+    def diff(self, lines):
+        """Returns the escape sequences turning the screen into ``lines``.
+
+        The back buffer is built from ``lines``, compared with the front
+        buffer cell by cell, and becomes the new front buffer.
+
+        Args:
+            lines (list[str]): The frame; rows beyond it are blank.
+
+        Returns:
+            str: Cursor moves and the text of every changed run of cells.
+        """
+        out = []
+        blank = [" "] * self.width
+        for row in range(self.height):
+            back = to_cells(lines[row], self.width) if row < len(lines) else blank
+            front = self.front[row]
+            if back == front:
+                continue
+            column = 0
+            while column < self.width:
+                if back[column] == front[column]:
+                    column += 1
+                    continue
+                start = column
+                # A run ends after two unchanged cells: shorter gaps are
+                # cheaper to rewrite than to skip with a cursor move.
+                while column < self.width and (back[column] != front[column]
+                                                or back[column + 1:column + 3] != front[column + 1:column + 3]):
+                    column += 1
+                if back[start] == "" and start:
+                    start -= 1  # Never start in the middle of a wide character.
+                if column < self.width and back[column] == "":
+                    column += 1
+                out.append(f"\x1b[{row + 1};{start + 1}H{''.join(back[start:column])}")
+            self.front[row] = back
+        return "".join(out)
+
+    def draw(self, lines):
+        """Draws a frame, writing only what changed.
+
+        Returns:
+            int: Characters written; 0 when the frame did not change.
+        """
+        text = self.diff(lines)
+        if text:
+            self.write(text)
+            self.frames += 1
+            self.bytes_written += len(text)
+        return len(text)
+
+
+def _progress(fraction, width=40):
+    """Renders a progress bar in eighths of a cell."""
+    eighths = int(max(0.0, min(1.0, fraction)) * width * 8)
+    full, part = divmod(eighths, 8)
+    bar = "█" * full + (_BAR_PARTS[part] if full < width else "")
+    return f"▕{bar.ljust(width)}▏"
+
+
+def _side_by_side(left, right, column=36):
+    """Puts two blocks of lines next to each other."""
+    rows = max(len(left), len(right))
+    left = left + [""] * (rows - len(left))
+    right = right + [""] * (rows - len(right))
+    return [f"{a}{' ' * max(1, column - display_width(a))}{b}" for a, b in zip(left, right)]
+
+
+def _art(text):
+    """Splits art into lines, dropping the blank first and last lines."""
+    return text.strip("\n").splitlines()
+
+
+class GameUI:
+    """The game as a state machine driven by key presses and time.
+
+    Args:
+        opponent (Strategy): Picks the computer's moves.
+        clock (Clock): Its speed scales the animations; a fast clock skips them.
+        rng (random.Random): Picks taunts and quotes, like main()'s ``rng``.
+        history (HistoryStore): Optional store every round is appended to.
+        recorder (SessionRecorder): Optional recorder, as for main().
+        events (EventBus): Optional bus every round is published on.
+    """
+
+    def __init__(self, opponent, clock=None, rng=None, history=None, recorder=None, events=None):
+        self.opponent = opponent
+        self.clock = clock if clock is not None else game.gameClock
+        self.rng = rng if rng is not None else random
+        self.history = history
+        self.recorder = recorder
+        self.events = events
+        self.wins = self.losses = self.ties = 0
+        self.round = None
+        self.started = 0.0
+        self.counted = False
+        self.pending = None
+        self.done = False
+        self.taunt = self.rng.choice(game.computer_taunts)
+
+    @property
+    def scale(self):
+        """float: Seconds per unit of the round's timeline; 0 when fast."""
+        return 0.0 if self.clock.fast else game.delayA / self.clock.speed
+
+    def start_round(self, userAction, now):
+        """Plays a round; its outcome is then revealed over time."""
+        computerAction = game.getComputerSelection(self.opponent)
+        outcome, explanation = game.resolve(userAction, computerAction)
+        quote = self.rng.choice(game._outcomeQuotes[outcome])
+        self.opponent.observe(computerAction, userAction)
+        if self.history is not None:
+            self.history.append(userAction, computerAction)
+        if self.recorder is not None:
+            self.recorder.append(userAction, computerAction)
+        if self.events is not None:
+            self.events.publish(userAction, computerAction)
+        self.round = (userAction, computerAction, outcome, explanation, quote)
+        self.started = now
+        self.counted = False
+
+    def elapsed(self, now):
+        """Returns the time since the round started, in timeline units."""
+        scale = self.scale
+        return float("inf") if not scale else (now - self.started) / scale
+
+    def press(self, key, now):
+        """Handles one key press."""
+        self.update(now)
+        if key in QUIT_KEYS:
+            if self.recorder is not None and self.round is not None:
+                self.recorder.finish()
+            if self.events is not None:
+                self.events.flush()
+            self.done = True
+        elif key in MOVE_KEYS:
+            if self.round is None or self.elapsed(now) >= ROUND_TIME:
+                self.start_round(MOVE_KEYS[key], now)
+            else:
+                self.pending = MOVE_KEYS[key]  # Played as soon as this round is shown.
+        elif key in SKIP_KEYS and self.round is not None:
+            self.started = min(self.started, now - ROUND_TIME * self.scale)
+        self.update(now)
+
+    def update(self, now):
+        """Advances the timeline: scores the revealed round, plays a queued move."""
+        if self.round is None or self.elapsed(now) < ROUND_TIME:
+            return
+        if not self.counted:
+            self.counted = True
+            outcome = self.round[2]
+            if outcome == Outcome.Tie:
+                self.ties += 1
+            elif outcome == Outcome.Win:
+                self.wins += 1
+            else:
+                self.losses += 1
+            self.taunt = self.rng.choice(game.computer_taunts)
+        if self.pending is not None and self.elapsed(now) >= ROUND_TIME + REVEAL_STEP:
+            move, self.pending = self.pending, None
+            self.start_round(move, now)
+
+    def animating(self, now):
+        """Whether frames change with time alone, without a key press."""
+        if self.round is None:
+            return False
+        elapsed = self.elapsed(now)
+        return elapsed < ROUND_TIME or (self.pending is not None and elapsed < ROUND_TIME + REVEAL_STEP)
+
+    def frame(self, now, width=80):
+        """Renders the screen at time ``now``.
+
+        Returns:
+            list[str]: The lines of the frame.
+        """
+        rule = min(width, 70)
+        score = f"Wins: {self.wins} | Losses: {self.losses} | Ties: {self.ties}"
+        lines = [f"🖖 ROCK-PAPER-SCISSORS-LIZARD-SPOCK   📊 {score}", "═" * rule]
+        elapsed = self.elapsed(now) if self.round is not None else None
+        if self.round is None:
+            lines += _art(game.loadArt().GAME_TITLE) + ["", f"🎮 {self.taunt}", "", "👉 Choose your move!"]
+        elif elapsed < COUNTDOWN_TIME:
+            shown = min(int(elapsed / COUNTDOWN_STEP) + 1, len(COUNTDOWN_ITEMS))
+            lines += [""] + [f"   {item}" for item in COUNTDOWN_ITEMS[:shown]]
+            lines += [""] * (len(COUNTDOWN_ITEMS) - shown) + ["", _progress(elapsed / ROUND_TIME)]
+        elif elapsed < ROUND_TIME:
+            userAction, computerAction = self.round[:2]
+            revealed = elapsed >= COUNTDOWN_TIME + REVEAL_STEP
+            right = ([f"🤖 COMPUTER CHOSE: {computerAction.name.upper()}", ""] + _art(game.actionArt(computerAction))
+                     if revealed else ["🤖 COMPUTER CHOSE: ...", ""])
+            lines += [""] + _side_by_side([f"🧑 YOU CHOSE: {userAction.name.upper()}", ""]
+                                          + _art(game.actionArt(userAction)), right)
+            lines += ["", _progress(elapsed / ROUND_TIME)]
+        else:
+            lines += self._result_lines()
+        lines += ["─" * rule, "[0-4] or [r p s l k] move   [space] skip   [q] quit"]
+        return lines
+
+    def _result_lines(self):
+        userAction, computerAction, outcome, explanation, quote = self.round
+        if outcome == Outcome.Tie:
+            lines = _art(game.loadArt().TIE_SCENE) + ["", f"Both players selected {userAction.name}. It's a tie!"]
+        else:
+            winner, loser = (userAction, computerAction) if outcome == Outcome.Win else (computerAction, userAction)
+            scene = _art(game.loadArt().BATTLE_SCENES.get((winner, loser), ""))
+            if outcome == Outcome.Win:
+                lines = scene + ["", f"⚔️  {explanation.upper()}! ⚔️",
+                                 f"🎯 {userAction.name} beats {computerAction.name}! YOU WIN! 🎯"]
+            else:
+                lines = scene + ["", f"💥 {explanation.upper()}! 💥",
+                                 f"😢 {computerAction.name} beats {userAction.name}! YOU LOSE! 😢"]
+        return lines + [quote, "", f"🎮 {self.taunt}", "👉 Choose your next move!"]
+
+
+def decode_keys(data):
+    """Splits bytes read from the terminal into keys, dropping escape sequences.
+
+    An empty read means the input has ended, which quits like Ctrl-D.
+    """
+    if not data:
+        return ["\x04"]
+    text = data.decode("utf-8", errors="ignore")
+    keys = []
+    index = 0
+    while index < len(text):
+        if text[index] == "\x1b":
+            # Arrow keys and friends: ESC [ ... final byte. A lone ESC quits.
+            if index + 1 < len(text) and text[index + 1] in "[O":
+                index += 2
+                while index < len(text) and not text[index].isalpha() and text[index] != "~":
+                    index += 1
+                index += 1
+                continue
+            keys.append("q")
+        else:
+            keys.append(text[index])
+        index += 1
+    return keys
+
+
+class Terminal:
+    """Puts the terminal in cbreak mode on the alternate screen, and back.
+
+    Raises:
+        RuntimeError: Unless stdin and stdout are a POSIX terminal.
+    """
+
+    def __init__(self, stdin=None, stdout=None):
+        self.stdin = stdin if stdin is not None else sys.stdin
+        self.stdout = stdout if stdout is not None else sys.stdout
+        if termios is None or not self.stdin.isatty() or not self.stdout.isatty():
+            raise RuntimeError("the terminal interface needs an interactive POSIX terminal")
+        self.fd = self.stdin.fileno()
+        self._saved = None
+
+    def write(self, text):
+        self.stdout.write(text)
+        self.stdout.flush()
+
+    def size(self):
+        """Returns the terminal's columns and rows."""
+        return shutil.get_terminal_size()
+
+    def __enter__(self):
+        self._saved = termios.tcgetattr(self.fd)
+        tty.setcbreak(self.fd)
+        self.write(ENTER_SCREEN)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.write(LEAVE_SCREEN)
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved)
+
+
+def run_loop(ui, renderer, read_keys, size, fps=FPS, now=time.monotonic):
+    """The event loop: draws frames and feeds keys to the UI until it is done.
+
+    Args:
+        ui (GameUI): The game.
+        renderer (Renderer): Draws the frames.
+        read_keys (callable): Waits at most the given seconds (forever for
+            None) for input and returns the keys pressed, maybe none.
+        size (callable): Returns the terminal's columns and rows.
+        fps (int): Most frames drawn per second while animating.
+        now (callable): The monotonic time.
+    """
+    interval = 1.0 / fps
+    while not ui.done:
+        frame_start = now()
+        columns, rows = size()
+        if (columns, rows) != (renderer.width, renderer.height):
+            renderer.write("\x1b[2J")
+            renderer.resize(columns, rows)
+        renderer.draw(ui.frame(frame_start, columns))
+        # Idle: wake up for keys, or now and then to notice a resize.
+        timeout = max(0.0, frame_start + interval - now()) if ui.animating(frame_start) else 0.5
+        for key in read_keys(timeout):
+            ui.press(key, now())
+            if ui.done:
+                break
+        ui.update(now())
+
+
+def play(opponent=None, clock=None, history=None, rng=None, recorder=None, events=None, fps=FPS):
+    """Plays the game in the terminal interface, see the module docstring.
+
+    Takes the same arguments as main(), plus the frame rate.
+
+    Raises:
+        RuntimeError: Unless stdin and stdout are a POSIX terminal.
+    """
+    if opponent is None:
+        from strategies import UniformStrategy
+        opponent = UniformStrategy()
+    terminal = Terminal()
+    selector = selectors.DefaultSelector()
+    selector.register(terminal.fd, selectors.EVENT_READ)
+
+    def read_keys(timeout):
+        if not selector.select(timeout):
+            return []
+        return decode_keys(os.read(terminal.fd, 1024))
+
+    ui = GameUI(opponent, clock if clock is not None else Clock(), rng, history, recorder, events)
+    with terminal:
+        columns, rows = terminal.size()
+        renderer = Renderer(terminal.write, columns, rows)
+        run_loop(ui, renderer, read_keys, terminal.size, fps)
+    selector.close()
+    print(f"🏁 FINAL SCORE: Wins: {ui.wins} | Losses: {ui.losses} | Ties: {ui.ties}")
+    print("🖖 Live long and prosper! (Or at least until the next game)")
+
+
+# rpsls --tui imports this module after --profile has started timing the game.
+profiling.instrument(__name__)